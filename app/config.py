@@ -13,8 +13,27 @@ class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
     DATABASE_URL: str
+    DATABASE_REPLICA_URL: str | None = None
+    DB_REPLICA_STICKY_SECONDS: float = Field(default=5.0, ge=0)
+    DB_POOL_SIZE: int = Field(default=5, ge=1)
+    DB_MAX_OVERFLOW: int = Field(default=5, ge=0)
+    DB_POOL_TIMEOUT_SECONDS: float = Field(default=10.0, gt=0)
+    DB_POOL_RECYCLE_SECONDS: int = Field(default=1800, ge=-1)
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = Field(default=15000, ge=0)
     SECRET_KEY: str
     SESSION_TIMEOUT_MINUTES: int = Field(default=15, ge=1)
+    DASHBOARD_CACHE_TTL_SECONDS: float = Field(default=30.0, ge=0)
+    DASHBOARD_CACHE_MAX_ENTRIES: int = Field(default=1024, ge=1)
+    ADMIN_ROLLUP_OVERLAP_SECONDS: int = Field(default=300, ge=0)
+    NOTIFICATION_POLL_SECONDS: float = Field(default=30.0, gt=0)
+    AUDIT_WRITER_MODE: Literal["async", "sync"] = "async"
+    AUDIT_QUEUE_SIZE: int = Field(default=10000, ge=1)
+    AUDIT_BATCH_SIZE: int = Field(default=200, ge=1)
+    AUDIT_PARTITION_MONTHS_AHEAD: int = Field(default=3, ge=1)
+    AUDIT_RETENTION_MONTHS: int = Field(default=24, ge=1)
+    AUDIT_ARCHIVE_DIR: str = "archive/audit_logs"
+    AUDIT_EXPORT_MAX_ROWS: int = Field(default=100000, ge=1)
     BCRYPT_ROUNDS: int = Field(default=12, ge=4)
     ENVIRONMENT: Literal["development", "staging", "production"] = "development"
     APP_NAME: str = "CareLink"
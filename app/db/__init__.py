@@ -1,6 +1,20 @@
 """Database package exports."""
 
 from app.db.base import Base, TimestampMixin
-from app.db.session import SessionLocal, engine, get_db
+from app.db.session import (
+    SessionLocal,
+    engine,
+    get_db,
+    get_pool_metrics,
+    session_scope,
+)
 
-__all__ = ["Base", "TimestampMixin", "SessionLocal", "engine", "get_db"]
+__all__ = [
+    "Base",
+    "TimestampMixin",
+    "SessionLocal",
+    "engine",
+    "get_db",
+    "get_pool_metrics",
+    "session_scope",
+]
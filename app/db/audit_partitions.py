@@ -0,0 +1,159 @@
+"""Monthly range partitions of the audit_logs table on PostgreSQL.
+
+Migration 008 partitions ``audit_logs`` by month on ``timestamp`` with a
+default partition catching rows for months that have no partition yet.
+:func:`plan_maintenance` decides which months to create and which to
+archive; the other helpers carry the plan out on a connection.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+import re
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import Connection, text
+
+PARENT_TABLE = "audit_logs"
+DEFAULT_PARTITION = "audit_logs_default"
+_PARTITION_NAME = re.compile(r"^audit_logs_y(\d{4})m(\d{2})$")
+
+
+@dataclass(frozen=True)
+class PartitionPlan:
+    """Months to pre-create and partitions to archive."""
+
+    create: list[date]
+    archive: list[str]
+
+
+def add_months(month: date, count: int) -> date:
+    """Return the first day of the month ``count`` months after ``month``."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Return the partition table name for a month."""
+    return f"audit_logs_y{month:%Y}m{month:%m}"
+
+
+def partition_month(name: str) -> date | None:
+    """Return the month a partition covers, or None for other tables."""
+    match = _PARTITION_NAME.match(name)
+    if match is None:
+        return None
+    return date(int(match[1]), int(match[2]), 1)
+
+
+def plan_maintenance(
+    existing: list[str], today: date, months_ahead: int, retain_months: int
+) -> PartitionPlan:
+    """Plan partitions from this month to ``months_ahead`` and archival.
+
+    Partitions whose whole month ended more than ``retain_months`` months
+    before the current month are archived.
+    """
+    current = today.replace(day=1)
+    present = {partition_month(name) for name in existing}
+    create = [
+        month
+        for month in (add_months(current, offset) for offset in range(months_ahead + 1))
+        if month not in present
+    ]
+    cutoff = add_months(current, -retain_months)
+    archive = sorted(
+        name
+        for name in existing
+        if (month := partition_month(name)) is not None and month < cutoff
+    )
+    return PartitionPlan(create=create, archive=archive)
+
+
+def list_partitions(connection: Connection) -> list[str]:
+    """Return the names of the partitions attached to ``audit_logs``."""
+    return list(
+        connection.scalars(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "WHERE parent.relname = :parent ORDER BY child.relname"
+            ),
+            {"parent": PARENT_TABLE},
+        )
+    )
+
+
+def _bounds(month: date) -> dict[str, str]:
+    return {
+        "start": f"{month.isoformat()} 00:00:00+00",
+        "end": f"{add_months(month, 1).isoformat()} 00:00:00+00",
+    }
+
+
+def create_partition(connection: Connection, month: date) -> None:
+    """Create the partition for ``month``.
+
+    Rows that already landed in the default partition for that month are
+    moved into the new partition, since Postgres refuses to create a
+    partition overlapping rows in the default one.
+    """
+    name = partition_name(month)
+    bounds = _bounds(month)
+    in_range = '"timestamp" >= :start AND "timestamp" < :end'
+    create = (
+        f"CREATE TABLE {name} PARTITION OF {PARENT_TABLE} "
+        f"FOR VALUES FROM ('{bounds['start']}') TO ('{bounds['end']}')"
+    )
+    stray = connection.scalar(
+        text(f"SELECT 1 FROM {DEFAULT_PARTITION} WHERE {in_range} LIMIT 1"), bounds
+    )
+    if not stray:
+        connection.execute(text(create))
+        return
+    connection.execute(
+        text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {DEFAULT_PARTITION}")
+    )
+    connection.execute(text(create))
+    connection.execute(
+        text(f"INSERT INTO {name} SELECT * FROM {DEFAULT_PARTITION} WHERE {in_range}"),
+        bounds,
+    )
+    connection.execute(
+        text(f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_range}"), bounds
+    )
+    connection.execute(
+        text(f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT")
+    )
+
+
+def export_partition(connection: Connection, name: str, directory: Path) -> Path:
+    """Write a partition's rows to ``<directory>/<name>.csv.gz`` and fsync it."""
+    if partition_month(name) is None:
+        raise ValueError(f"Not an audit log partition: {name}")
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{name}.csv.gz"
+    cursor = connection.connection.driver_connection.cursor()
+    try:
+        with open(path, "wb") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb") as out:
+                cursor.copy_expert(
+                    f"COPY {name} TO STDOUT WITH (FORMAT csv, HEADER)", out
+                )
+            raw.flush()
+            os.fsync(raw.fileno())
+    finally:
+        cursor.close()
+    return path
+
+
+def drop_partition(connection: Connection, name: str) -> None:
+    """Detach and drop an archived partition."""
+    if partition_month(name) is None:
+        raise ValueError(f"Not an audit log partition: {name}")
+    connection.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+    connection.execute(text(f"DROP TABLE {name}"))
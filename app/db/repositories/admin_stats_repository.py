@@ -0,0 +1,219 @@
+"""Admin dashboard rollup repository for database operations."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta, timezone
+
+from sqlalchemy import Date, Row, and_, delete, func, insert, or_, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.functions import FunctionElement
+
+from app.db.routing import read_only
+from app.models.appointment import Appointment
+from app.models.daily_stats import (
+    DailyAppointmentStat,
+    DailyRegistrationStat,
+    RollupWatermark,
+)
+from app.models.user import User
+from app.utils.constants import UserRole
+
+APPOINTMENT_ROLLUP = "daily_appointment_stats"
+REGISTRATION_ROLLUP = "daily_registration_stats"
+
+
+class utc_day(FunctionElement):
+    """The UTC calendar day of a timestamp column."""
+
+    type = Date()
+    inherit_cache = True
+
+
+@compiles(utc_day)
+def _compile_utc_day(element, compiler, **kw) -> str:
+    return f"date({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(utc_day, "postgresql")
+def _compile_utc_day_postgresql(element, compiler, **kw) -> str:
+    column = compiler.process(element.clauses, **kw)
+    return f"CAST(({column} AT TIME ZONE 'UTC') AS DATE)"
+
+
+def _within_days(column, days: Iterable[date]):
+    """Sargable condition matching timestamps that fall on any of ``days``."""
+    return or_(
+        *(
+            and_(
+                column >= datetime.combine(day, time.min, timezone.utc),
+                column
+                < datetime.combine(day + timedelta(days=1), time.min, timezone.utc),
+            )
+            for day in days
+        )
+    )
+
+
+class AdminStatsRepository:
+    """Repository for the daily appointment and registration rollups."""
+
+    # Days recomputed per statement during an incremental refresh.
+    DAY_CHUNK = 100
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def refresh(self, overlap: timedelta, full: bool = False) -> tuple[int, int]:
+        """Bring both rollups up to date in one transaction.
+
+        Only the days of source rows changed since the last refresh are
+        recomputed; ``overlap`` is subtracted from the watermark to catch
+        transactions that were still open when it was taken. A rollup with
+        no watermark, or ``full=True``, is rebuilt from scratch. Returns the
+        number of appointment and registration days rewritten (-1 for a full
+        rebuild).
+        """
+        started = datetime.now(timezone.utc)
+
+        since = self._advance_watermark(APPOINTMENT_ROLLUP, started)
+        if full or since is None:
+            self._rewrite_appointment_days(None)
+            appointment_days = -1
+        else:
+            days = self.db.scalars(
+                select(utc_day(Appointment.scheduled_datetime))
+                .where(Appointment.updated_at >= since - overlap)
+                .distinct()
+            ).all()
+            self._rewrite_appointment_days(days)
+            appointment_days = len(days)
+
+        since = self._advance_watermark(REGISTRATION_ROLLUP, started)
+        if full or since is None:
+            self._rewrite_registration_days(None)
+            registration_days = -1
+        else:
+            days = self.db.scalars(
+                select(utc_day(User.created_at))
+                .where(User.created_at >= since - overlap)
+                .distinct()
+            ).all()
+            self._rewrite_registration_days(days)
+            registration_days = len(days)
+
+        self.db.commit()
+        return appointment_days, registration_days
+
+    def _advance_watermark(self, name: str, started: datetime) -> datetime | None:
+        """Lock a rollup's watermark, move it to ``started`` and return the old one.
+
+        The row lock serializes concurrent refreshes of the same rollup, so
+        two of them never rewrite the same days at once.
+        """
+        watermark = self.db.get(RollupWatermark, name, with_for_update=True)
+        if watermark is None:
+            self.db.add(RollupWatermark(name=name, refreshed_at=started))
+            self.db.flush()
+            return None
+        previous = watermark.refreshed_at
+        watermark.refreshed_at = started
+        self.db.flush()
+        if previous.tzinfo is None:
+            previous = previous.replace(tzinfo=timezone.utc)
+        return previous
+
+    def _rewrite_appointment_days(self, days: list[date] | None) -> None:
+        """Recompute appointment counts for ``days``, or for every day if None."""
+        day = utc_day(Appointment.scheduled_datetime)
+        aggregate = select(day, Appointment.status, func.count(Appointment.id))
+        if days is None:
+            self.db.execute(delete(DailyAppointmentStat))
+            self.db.execute(
+                insert(DailyAppointmentStat).from_select(
+                    ["day", "status", "appointment_count"],
+                    aggregate.group_by(day, Appointment.status),
+                )
+            )
+            return
+        ordered = sorted(days)
+        for start in range(0, len(ordered), self.DAY_CHUNK):
+            chunk = ordered[start : start + self.DAY_CHUNK]
+            self.db.execute(
+                delete(DailyAppointmentStat).where(DailyAppointmentStat.day.in_(chunk))
+            )
+            self.db.execute(
+                insert(DailyAppointmentStat).from_select(
+                    ["day", "status", "appointment_count"],
+                    aggregate.where(
+                        _within_days(Appointment.scheduled_datetime, chunk)
+                    ).group_by(day, Appointment.status),
+                )
+            )
+
+    def _rewrite_registration_days(self, days: list[date] | None) -> None:
+        """Recompute registration counts for ``days``, or for every day if None."""
+        day = utc_day(User.created_at)
+        aggregate = select(day, User.role, func.count(User.id))
+        if days is None:
+            self.db.execute(delete(DailyRegistrationStat))
+            self.db.execute(
+                insert(DailyRegistrationStat).from_select(
+                    ["day", "role", "user_count"], aggregate.group_by(day, User.role)
+                )
+            )
+            return
+        ordered = sorted(days)
+        for start in range(0, len(ordered), self.DAY_CHUNK):
+            chunk = ordered[start : start + self.DAY_CHUNK]
+            self.db.execute(
+                delete(DailyRegistrationStat).where(
+                    DailyRegistrationStat.day.in_(chunk)
+                )
+            )
+            self.db.execute(
+                insert(DailyRegistrationStat).from_select(
+                    ["day", "role", "user_count"],
+                    aggregate.where(_within_days(User.created_at, chunk)).group_by(
+                        day, User.role
+                    ),
+                )
+            )
+
+    @read_only
+    def get_registration_totals(self) -> dict[UserRole, int]:
+        """Return the number of registered users per role."""
+        rows = self.db.execute(
+            select(
+                DailyRegistrationStat.role, func.sum(DailyRegistrationStat.user_count)
+            ).group_by(DailyRegistrationStat.role)
+        ).all()
+        return {role: int(total) for role, total in rows}
+
+    @read_only
+    def get_appointment_counts(self, first_day: date, last_day: date) -> list[Row]:
+        """Return (day, status, count) rows for days in ``[first_day, last_day]``."""
+        return list(
+            self.db.execute(
+                select(
+                    DailyAppointmentStat.day,
+                    DailyAppointmentStat.status,
+                    DailyAppointmentStat.appointment_count,
+                ).where(DailyAppointmentStat.day.between(first_day, last_day))
+            ).all()
+        )
+
+    @read_only
+    def get_registration_counts(self, first_day: date, last_day: date) -> list[Row]:
+        """Return (day, count) rows for days in ``[first_day, last_day]``."""
+        return list(
+            self.db.execute(
+                select(
+                    DailyRegistrationStat.day,
+                    func.sum(DailyRegistrationStat.user_count),
+                )
+                .where(DailyRegistrationStat.day.between(first_day, last_day))
+                .group_by(DailyRegistrationStat.day)
+            ).all()
+        )
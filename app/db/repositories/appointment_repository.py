@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone, date
 
-from sqlalchemy import and_, func, or_
+from sqlalchemy import Row, and_, func, or_, text
 from sqlalchemy.orm import Session, joinedload
 
+from app.db.routing import read_only
 from app.models.appointment import Appointment
 from app.utils.constants import AppointmentStatus
+from app.utils.pagination import CursorKey
+
+# First key of the two-key Postgres advisory lock taken per booking day.
+BOOKING_LOCK_NAMESPACE = 4201
+# In-process fallback for databases without advisory locks (SQLite in dev/tests).
+_LOCAL_BOOKING_LOCKS = tuple(threading.Lock() for _ in range(64))
 
 
 class AppointmentRepository:
@@ -17,6 +27,31 @@ class AppointmentRepository:
     def __init__(self, db: Session) -> None:
         self.db = db
 
+    @contextmanager
+    def booking_lock(self, target_date: date) -> Iterator[None]:
+        """Serialize conflict checks and writes for bookings on a date.
+
+        On Postgres this takes a transaction-scoped advisory lock, released by
+        the commit or rollback that ends the booking; an error leaving the
+        block rolls back, so a rejected booking does not hold the day's lock
+        while the caller carries on. Other databases fall back to a striped
+        in-process lock held for the block.
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            self.db.execute(
+                text("SELECT pg_advisory_xact_lock(:namespace, :day)"),
+                {"namespace": BOOKING_LOCK_NAMESPACE, "day": target_date.toordinal()},
+            )
+            try:
+                yield
+            except BaseException:
+                self.db.rollback()
+                raise
+            return
+        lock = _LOCAL_BOOKING_LOCKS[target_date.toordinal() % len(_LOCAL_BOOKING_LOCKS)]
+        with lock:
+            yield
+
     def create(self, appointment: Appointment) -> Appointment:
         """Create a new appointment."""
         self.db.add(appointment)
@@ -40,10 +75,16 @@ class AppointmentRepository:
         end_of_day = datetime.combine(target_date, datetime.max.time()).replace(
             tzinfo=timezone.utc
         )
+        return self.get_booked_slots_between(start_of_day, end_of_day, doctor_id)
+
+    def get_booked_slots_between(
+        self, start: datetime, end: datetime, doctor_id: int | None = None
+    ) -> list[Appointment]:
+        """Get booked appointments starting within [start, end]."""
         query = self.db.query(Appointment).filter(
             and_(
-                Appointment.scheduled_datetime >= start_of_day,
-                Appointment.scheduled_datetime <= end_of_day,
+                Appointment.scheduled_datetime >= start,
+                Appointment.scheduled_datetime <= end,
                 Appointment.status.in_(
                     [AppointmentStatus.PENDING, AppointmentStatus.SCHEDULED]
                 ),
@@ -53,95 +94,134 @@ class AppointmentRepository:
             query = query.filter(Appointment.doctor_id == doctor_id)
         return query.all()
 
+    def _list_query(self):
+        """Project the columns appointment lists render, with the doctor's name.
+
+        Only the doctor row is joined, one-to-one, so list queries carry no
+        user rows or other eager-loaded relationships.
+        """
+        from app.models.doctor import Doctor
+
+        return self.db.query(
+            Appointment.id,
+            Appointment.scheduled_datetime,
+            Appointment.duration_minutes,
+            Appointment.status,
+            Appointment.reason,
+            Appointment.doctor_id,
+            Doctor.title.label("doctor_title"),
+            Doctor.first_name.label("doctor_first_name"),
+            Doctor.last_name.label("doctor_last_name"),
+            Doctor.specialty.label("doctor_specialty"),
+        ).outerjoin(Doctor, Doctor.id == Appointment.doctor_id)
+
+    @staticmethod
+    def _patient_upcoming_filter(patient_id: int):
+        return and_(
+            Appointment.patient_id == patient_id,
+            Appointment.scheduled_datetime >= datetime.now(timezone.utc),
+            Appointment.status.in_(
+                [AppointmentStatus.PENDING, AppointmentStatus.SCHEDULED]
+            ),
+        )
+
+    @staticmethod
+    def _patient_past_filter(patient_id: int):
+        return and_(
+            Appointment.patient_id == patient_id,
+            or_(
+                Appointment.scheduled_datetime < datetime.now(timezone.utc),
+                Appointment.status.in_(
+                    [AppointmentStatus.COMPLETED, AppointmentStatus.CANCELLED]
+                ),
+            ),
+        )
+
+    @staticmethod
+    def _after(key: CursorKey, descending: bool = False):
+        """Keyset condition for rows strictly past ``key`` in (time, id) order."""
+        moment, row_id = key
+        if descending:
+            return and_(
+                Appointment.scheduled_datetime <= moment,
+                or_(
+                    Appointment.scheduled_datetime < moment,
+                    Appointment.id < row_id,
+                ),
+            )
+        return and_(
+            Appointment.scheduled_datetime >= moment,
+            or_(
+                Appointment.scheduled_datetime > moment,
+                Appointment.id > row_id,
+            ),
+        )
+
+    def _count(self, criterion, cap: int | None) -> int:
+        """Count matching appointments, stopping after ``cap + 1`` when capped."""
+        if cap is None:
+            return (
+                self.db.query(func.count(Appointment.id)).filter(criterion).scalar()
+                or 0
+            )
+        limited = (
+            self.db.query(Appointment.id).filter(criterion).limit(cap + 1).subquery()
+        )
+        return self.db.query(func.count()).select_from(limited).scalar() or 0
+
+    @read_only
     def get_patient_appointments(
         self,
         patient_id: int,
         status: AppointmentStatus | None = None,
         upcoming_only: bool = False,
-    ) -> list[Appointment]:
-        """Get appointments for a patient with optional filtering."""
-        from app.models.doctor import Doctor
-
-        query = (
-            self.db.query(Appointment)
-            .options(joinedload(Appointment.doctor).joinedload(Doctor.user))
-            .filter(Appointment.patient_id == patient_id)
-        )
+    ) -> list[Row]:
+        """Get appointment list rows for a patient with optional filtering."""
+        query = self._list_query().filter(Appointment.patient_id == patient_id)
 
         if status:
             query = query.filter(Appointment.status == status)
 
         if upcoming_only:
-            query = query.filter(
-                and_(
-                    Appointment.scheduled_datetime >= datetime.now(timezone.utc),
-                    Appointment.status.in_(
-                        [AppointmentStatus.PENDING, AppointmentStatus.SCHEDULED]
-                    ),
-                )
-            )
+            query = query.filter(self._patient_upcoming_filter(patient_id))
 
-        return query.order_by(Appointment.scheduled_datetime.asc()).all()
-
-    def get_next_appointment(self, patient_id: int) -> Appointment | None:
-        """Get the next upcoming appointment for a patient (pending or scheduled)."""
-        from app.models.doctor import Doctor
+        return query.order_by(
+            Appointment.scheduled_datetime.asc(), Appointment.id.asc()
+        ).all()
 
+    @read_only
+    def get_next_appointment(self, patient_id: int) -> Row | None:
+        """Get the next upcoming appointment row for a patient."""
         return (
-            self.db.query(Appointment)
-            .options(joinedload(Appointment.doctor).joinedload(Doctor.user))
-            .filter(
-                and_(
-                    Appointment.patient_id == patient_id,
-                    Appointment.scheduled_datetime >= datetime.now(timezone.utc),
-                    Appointment.status.in_(
-                        [AppointmentStatus.PENDING, AppointmentStatus.SCHEDULED]
-                    ),
-                )
-            )
-            .order_by(Appointment.scheduled_datetime.asc())
+            self._list_query()
+            .filter(self._patient_upcoming_filter(patient_id))
+            .order_by(Appointment.scheduled_datetime.asc(), Appointment.id.asc())
             .first()
         )
 
-    def count_upcoming_appointments(self, patient_id: int) -> int:
-        """Count upcoming scheduled/pending appointments for a patient."""
-        return (
-            self.db.query(func.count(Appointment.id))
-            .filter(
-                and_(
-                    Appointment.patient_id == patient_id,
-                    Appointment.scheduled_datetime >= datetime.now(timezone.utc),
-                    Appointment.status.in_(
-                        [AppointmentStatus.PENDING, AppointmentStatus.SCHEDULED]
-                    ),
-                )
-            )
-            .scalar()
-        )
+    @read_only
+    def count_upcoming_appointments(
+        self, patient_id: int, cap: int | None = None
+    ) -> int:
+        """Count upcoming scheduled/pending appointments for a patient.
+
+        With ``cap`` set, counting stops after ``cap + 1`` rows.
+        """
+        return self._count(self._patient_upcoming_filter(patient_id), cap)
 
+    @read_only
     def get_patient_upcoming_appointments(
         self,
         patient_id: int,
         limit: int | None = None,
-        offset: int = 0,
-    ) -> list[Appointment]:
-        """Get upcoming appointments for a patient with pagination."""
-        from app.models.doctor import Doctor
-
-        query = (
-            self.db.query(Appointment)
-            .options(joinedload(Appointment.doctor).joinedload(Doctor.user))
-            .filter(
-                and_(
-                    Appointment.patient_id == patient_id,
-                    Appointment.scheduled_datetime >= datetime.now(timezone.utc),
-                    Appointment.status.in_(
-                        [AppointmentStatus.PENDING, AppointmentStatus.SCHEDULED]
-                    ),
-                )
-            )
-            .order_by(Appointment.scheduled_datetime.asc())
-            .offset(offset)
+        after: CursorKey | None = None,
+    ) -> list[Row]:
+        """Get upcoming appointment rows for a patient, resuming after a key."""
+        query = self._list_query().filter(self._patient_upcoming_filter(patient_id))
+        if after is not None:
+            query = query.filter(self._after(after))
+        query = query.order_by(
+            Appointment.scheduled_datetime.asc(), Appointment.id.asc()
         )
 
         if limit:
@@ -149,6 +229,7 @@ class AppointmentRepository:
 
         return query.all()
 
+    @read_only
     def get_pending_appointments(self) -> list[Appointment]:
         """Get all pending appointments awaiting doctor assignment (for admin)."""
         from app.models.patient import Patient
@@ -171,11 +252,14 @@ class AppointmentRepository:
             self.db.refresh(appointment)
         return appointment
 
+    @read_only
     def get_doctor_appointments(
         self,
         doctor_id: int,
         date_from: datetime | None = None,
         date_to: datetime | None = None,
+        active_only: bool = False,
+        limit: int | None = None,
     ) -> list[Appointment]:
         """Get appointments for a doctor within a date range."""
         query = (
@@ -188,34 +272,50 @@ class AppointmentRepository:
             query = query.filter(Appointment.scheduled_datetime >= date_from)
         if date_to:
             query = query.filter(Appointment.scheduled_datetime <= date_to)
+        if active_only:
+            query = query.filter(
+                Appointment.status.in_(
+                    [AppointmentStatus.PENDING, AppointmentStatus.SCHEDULED]
+                )
+            )
+
+        query = query.order_by(Appointment.scheduled_datetime.asc())
+        if limit:
+            query = query.limit(limit)
+        return query.all()
 
-        return query.order_by(Appointment.scheduled_datetime.asc()).all()
+    @read_only
+    def count_doctor_active_appointments(
+        self,
+        doctor_id: int,
+        date_from: datetime,
+        date_to: datetime | None = None,
+    ) -> int:
+        """Count pending/scheduled appointments for a doctor in a date range."""
+        query = self.db.query(func.count(Appointment.id)).filter(
+            Appointment.doctor_id == doctor_id,
+            Appointment.scheduled_datetime >= date_from,
+            Appointment.status.in_(
+                [AppointmentStatus.PENDING, AppointmentStatus.SCHEDULED]
+            ),
+        )
+        if date_to:
+            query = query.filter(Appointment.scheduled_datetime <= date_to)
+        return query.scalar() or 0
 
+    @read_only
     def get_patient_past_appointments(
         self,
         patient_id: int,
         limit: int | None = None,
-        offset: int = 0,
-    ) -> list[Appointment]:
-        """Get past/completed appointments for a patient with pagination."""
-        from app.models.doctor import Doctor
-
-        query = (
-            self.db.query(Appointment)
-            .options(joinedload(Appointment.doctor).joinedload(Doctor.user))
-            .filter(
-                and_(
-                    Appointment.patient_id == patient_id,
-                    or_(
-                        Appointment.scheduled_datetime < datetime.now(timezone.utc),
-                        Appointment.status.in_(
-                            [AppointmentStatus.COMPLETED, AppointmentStatus.CANCELLED]
-                        ),
-                    ),
-                )
-            )
-            .order_by(Appointment.scheduled_datetime.desc())
-            .offset(offset)
+        after: CursorKey | None = None,
+    ) -> list[Row]:
+        """Get past/completed appointment rows newest first, resuming after a key."""
+        query = self._list_query().filter(self._patient_past_filter(patient_id))
+        if after is not None:
+            query = query.filter(self._after(after, descending=True))
+        query = query.order_by(
+            Appointment.scheduled_datetime.desc(), Appointment.id.desc()
         )
 
         if limit:
@@ -223,20 +323,12 @@ class AppointmentRepository:
 
         return query.all()
 
-    def count_patient_past_appointments(self, patient_id: int) -> int:
-        """Count past/completed appointments for a patient."""
-        return (
-            self.db.query(func.count(Appointment.id))
-            .filter(
-                and_(
-                    Appointment.patient_id == patient_id,
-                    or_(
-                        Appointment.scheduled_datetime < datetime.now(timezone.utc),
-                        Appointment.status.in_(
-                            [AppointmentStatus.COMPLETED, AppointmentStatus.CANCELLED]
-                        ),
-                    ),
-                )
-            )
-            .scalar()
-        )
+    @read_only
+    def count_patient_past_appointments(
+        self, patient_id: int, cap: int | None = None
+    ) -> int:
+        """Count past/completed appointments for a patient.
+
+        With ``cap`` set, counting stops after ``cap + 1`` rows.
+        """
+        return self._count(self._patient_past_filter(patient_id), cap)
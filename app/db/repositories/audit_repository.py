@@ -1 +1,123 @@
-"""Audit repository placeholder."""
+"""Audit log repository for database operations."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from datetime import datetime
+
+from sqlalchemy import Row, and_, func, or_, select
+from sqlalchemy.orm import Session
+
+from app.db.routing import read_only
+from app.models.audit_log import AuditLog
+from app.models.user import User
+from app.utils.pagination import CursorKey
+
+
+class AuditRepository:
+    """Repository for audit log database operations."""
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    @staticmethod
+    def _before(key: CursorKey):
+        """Keyset condition for rows strictly older than ``key`` in (time, id)."""
+        moment, row_id = key
+        return and_(
+            AuditLog.timestamp <= moment,
+            or_(AuditLog.timestamp < moment, AuditLog.id < row_id),
+        )
+
+    @read_only
+    def search(
+        self,
+        since: datetime,
+        until: datetime | None = None,
+        user_id: int | None = None,
+        action: str | None = None,
+        resource_type: str | None = None,
+        resource_id: int | None = None,
+        limit: int = 200,
+        before: CursorKey | None = None,
+    ) -> list[Row]:
+        """Return matching audit entries newest first with the actor's email.
+
+        ``since`` is required so that on a partitioned table the scan prunes
+        to the months inside the window. Each filter has a composite index
+        ending in ``(timestamp, id)``, so a page is an index range scan
+        resumed from ``before``.
+        """
+        query = (
+            select(
+                AuditLog.id,
+                AuditLog.timestamp,
+                AuditLog.user_id,
+                User.email,
+                AuditLog.action,
+                AuditLog.resource_type,
+                AuditLog.resource_id,
+                AuditLog.details,
+                AuditLog.ip_address,
+            )
+            .outerjoin(User, User.id == AuditLog.user_id)
+            .where(AuditLog.timestamp >= since)
+        )
+        if until is not None:
+            query = query.where(AuditLog.timestamp < until)
+        if user_id is not None:
+            query = query.where(AuditLog.user_id == user_id)
+        if action is not None:
+            query = query.where(AuditLog.action == action)
+        if resource_type is not None:
+            query = query.where(AuditLog.resource_type == resource_type)
+        if resource_id is not None:
+            query = query.where(AuditLog.resource_id == resource_id)
+        if before is not None:
+            query = query.where(self._before(before))
+        query = query.order_by(AuditLog.timestamp.desc(), AuditLog.id.desc())
+        return list(self.db.execute(query.limit(limit)).all())
+
+    @read_only
+    def count_window(self, since: datetime, until: datetime, cap: int) -> int:
+        """Count entries in ``[since, until)``, stopping after ``cap + 1``."""
+        limited = (
+            select(AuditLog.id)
+            .where(AuditLog.timestamp >= since, AuditLog.timestamp < until)
+            .limit(cap + 1)
+            .subquery()
+        )
+        return self.db.scalar(select(func.count()).select_from(limited)) or 0
+
+    @read_only
+    def stream_window(
+        self,
+        since: datetime,
+        until: datetime,
+        batch_size: int = 5000,
+        limit: int | None = None,
+    ) -> Iterator[Sequence[Row]]:
+        """Stream entries in ``[since, until)`` in batches, oldest first.
+
+        The range and ordering both follow ``idx_audit_timestamp``; rows are
+        fetched through a server-side cursor ``batch_size`` at a time, and
+        at most ``limit`` rows are returned when it is given.
+        """
+        query = (
+            select(
+                AuditLog.id,
+                AuditLog.timestamp,
+                AuditLog.user_id,
+                AuditLog.action,
+                AuditLog.resource_type,
+                AuditLog.resource_id,
+                AuditLog.details,
+                AuditLog.ip_address,
+                AuditLog.user_agent,
+            )
+            .where(AuditLog.timestamp >= since, AuditLog.timestamp < until)
+            .order_by(AuditLog.timestamp)
+            .limit(limit)
+        )
+        result = self.db.execute(query, execution_options={"yield_per": batch_size})
+        return result.partitions()
@@ -0,0 +1,72 @@
+"""Bloodwork marker repository for database operations."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import Row, func, select
+from sqlalchemy.orm import Session
+
+from app.db.routing import read_only
+from app.models.bloodwork import Bloodwork
+from app.models.bloodwork_marker import BloodworkMarker
+
+OUT_OF_RANGE_STATUSES = ("low", "high", "critical")
+
+
+class BloodworkMarkerRepository:
+    """Repository for per-marker bloodwork observations."""
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    @read_only
+    def get_series(
+        self,
+        patient_id: int,
+        marker_keys: list[str],
+        date_from: date | None = None,
+        date_to: date | None = None,
+        published_only: bool = True,
+    ) -> list[Row]:
+        """Return numeric observations for markers, ordered by key and date."""
+        query = select(
+            BloodworkMarker.marker_key,
+            BloodworkMarker.test_date,
+            BloodworkMarker.value,
+            BloodworkMarker.status,
+        ).where(
+            BloodworkMarker.patient_id == patient_id,
+            BloodworkMarker.marker_key.in_(marker_keys),
+            BloodworkMarker.value.is_not(None),
+        )
+        if date_from:
+            query = query.where(BloodworkMarker.test_date >= date_from)
+        if date_to:
+            query = query.where(BloodworkMarker.test_date <= date_to)
+        if published_only:
+            query = query.join(
+                Bloodwork, Bloodwork.id == BloodworkMarker.bloodwork_id
+            ).where(Bloodwork.is_published.is_(True))
+        query = query.order_by(
+            BloodworkMarker.marker_key,
+            BloodworkMarker.test_date,
+            BloodworkMarker.id,
+        )
+        return list(self.db.execute(query))
+
+    @read_only
+    def count_out_of_range_by_marker(
+        self, patient_id: int, published_only: bool = True
+    ) -> dict[str, int]:
+        """Count out-of-range observations per marker key for a patient."""
+        query = select(BloodworkMarker.marker_key, func.count()).where(
+            BloodworkMarker.patient_id == patient_id,
+            BloodworkMarker.status.in_(OUT_OF_RANGE_STATUSES),
+        )
+        if published_only:
+            query = query.join(
+                Bloodwork, Bloodwork.id == BloodworkMarker.bloodwork_id
+            ).where(Bloodwork.is_published.is_(True))
+        query = query.group_by(BloodworkMarker.marker_key)
+        return {marker_key: count for marker_key, count in self.db.execute(query)}
@@ -4,9 +4,13 @@ from __future__ import annotations
 
 from datetime import date, datetime
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
 
+from app.db.routing import read_only
 from app.models.bloodwork import Bloodwork
+from app.models.bloodwork_marker import BloodworkMarker
+from app.models.patient import Patient
 
 
 class BloodworkRepository:
@@ -15,6 +19,7 @@ class BloodworkRepository:
     def __init__(self, db: Session) -> None:
         self.db = db
 
+    @read_only
     def get_published_for_patient(self, patient_id: int) -> list[Bloodwork]:
         """Return published bloodwork results for a patient."""
         return (
@@ -28,6 +33,20 @@ class BloodworkRepository:
             .all()
         )
 
+    @read_only
+    def count_pending_for_doctor(self, doctor_id: int) -> int:
+        """Count unpublished results for patients assigned to a doctor."""
+        return (
+            self.db.query(func.count(Bloodwork.id))
+            .join(Patient, Patient.id == Bloodwork.patient_id)
+            .filter(
+                Patient.doctor_id == doctor_id,
+                Bloodwork.is_published.is_(False),
+            )
+            .scalar()
+            or 0
+        )
+
     def get_by_id(self, bloodwork_id: int) -> Bloodwork | None:
         """Return a bloodwork result by ID."""
         return (
@@ -49,6 +68,9 @@ class BloodworkRepository:
         approved_by: int | None = None,
         approved_at: datetime | None = None,
         published_at: datetime | None = None,
+        normalized: dict | None = None,
+        normalized_version: int | None = None,
+        markers: list[BloodworkMarker] | None = None,
     ) -> Bloodwork:
         """Create a bloodwork result."""
         bloodwork = Bloodwork(
@@ -62,6 +84,9 @@ class BloodworkRepository:
             approved_by=approved_by,
             approved_at=approved_at,
             published_at=published_at,
+            normalized=normalized,
+            normalized_version=normalized_version,
+            markers=markers or [],
         )
         self.db.add(bloodwork)
         self.db.commit()
@@ -74,3 +99,8 @@ class BloodworkRepository:
         self.db.commit()
         self.db.refresh(bloodwork)
         return bloodwork
+
+    def save_all(self, bloodwork_results: list[Bloodwork]) -> None:
+        """Persist changes to several bloodwork results in one commit."""
+        self.db.add_all(bloodwork_results)
+        self.db.commit()
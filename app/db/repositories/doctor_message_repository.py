@@ -7,6 +7,8 @@ from datetime import datetime, timezone
 from sqlalchemy import update
 from sqlalchemy.orm import Session, joinedload
 
+from app.db.routing import read_only
+from app.db.unread_counters import adjust_unread
 from app.models.doctor_message import DoctorMessage
 
 
@@ -16,6 +18,7 @@ class DoctorMessageRepository:
     def __init__(self, db: Session) -> None:
         self.db = db
 
+    @read_only
     def get_for_doctor(
         self, doctor_id: int, unread_only: bool = False
     ) -> list[DoctorMessage]:
@@ -74,5 +77,6 @@ class DoctorMessageRepository:
             )
             .values(is_read=True, read_at=datetime.now(timezone.utc))
         )
+        adjust_unread(self.db.connection(), DoctorMessage, doctor_id, -result.rowcount)
         self.db.commit()
         return result.rowcount or 0
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session, joinedload
 
+from app.db.routing import read_only
 from app.models.doctor import Doctor
 
 
@@ -13,6 +15,7 @@ class DoctorRepository:
     def __init__(self, db: Session) -> None:
         self.db = db
 
+    @read_only
     def get_by_id(self, doctor_id: int) -> Doctor | None:
         """Get doctor by ID."""
         return (
@@ -22,6 +25,7 @@ class DoctorRepository:
             .first()
         )
 
+    @read_only
     def get_by_user_id(self, user_id: int) -> Doctor | None:
         """Get doctor by user ID."""
         return (
@@ -31,6 +35,7 @@ class DoctorRepository:
             .first()
         )
 
+    @read_only
     def get_all_approved(self) -> list[Doctor]:
         """Get all approved doctors."""
         return (
@@ -40,6 +45,17 @@ class DoctorRepository:
             .all()
         )
 
+    @read_only
     def get_all(self) -> list[Doctor]:
         """Get all doctors."""
         return self.db.query(Doctor).options(joinedload(Doctor.user)).all()
+
+    @read_only
+    def count_pending_approval(self) -> int:
+        """Count doctors awaiting admin approval."""
+        return (
+            self.db.execute(
+                select(func.count(Doctor.id)).where(Doctor.is_approved.is_(False))
+            ).scalar()
+            or 0
+        )
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import datetime, timezone
+from typing import Any
 
-from sqlalchemy import update
+from sqlalchemy import Row, func, insert, update
 from sqlalchemy.orm import Session
 
+from app.db.repositories.unread_counter_repository import UnreadCounterRepository
+from app.db.routing import read_only
+from app.db.unread_counters import adjust_unread, increment_unread_many
 from app.models.notification import Notification
 
 
@@ -16,32 +21,116 @@ class NotificationRepository:
     def __init__(self, db: Session) -> None:
         self.db = db
 
-    def get_for_patient(
-        self, patient_id: int, unread_only: bool = False
-    ) -> list[Notification]:
-        """Return notifications for a patient."""
-        query = self.db.query(Notification).filter(
-            Notification.patient_id == patient_id
+    def _item_query(self):
+        """Select notification columns in ``NotificationItem`` field order."""
+        return self.db.query(
+            Notification.id,
+            Notification.type,
+            Notification.title,
+            Notification.message,
+            Notification.is_read,
+            Notification.created_at,
+            Notification.updated_at,
         )
+
+    @read_only
+    def get_for_patient(
+        self,
+        patient_id: int,
+        unread_only: bool = False,
+        limit: int | None = None,
+        before_id: int | None = None,
+    ) -> list[Row]:
+        """Return a patient's notifications newest first.
+
+        Notifications are append-only, so ids follow creation order and
+        ``before_id`` resumes after the last row of an earlier page.
+        """
+        query = self._item_query().filter(Notification.patient_id == patient_id)
         if unread_only:
             query = query.filter(Notification.is_read.is_(False))
-        return query.order_by(Notification.created_at.desc()).all()
-
-    def mark_as_read(self, notification_id: int) -> Notification | None:
-        """Mark a single notification as read."""
-        notification = (
-            self.db.query(Notification)
-            .filter(Notification.id == notification_id)
-            .first()
+        if before_id is not None:
+            query = query.filter(Notification.id < before_id)
+        query = query.order_by(Notification.id.desc())
+        if limit:
+            query = query.limit(limit)
+        return query.all()
+
+    @read_only
+    def get_high_water_mark(self, patient_id: int) -> datetime | None:
+        """Return when the patient's notifications last changed."""
+        return (
+            self.db.query(func.max(Notification.updated_at))
+            .filter(Notification.patient_id == patient_id)
+            .scalar()
+        )
+
+    def get_changed_since(
+        self, patient_id: int, since: datetime, limit: int | None = None
+    ) -> list[Row]:
+        """Return notifications created or updated at or after ``since``.
+
+        Read from the primary, so a poll never misses a committed change
+        that a lagging replica has not applied yet.
+        """
+        query = (
+            self._item_query()
+            .filter(
+                Notification.patient_id == patient_id,
+                Notification.updated_at >= since,
+            )
+            .order_by(Notification.updated_at.asc(), Notification.id.asc())
         )
-        if notification is None:
-            return None
-        if not notification.is_read:
-            notification.is_read = True
-            notification.read_at = datetime.now(timezone.utc)
-            self.db.commit()
-            self.db.refresh(notification)
-        return notification
+        if limit:
+            query = query.limit(limit)
+        return query.all()
+
+    def count_unread(self, patient_id: int) -> int:
+        """Return a patient's unread notification count from its counter."""
+        return UnreadCounterRepository(self.db).get_patient_unread_notifications(
+            patient_id
+        )
+
+    def create_for_patients(
+        self, patient_ids: Sequence[int], values: dict[str, Any]
+    ) -> int:
+        """Insert one unread notification per patient and commit.
+
+        The rows and the patients' unread counter increments each go out as
+        one Core executemany, which the driver batches into multi-row
+        statements, in the same transaction.
+        """
+        if not patient_ids:
+            return 0
+        self.db.execute(
+            insert(Notification.__table__),
+            [
+                {**values, "patient_id": patient_id, "is_read": False}
+                for patient_id in patient_ids
+            ],
+        )
+        increment_unread_many(self.db.connection(), Notification, patient_ids)
+        self.db.commit()
+        return len(patient_ids)
+
+    def mark_as_read(self, notification_id: int, patient_id: int) -> bool:
+        """Mark one of a patient's notifications as read with a single UPDATE.
+
+        Returns False if the notification does not exist, belongs to another
+        patient, or was already read.
+        """
+        result = self.db.execute(
+            update(Notification)
+            .where(
+                Notification.id == notification_id,
+                Notification.patient_id == patient_id,
+                Notification.is_read.is_(False),
+            )
+            .values(is_read=True, read_at=datetime.now(timezone.utc))
+        )
+        adjust_unread(self.db.connection(), Notification, patient_id, -result.rowcount)
+        self.db.commit()
+        return bool(result.rowcount)
 
     def mark_all_as_read(self, patient_id: int) -> int:
         """Mark all notifications as read for a patient."""
@@ -53,5 +142,6 @@ class NotificationRepository:
             )
             .values(is_read=True, read_at=datetime.now(timezone.utc))
         )
+        adjust_unread(self.db.connection(), Notification, patient_id, -result.rowcount)
         self.db.commit()
         return result.rowcount or 0
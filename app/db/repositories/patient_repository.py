@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from datetime import datetime, timezone
 
+from sqlalchemy import Row, func, select
+from sqlalchemy.orm import Session, aliased, joinedload
+
+from app.db.routing import read_only
+from app.models.appointment import Appointment
 from app.models.bloodwork import Bloodwork
+from app.models.doctor import Doctor
 from app.models.notification import Notification
 from app.models.patient import Patient
 from app.models.prescription import Prescription
+from app.models.unread_counter import PatientUnreadCounter
+from app.models.user import User
+from app.utils.constants import AppointmentStatus
 
 
 class PatientRepository:
@@ -17,10 +25,12 @@ class PatientRepository:
     def __init__(self, db: Session) -> None:
         self.db = db
 
+    @read_only
     def get_by_id(self, patient_id: int) -> Patient | None:
         """Get patient by ID."""
         return self.db.query(Patient).filter(Patient.id == patient_id).first()
 
+    @read_only
     def get_by_user_id(self, user_id: int) -> Patient | None:
         """Get patient by user ID."""
         return (
@@ -30,6 +40,16 @@ class PatientRepository:
             .first()
         )
 
+    @read_only
+    def get_summary_by_user_id(self, user_id: int) -> Row | None:
+        """Get a patient's id and name by user ID."""
+        return (
+            self.db.query(Patient.id, Patient.first_name, Patient.last_name)
+            .filter(Patient.user_id == user_id)
+            .first()
+        )
+
+    @read_only
     def get_by_doctor_id(self, doctor_id: int) -> list[Patient]:
         """Get patients assigned to a doctor."""
         return (
@@ -40,6 +60,36 @@ class PatientRepository:
             .all()
         )
 
+    @read_only
+    def count_by_doctor_id(self, doctor_id: int) -> int:
+        """Count patients assigned to a doctor."""
+        return (
+            self.db.query(func.count(Patient.id))
+            .filter(Patient.doctor_id == doctor_id)
+            .scalar()
+        )
+
+    @read_only
+    def get_ids_after(
+        self,
+        after_id: int | None,
+        limit: int,
+        doctor_id: int | None = None,
+        active_only: bool = True,
+    ) -> list[int]:
+        """Return up to ``limit`` patient ids above ``after_id`` in id order."""
+        query = select(Patient.id)
+        if active_only:
+            query = query.join(User, User.id == Patient.user_id).where(
+                User.is_active.is_(True)
+            )
+        if doctor_id is not None:
+            query = query.where(Patient.doctor_id == doctor_id)
+        if after_id is not None:
+            query = query.where(Patient.id > after_id)
+        return list(self.db.scalars(query.order_by(Patient.id).limit(limit)))
+
+    @read_only
     def get_active_prescriptions_count(self, patient_id: int) -> int:
         """Count active prescriptions for a patient."""
         return (
@@ -51,6 +101,7 @@ class PatientRepository:
             .scalar()
         )
 
+    @read_only
     def get_pending_results_count(self, patient_id: int) -> int:
         """Count pending (unpublished) bloodwork results for a patient."""
         return (
@@ -62,17 +113,98 @@ class PatientRepository:
             .scalar()
         )
 
+    @read_only
     def get_unread_notifications_count(self, patient_id: int) -> int:
-        """Count unread notifications for a patient."""
+        """Count unread notifications for a patient from the unread counter."""
         return (
-            self.db.query(func.count(Notification.id))
-            .filter(
-                Notification.patient_id == patient_id,
-                Notification.is_read.is_(False),
-            )
+            self.db.query(PatientUnreadCounter.unread_notifications)
+            .filter(PatientUnreadCounter.patient_id == patient_id)
             .scalar()
+            or 0
+        )
+
+    @read_only
+    def get_dashboard_summary(self, patient_id: int) -> Row | None:
+        """Return dashboard counts and the next appointment in one query.
+
+        Each count is a correlated scalar subquery (unread notifications read
+        the patient's materialized counter), and the next appointment
+        is joined through a scalar subquery picking its id, so the whole
+        dashboard summary costs a single round trip.
+        """
+        now = datetime.now(timezone.utc)
+        active_statuses = [AppointmentStatus.PENDING, AppointmentStatus.SCHEDULED]
+
+        upcoming_count = (
+            select(func.count(Appointment.id))
+            .where(
+                Appointment.patient_id == Patient.id,
+                Appointment.scheduled_datetime >= now,
+                Appointment.status.in_(active_statuses),
+            )
+            .correlate(Patient)
+            .scalar_subquery()
+        )
+        prescriptions_count = (
+            select(func.count(Prescription.id))
+            .where(
+                Prescription.patient_id == Patient.id,
+                Prescription.is_active.is_(True),
+            )
+            .correlate(Patient)
+            .scalar_subquery()
+        )
+        pending_results_count = (
+            select(func.count(Bloodwork.id))
+            .where(
+                Bloodwork.patient_id == Patient.id,
+                Bloodwork.is_published.is_(False),
+            )
+            .correlate(Patient)
+            .scalar_subquery()
+        )
+        unread_count = (
+            select(PatientUnreadCounter.unread_notifications)
+            .where(PatientUnreadCounter.patient_id == Patient.id)
+            .correlate(Patient)
+            .scalar_subquery()
+        )
+
+        candidate = aliased(Appointment)
+        next_appointment_id = (
+            select(candidate.id)
+            .where(
+                candidate.patient_id == Patient.id,
+                candidate.scheduled_datetime >= now,
+                candidate.status.in_(active_statuses),
+            )
+            .order_by(candidate.scheduled_datetime.asc())
+            .limit(1)
+            .correlate(Patient)
+            .scalar_subquery()
+        )
+
+        query = (
+            select(
+                upcoming_count.label("upcoming_appointments"),
+                prescriptions_count.label("active_prescriptions"),
+                pending_results_count.label("pending_results"),
+                func.coalesce(unread_count, 0).label("unread_notifications"),
+                Appointment.scheduled_datetime.label("next_scheduled_datetime"),
+                Appointment.reason.label("next_reason"),
+                Appointment.doctor_id.label("next_doctor_id"),
+                Doctor.first_name.label("next_doctor_first_name"),
+                Doctor.last_name.label("next_doctor_last_name"),
+                Doctor.specialty.label("next_doctor_specialty"),
+            )
+            .select_from(Patient)
+            .outerjoin(Appointment, Appointment.id == next_appointment_id)
+            .outerjoin(Doctor, Doctor.id == Appointment.doctor_id)
+            .where(Patient.id == patient_id)
         )
+        return self.db.execute(query).first()
 
+    @read_only
     def get_active_prescriptions(self, patient_id: int) -> list[Prescription]:
         """Get active prescriptions for a patient."""
         return (
@@ -86,6 +218,7 @@ class PatientRepository:
             .all()
         )
 
+    @read_only
     def get_recent_bloodwork(self, patient_id: int, limit: int = 5) -> list[Bloodwork]:
         """Get recent bloodwork results for a patient."""
         return (
@@ -99,6 +232,7 @@ class PatientRepository:
             .all()
         )
 
+    @read_only
     def get_notifications(
         self, patient_id: int, unread_only: bool = False, limit: int = 10
     ) -> list[Notification]:
@@ -5,6 +5,7 @@ from __future__ import annotations
 from sqlalchemy import and_
 from sqlalchemy.orm import Session, joinedload
 
+from app.db.routing import read_only
 from app.models.prescription import Prescription
 
 
@@ -14,6 +15,7 @@ class PrescriptionRepository:
     def __init__(self, db: Session) -> None:
         self.db = db
 
+    @read_only
     def get_active_for_patient(self, patient_id: int) -> list[Prescription]:
         """Return active prescriptions for a patient."""
         return (
@@ -29,6 +31,7 @@ class PrescriptionRepository:
             .all()
         )
 
+    @read_only
     def get_history_for_patient(self, patient_id: int) -> list[Prescription]:
         """Return inactive prescriptions for a patient."""
         return (
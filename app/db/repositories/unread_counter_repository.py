@@ -0,0 +1,68 @@
+"""Unread counter repository for database operations."""
+
+from __future__ import annotations
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.db.routing import read_only
+from app.models.doctor_message import DoctorMessage
+from app.models.notification import Notification
+from app.models.unread_counter import DoctorUnreadCounter, PatientUnreadCounter
+
+
+class UnreadCounterRepository:
+    """Repository for materialized unread counters."""
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    @read_only
+    def get_patient_unread_notifications(self, patient_id: int) -> int:
+        """Return a patient's unread notification count by primary key."""
+        return (
+            self.db.execute(
+                select(PatientUnreadCounter.unread_notifications).where(
+                    PatientUnreadCounter.patient_id == patient_id
+                )
+            ).scalar()
+            or 0
+        )
+
+    @read_only
+    def get_doctor_unread_messages(self, doctor_id: int) -> int:
+        """Return a doctor's unread message count by primary key."""
+        return (
+            self.db.execute(
+                select(DoctorUnreadCounter.unread_messages).where(
+                    DoctorUnreadCounter.doctor_id == doctor_id
+                )
+            ).scalar()
+            or 0
+        )
+
+    def rebuild(self) -> tuple[int, int]:
+        """Recompute every counter from the source tables in one transaction.
+
+        Returns the number of patient and doctor counter rows written.
+        """
+        self.db.execute(delete(PatientUnreadCounter))
+        patients = self.db.execute(
+            insert(PatientUnreadCounter).from_select(
+                ["patient_id", "unread_notifications"],
+                select(Notification.patient_id, func.count(Notification.id))
+                .where(Notification.is_read.is_(False))
+                .group_by(Notification.patient_id),
+            )
+        )
+        self.db.execute(delete(DoctorUnreadCounter))
+        doctors = self.db.execute(
+            insert(DoctorUnreadCounter).from_select(
+                ["doctor_id", "unread_messages"],
+                select(DoctorMessage.doctor_id, func.count(DoctorMessage.id))
+                .where(DoctorMessage.is_read.is_(False))
+                .group_by(DoctorMessage.doctor_id),
+            )
+        )
+        self.db.commit()
+        return patients.rowcount or 0, doctors.rowcount or 0
@@ -0,0 +1,102 @@
+"""Primary/replica session routing."""
+
+from __future__ import annotations
+
+import functools
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Callable, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState, Session
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+READ_ONLY_KEY = "read_only"
+HAS_WRITES_KEY = "has_writes"
+PRIMARY_UNTIL_KEY = "primary_until"
+
+
+class RoutingSession(Session):
+    """Session that sends read-only repository calls to a replica.
+
+    Reads are routed to ``replica_bind`` only while a ``read_only`` repository
+    method is running, nothing has been written in the current transaction,
+    and the read-your-writes window opened by the last commit has expired.
+    Flushes, commits and every other statement use the primary bind.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        replica_bind: Engine | None = None,
+        sticky_seconds: float = 0.0,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.replica_bind = replica_bind
+        self.sticky_seconds = sticky_seconds
+
+    def uses_replica(self) -> bool:
+        """Return True if the next read would be served by the replica."""
+        if self.replica_bind is None or self._flushing:
+            return False
+        if not self.info.get(READ_ONLY_KEY) or self.info.get(HAS_WRITES_KEY):
+            return False
+        return time.time() >= self.info.get(PRIMARY_UNTIL_KEY, 0.0)
+
+    def get_bind(self, mapper=None, clause=None, **kw):  # type: ignore[override]
+        if self.uses_replica():
+            return self.replica_bind
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_flush(session: Session, flush_context: Any) -> None:
+    session.info[HAS_WRITES_KEY] = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _mark_dml(orm_execute_state: ORMExecuteState) -> None:
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info[HAS_WRITES_KEY] = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _pin_to_primary(session: Session) -> None:
+    if session.info.pop(HAS_WRITES_KEY, False):
+        sticky = getattr(session, "sticky_seconds", 0.0)
+        session.info[PRIMARY_UNTIL_KEY] = time.time() + sticky
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _clear_writes(session: Session) -> None:
+    session.info.pop(HAS_WRITES_KEY, None)
+
+
+@contextmanager
+def replica_reads(db: Session) -> Iterator[Session]:
+    """Allow reads issued inside the block to be served by the replica."""
+    previous = db.info.get(READ_ONLY_KEY, False)
+    db.info[READ_ONLY_KEY] = True
+    try:
+        yield db
+    finally:
+        db.info[READ_ONLY_KEY] = previous
+
+
+def read_only(method: F) -> F:
+    """Mark a repository method as safe to serve from the read replica."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with replica_reads(self.db):
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
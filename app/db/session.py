@@ -2,20 +2,220 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+import threading
+import time
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
 
-from sqlalchemy import create_engine
+import streamlit as st
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
 
-from app.config import get_settings
+from app.config import Settings, get_settings
+from app.db.routing import PRIMARY_UNTIL_KEY, RoutingSession
 
 settings = get_settings()
 
-engine = create_engine(settings.DATABASE_URL, echo=settings.DEBUG, future=True)
+
+@dataclass
+class PoolMetricsSnapshot:
+    """Point-in-time view of connection pool usage."""
+
+    pool_size: int | None
+    checked_out: int
+    overflow: int | None
+    checkouts: int
+    connects: int
+    wait_count: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+    timeouts: int
+
+
+class PoolMetrics:
+    """Thread-safe counters for pool checkouts and checkout waits."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero all counters."""
+        with self._lock:
+            self.checkouts = 0
+            self.checkins = 0
+            self.connects = 0
+            self.wait_count = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+            self.timeouts = 0
+
+    def record_checkout(self) -> None:
+        """Count a connection checkout."""
+        with self._lock:
+            self.checkouts += 1
+
+    def record_checkin(self) -> None:
+        """Count a connection return."""
+        with self._lock:
+            self.checkins += 1
+
+    def record_connect(self) -> None:
+        """Count a new DBAPI connection."""
+        with self._lock:
+            self.connects += 1
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        """Record time spent waiting for a pooled connection."""
+        with self._lock:
+            self.wait_count += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait for a connection."""
+
+    metrics: PoolMetrics | None = None
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.record_wait(time.perf_counter() - started, timed_out)
+
+
+def _is_sqlite(url: str) -> bool:
+    return url.startswith("sqlite")
+
+
+def _engine_options(url: str, config: Settings) -> dict[str, Any]:
+    """Return pool and driver options for a database URL."""
+    if _is_sqlite(url):
+        # SQLite uses SingletonThreadPool/StaticPool; queue settings do not apply.
+        return {}
+    options: dict[str, Any] = {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": config.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+    }
+    if url.startswith("postgresql") and config.DB_STATEMENT_TIMEOUT_MS:
+        options["connect_args"] = {
+            "options": f"-c statement_timeout={config.DB_STATEMENT_TIMEOUT_MS}"
+        }
+    return options
+
+
+def create_app_engine(
+    url: str, metrics: PoolMetrics, config: Settings | None = None
+) -> Engine:
+    """Create an engine with configured pooling and attach pool metrics."""
+    config = config or settings
+    new_engine = create_engine(
+        url, echo=config.DEBUG, future=True, **_engine_options(url, config)
+    )
+    if isinstance(new_engine.pool, InstrumentedQueuePool):
+        new_engine.pool.metrics = metrics
+
+    event.listen(new_engine, "checkout", lambda *_: metrics.record_checkout())
+    event.listen(new_engine, "checkin", lambda *_: metrics.record_checkin())
+    event.listen(new_engine, "connect", lambda *_: metrics.record_connect())
+    return new_engine
+
+
+def snapshot_pool_metrics(target: Engine, metrics: PoolMetrics) -> PoolMetricsSnapshot:
+    """Combine live pool state with accumulated counters."""
+    pool = target.pool
+    is_queue = isinstance(pool, QueuePool)
+    return PoolMetricsSnapshot(
+        pool_size=pool.size() if is_queue else None,
+        checked_out=metrics.checkouts - metrics.checkins,
+        overflow=pool.overflow() if is_queue else None,
+        checkouts=metrics.checkouts,
+        connects=metrics.connects,
+        wait_count=metrics.wait_count,
+        wait_seconds_total=metrics.wait_seconds_total,
+        wait_seconds_max=metrics.wait_seconds_max,
+        timeouts=metrics.timeouts,
+    )
+
+
+pool_metrics = PoolMetrics()
+engine = create_app_engine(settings.DATABASE_URL, pool_metrics)
+
+replica_pool_metrics = PoolMetrics()
+replica_engine: Engine | None = (
+    create_app_engine(settings.DATABASE_REPLICA_URL, replica_pool_metrics)
+    if settings.DATABASE_REPLICA_URL
+    else None
+)
+
 SessionLocal = sessionmaker(
-    autocommit=False, autoflush=False, bind=engine, class_=Session
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    class_=RoutingSession,
+    replica_bind=replica_engine,
+    sticky_seconds=settings.DB_REPLICA_STICKY_SECONDS,
 )
 
+# Streamlit session_state key carrying read-your-writes stickiness across reruns.
+PRIMARY_UNTIL_STATE_KEY = "_db_primary_until"
+
+_current_session: ContextVar[Session | None] = ContextVar(
+    "carelink_current_session", default=None
+)
+
+
+def get_pool_metrics(replica: bool = False) -> PoolMetricsSnapshot | None:
+    """Return pool checkout and wait metrics for the primary or replica engine."""
+    if replica:
+        if replica_engine is None:
+            return None
+        return snapshot_pool_metrics(replica_engine, replica_pool_metrics)
+    return snapshot_pool_metrics(engine, pool_metrics)
+
+
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """Provide the single session for the current Streamlit rerun.
+
+    The outermost scope opens a session and closes it on exit. Nested scopes,
+    e.g. inside a button handler, reuse that session instead of checking out
+    a second pooled connection. A commit made during the rerun keeps the
+    user's reads on the primary for the configured sticky window.
+    """
+    current = _current_session.get()
+    if current is not None:
+        yield current
+        return
+
+    db = SessionLocal()
+    db.info[PRIMARY_UNTIL_KEY] = st.session_state.get(PRIMARY_UNTIL_STATE_KEY, 0.0)
+    token = _current_session.set(db)
+    try:
+        yield db
+    finally:
+        _current_session.reset(token)
+        st.session_state[PRIMARY_UNTIL_STATE_KEY] = db.info.get(PRIMARY_UNTIL_KEY, 0.0)
+        db.close()
+
 
 def get_db() -> Generator[Session, None, None]:
     """Provide a transactional scope around a series of operations."""
@@ -0,0 +1,150 @@
+"""Keep materialized unread counters in step with their source rows.
+
+Notifications and doctor messages written through the ORM unit of work are
+tracked by mapper events, which run on the flushing connection and so
+commit or roll back with the change itself. Bulk statements do not fire
+mapper events; repositories issuing them call :func:`adjust_unread` with an
+``UPDATE``'s rowcount, or :func:`increment_unread_many` with the owners of
+bulk-inserted rows, in the same transaction instead.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Sequence
+
+from sqlalchemy import Connection, case, event, inspect, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.models.doctor_message import DoctorMessage
+from app.models.notification import Notification
+from app.models.unread_counter import DoctorUnreadCounter, PatientUnreadCounter
+
+_COUNTERS = {
+    Notification: (
+        PatientUnreadCounter,
+        "patient_id",
+        PatientUnreadCounter.patient_id,
+        PatientUnreadCounter.unread_notifications,
+    ),
+    DoctorMessage: (
+        DoctorUnreadCounter,
+        "doctor_id",
+        DoctorUnreadCounter.doctor_id,
+        DoctorUnreadCounter.unread_messages,
+    ),
+}
+
+_UPSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def adjust_unread(
+    connection: Connection, source: type, owner_id: int, delta: int
+) -> None:
+    """Add ``delta`` to the unread counter for a notification or message owner.
+
+    Increments upsert the counter row; decrements never take it below zero.
+    """
+    if not delta:
+        return
+    model, owner_key, owner_column, count_column = _COUNTERS[source]
+    if delta < 0:
+        connection.execute(
+            update(model)
+            .where(owner_column == owner_id)
+            .values(
+                {
+                    count_column: case(
+                        (count_column + delta < 0, 0), else_=count_column + delta
+                    )
+                }
+            )
+        )
+        return
+
+    upsert = _UPSERTS.get(connection.dialect.name)
+    if upsert is not None:
+        statement = upsert(model).values({owner_key: owner_id, count_column: delta})
+        connection.execute(
+            statement.on_conflict_do_update(
+                index_elements=[owner_column],
+                set_={count_column.key: count_column + delta},
+            )
+        )
+        return
+    result = connection.execute(
+        update(model)
+        .where(owner_column == owner_id)
+        .values({count_column: count_column + delta})
+    )
+    if not result.rowcount:
+        connection.execute(
+            model.__table__.insert().values({owner_key: owner_id, count_column: delta})
+        )
+
+
+def increment_unread_many(
+    connection: Connection, source: type, owner_ids: Sequence[int]
+) -> None:
+    """Add one to the unread counter of each owner per entry in ``owner_ids``.
+
+    Repeated owners are folded into a single row first, since Postgres
+    rejects a multi-row ``ON CONFLICT DO UPDATE`` that touches the same row
+    twice. On Postgres and SQLite the upsert is sent as one executemany,
+    which the driver batches into multi-row statements.
+    """
+    if not owner_ids:
+        return
+    counts = Counter(owner_ids)
+    model, owner_key, _, count_column = _COUNTERS[source]
+    upsert = _UPSERTS.get(connection.dialect.name)
+    if upsert is None:
+        for owner_id, count in counts.items():
+            adjust_unread(connection, source, owner_id, count)
+        return
+    table = model.__table__
+    statement = upsert(table)
+    connection.execute(
+        statement.on_conflict_do_update(
+            index_elements=[owner_key],
+            set_={
+                count_column.key: table.c[count_column.key]
+                + statement.excluded[count_column.key]
+            },
+        ),
+        [
+            {owner_key: owner_id, count_column.key: count}
+            for owner_id, count in counts.items()
+        ],
+    )
+
+
+def _owner_id(target: Notification | DoctorMessage) -> int:
+    return getattr(target, _COUNTERS[type(target)][1])
+
+
+def _after_insert(mapper, connection: Connection, target) -> None:
+    if not target.is_read:
+        adjust_unread(connection, type(target), _owner_id(target), 1)
+
+
+def _after_update(mapper, connection: Connection, target) -> None:
+    history = inspect(target).attrs.is_read.history
+    if not history.deleted:
+        return
+    was_unread = not history.deleted[0]
+    is_unread = not target.is_read
+    adjust_unread(
+        connection, type(target), _owner_id(target), int(is_unread) - int(was_unread)
+    )
+
+
+def _after_delete(mapper, connection: Connection, target) -> None:
+    if not target.is_read:
+        adjust_unread(connection, type(target), _owner_id(target), -1)
+
+
+for _source in _COUNTERS:
+    event.listen(_source, "after_insert", _after_insert)
+    event.listen(_source, "after_update", _after_update)
+    event.listen(_source, "after_delete", _after_delete)
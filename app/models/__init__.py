@@ -4,22 +4,38 @@ from app.db.base import Base
 from app.models.appointment import Appointment
 from app.models.audit_log import AuditLog
 from app.models.bloodwork import Bloodwork
+from app.models.bloodwork_marker import BloodworkMarker
+from app.models.daily_stats import (
+    DailyAppointmentStat,
+    DailyRegistrationStat,
+    RollupWatermark,
+)
 from app.models.doctor import Doctor
 from app.models.doctor_message import DoctorMessage
 from app.models.notification import Notification
 from app.models.patient import Patient
 from app.models.prescription import Prescription
+from app.models.unread_counter import DoctorUnreadCounter, PatientUnreadCounter
 from app.models.user import User
 
+# Registers the mapper events that maintain the unread counters.
+import app.db.unread_counters  # noqa: E402,F401
+
 __all__ = [
     "Appointment",
     "AuditLog",
     "Base",
     "Bloodwork",
+    "BloodworkMarker",
+    "DailyAppointmentStat",
+    "DailyRegistrationStat",
     "Doctor",
     "DoctorMessage",
+    "DoctorUnreadCounter",
     "Notification",
     "Patient",
+    "PatientUnreadCounter",
     "Prescription",
+    "RollupWatermark",
     "User",
 ]
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, Text
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, TimestampMixin
@@ -16,6 +16,9 @@ if TYPE_CHECKING:
     from app.models.doctor import Doctor
     from app.models.user import User
 
+# Rows that upcoming-appointment lookups touch; matches a partial index.
+ACTIVE_STATUS_PREDICATE = text("status IN ('pending', 'scheduled')")
+
 
 class Appointment(TimestampMixin, Base):
     """Represents an appointment between a patient and doctor."""
@@ -23,7 +26,18 @@ class Appointment(TimestampMixin, Base):
     __tablename__ = "appointments"
     __table_args__ = (
         Index("idx_appointments_scheduled", "scheduled_datetime"),
-        Index("idx_appointments_status", "status"),
+        Index("idx_appointments_status_scheduled", "status", "scheduled_datetime"),
+        Index("idx_appointments_patient_scheduled", "patient_id", "scheduled_datetime"),
+        Index(
+            "idx_appointments_patient_active",
+            "patient_id",
+            "scheduled_datetime",
+            postgresql_where=ACTIVE_STATUS_PREDICATE,
+            sqlite_where=ACTIVE_STATUS_PREDICATE,
+        ),
+        Index("idx_appointments_doctor_scheduled", "doctor_id", "scheduled_datetime"),
+        # Lets the admin rollup refresh find recently changed rows.
+        Index("idx_appointments_updated_at", "updated_at"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
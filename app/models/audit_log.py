@@ -15,12 +15,25 @@ if TYPE_CHECKING:
 
 
 class AuditLog(Base):
-    """Represents an auditable action performed by a user."""
+    """Represents an auditable action performed by a user.
+
+    On PostgreSQL the table is range-partitioned by month on ``timestamp``
+    with primary key ``(id, timestamp)`` (migration 008); filter on
+    ``timestamp`` so queries prune to the partitions they need.
+    """
 
     __tablename__ = "audit_logs"
     __table_args__ = (
-        Index("idx_audit_action", "action"),
         Index("idx_audit_timestamp", "timestamp"),
+        Index("idx_audit_user_timestamp", "user_id", "timestamp", "id"),
+        Index("idx_audit_action_timestamp", "action", "timestamp", "id"),
+        Index(
+            "idx_audit_resource_timestamp",
+            "resource_type",
+            "resource_id",
+            "timestamp",
+            "id",
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -32,7 +45,7 @@ class AuditLog(Base):
     ip_address: Mapped[str | None] = mapped_column(String(45))
     user_agent: Mapped[str | None] = mapped_column(String(255))
     timestamp: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), nullable=False, server_default=func.now()
     )
 
     user: Mapped["User"] = relationship("User", back_populates="audit_logs")
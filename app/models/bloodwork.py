@@ -13,6 +13,7 @@ from app.db.base import Base, TimestampMixin
 if TYPE_CHECKING:
     from app.models.patient import Patient
     from app.models.doctor import Doctor
+    from app.models.bloodwork_marker import BloodworkMarker
 
 
 class Bloodwork(TimestampMixin, Base):
@@ -31,6 +32,8 @@ class Bloodwork(TimestampMixin, Base):
     published_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     approved_by: Mapped[int | None] = mapped_column(ForeignKey("doctors.id"))
     approved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    normalized: Mapped[dict | None] = mapped_column(JSON)
+    normalized_version: Mapped[int | None] = mapped_column(Integer)
 
     patient: Mapped["Patient"] = relationship(
         "Patient", back_populates="bloodwork_results"
@@ -38,3 +41,9 @@ class Bloodwork(TimestampMixin, Base):
     approved_by_doctor: Mapped["Doctor | None"] = relationship(
         "Doctor", back_populates="bloodwork_reviews"
     )
+    markers: Mapped[list["BloodworkMarker"]] = relationship(
+        "BloodworkMarker",
+        back_populates="bloodwork",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
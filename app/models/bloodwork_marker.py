@@ -0,0 +1,43 @@
+"""Bloodwork marker observation model."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Date, Float, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import Base
+
+if TYPE_CHECKING:
+    from app.models.bloodwork import Bloodwork
+
+
+class BloodworkMarker(Base):
+    """One marker value extracted from a bloodwork result."""
+
+    __tablename__ = "bloodwork_markers"
+    __table_args__ = (
+        Index(
+            "idx_bloodwork_markers_patient_marker_date",
+            "patient_id",
+            "marker_key",
+            "test_date",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    bloodwork_id: Mapped[int] = mapped_column(
+        ForeignKey("bloodwork.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    patient_id: Mapped[int] = mapped_column(ForeignKey("patients.id"), nullable=False)
+    marker_key: Mapped[str] = mapped_column(String(100), nullable=False)
+    name: Mapped[str] = mapped_column(String(255))
+    value: Mapped[float | None] = mapped_column(Float)
+    value_text: Mapped[str | None] = mapped_column(String(255))
+    unit: Mapped[str | None] = mapped_column(String(50))
+    status: Mapped[str] = mapped_column(String(20))
+    test_date: Mapped[date] = mapped_column(Date, nullable=False)
+
+    bloodwork: Mapped["Bloodwork"] = relationship("Bloodwork", back_populates="markers")
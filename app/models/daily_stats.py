@@ -0,0 +1,62 @@
+"""Pre-aggregated daily rollups for the admin dashboard."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, Enum, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.utils.constants import AppointmentStatus, UserRole
+
+
+class DailyAppointmentStat(Base):
+    """Number of appointments scheduled on a UTC day, per status."""
+
+    __tablename__ = "daily_appointment_stats"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    status: Mapped[AppointmentStatus] = mapped_column(
+        Enum(
+            AppointmentStatus,
+            name="appointmentstatus",
+            create_type=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
+        primary_key=True,
+    )
+    appointment_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class DailyRegistrationStat(Base):
+    """Number of users registered on a UTC day, per role."""
+
+    __tablename__ = "daily_registration_stats"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    role: Mapped[UserRole] = mapped_column(
+        Enum(
+            UserRole,
+            name="userrole",
+            create_type=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
+        primary_key=True,
+    )
+    user_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class RollupWatermark(Base):
+    """When a rollup last read its source table.
+
+    The next incremental refresh only looks at source rows changed since
+    ``refreshed_at`` (minus a small overlap for in-flight transactions).
+    """
+
+    __tablename__ = "rollup_watermarks"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
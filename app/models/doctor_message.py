@@ -25,7 +25,8 @@ class DoctorMessage(TimestampMixin, Base):
     sent_by: Mapped[int | None] = mapped_column(ForeignKey("users.id"))
     title: Mapped[str] = mapped_column(String(255))
     message: Mapped[str] = mapped_column(Text)
-    is_read: Mapped[bool] = mapped_column(Boolean, default=False)
+    # Old values are loaded on change so the unread counters can diff them.
+    is_read: Mapped[bool] = mapped_column(Boolean, default=False, active_history=True)
     read_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
     doctor: Mapped["Doctor"] = relationship("Doctor", back_populates="messages")
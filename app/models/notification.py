@@ -5,7 +5,16 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, TimestampMixin
@@ -20,6 +29,10 @@ class Notification(TimestampMixin, Base):
     """Represents a patient notification."""
 
     __tablename__ = "notifications"
+    __table_args__ = (
+        Index("idx_notifications_patient_id", "patient_id", "id"),
+        Index("idx_notifications_patient_updated", "patient_id", "updated_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     patient_id: Mapped[int] = mapped_column(ForeignKey("patients.id"), nullable=False)
@@ -33,7 +46,8 @@ class Notification(TimestampMixin, Base):
     )
     title: Mapped[str] = mapped_column(String(255))
     message: Mapped[str] = mapped_column(Text)
-    is_read: Mapped[bool] = mapped_column(Boolean, default=False)
+    # Old values are loaded on change so the unread counters can diff them.
+    is_read: Mapped[bool] = mapped_column(Boolean, default=False, active_history=True)
     read_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     action_url: Mapped[str | None] = mapped_column(String(255))
     triggered_by: Mapped[int | None] = mapped_column(ForeignKey("users.id"))
@@ -0,0 +1,34 @@
+"""Materialized unread counters for patient notifications and doctor messages."""
+
+from __future__ import annotations
+
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class PatientUnreadCounter(Base):
+    """Number of unread notifications for a patient."""
+
+    __tablename__ = "patient_unread_counters"
+
+    patient_id: Mapped[int] = mapped_column(
+        ForeignKey("patients.id", ondelete="CASCADE"), primary_key=True
+    )
+    unread_notifications: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
+
+class DoctorUnreadCounter(Base):
+    """Number of unread admin messages for a doctor."""
+
+    __tablename__ = "doctor_unread_counters"
+
+    doctor_id: Mapped[int] = mapped_column(
+        ForeignKey("doctors.id", ondelete="CASCADE"), primary_key=True
+    )
+    unread_messages: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
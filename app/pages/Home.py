@@ -7,7 +7,7 @@ from pathlib import Path
 
 import streamlit as st
 
-from app.db.session import SessionLocal
+from app.db.session import session_scope
 from app.schemas.user import UserResponse
 from app.security.session_manager import init_session_state, set_user
 from app.services.auth_service import authenticate_user
@@ -56,8 +56,7 @@ def _handle_login(email: str, password: str) -> None:
     if not email or not password:
         st.error("Please enter both email and password.")
         return
-    db = SessionLocal()
-    try:
+    with session_scope() as db:
         user = authenticate_user(db, email=email, password=password)
         if user is None:
             st.error("Invalid credentials. Please try again.")
@@ -75,8 +74,6 @@ def _handle_login(email: str, password: str) -> None:
             st.switch_page("pages/admin_1_Dashboard.py")
         else:
             st.error(f"Unknown role: {role}")
-    finally:
-        db.close()
 
 
 def main() -> None:
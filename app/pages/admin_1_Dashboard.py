@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import streamlit as st
 
+from app.db.session import session_scope
+from app.services.admin_service import AdminService
 from app.ui.layouts.dashboard_layout import apply_dashboard_layout
 from app.ui.components.page_header import render_page_header
 
@@ -14,13 +16,17 @@ if not apply_dashboard_layout("Admin Dashboard", ["admin"]):
 render_page_header("Admin Dashboard", "System overview and operational metrics.")
 st.markdown("---")
 
+with session_scope() as db:
+    dashboard = AdminService(db).get_dashboard(days=max(AdminService.ACTIVITY_WINDOWS))
+overview = dashboard.overview
+
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
     st.markdown(
-        """
+        f"""
         <div class="stat-card">
-            <div class="stat-number">1,248</div>
+            <div class="stat-number">{overview.total_patients:,}</div>
             <div class="stat-label">Total Patients</div>
         </div>
         """,
@@ -29,9 +35,9 @@ with col1:
 
 with col2:
     st.markdown(
-        """
+        f"""
         <div class="stat-card">
-            <div class="stat-number">42</div>
+            <div class="stat-number">{overview.total_doctors:,}</div>
             <div class="stat-label">Total Doctors</div>
         </div>
         """,
@@ -40,9 +46,9 @@ with col2:
 
 with col3:
     st.markdown(
-        """
+        f"""
         <div class="stat-card">
-            <div class="stat-number">86</div>
+            <div class="stat-number">{overview.today_appointments:,}</div>
             <div class="stat-label">Today's Appointments</div>
         </div>
         """,
@@ -51,9 +57,9 @@ with col3:
 
 with col4:
     st.markdown(
-        """
+        f"""
         <div class="stat-card">
-            <div class="stat-number">5</div>
+            <div class="stat-number">{overview.pending_approvals:,}</div>
             <div class="stat-label">Pending Approvals</div>
         </div>
         """,
@@ -65,12 +71,21 @@ st.markdown("---")
 tab_overview, tab_users, tab_system = st.tabs(["Analytics", "Users", "System Health"])
 
 with tab_overview:
-    st.markdown("### Weekly Activity")
+    st.markdown("### Activity")
+    window = st.radio(
+        "Activity window",
+        AdminService.ACTIVITY_WINDOWS,
+        format_func=lambda days: f"Last {days} days",
+        horizontal=True,
+    )
+    activity = dashboard.activity[-window:]
     st.line_chart(
         {
-            "Appointments": [50, 80, 65, 90, 120, 110, 140],
-            "Registrations": [8, 12, 10, 15, 18, 20, 17],
-        }
+            "Day": [item.day for item in activity],
+            "Appointments": [item.appointments for item in activity],
+            "Registrations": [item.registrations for item in activity],
+        },
+        x="Day",
     )
 
 with tab_users:
@@ -6,7 +6,7 @@ from html import escape
 
 import streamlit as st
 
-from app.db.session import SessionLocal
+from app.db.session import session_scope
 from app.db.repositories.doctor_repository import DoctorRepository
 from app.services.appointment_service import AppointmentService
 from app.ui.layouts.dashboard_layout import apply_dashboard_layout
@@ -21,8 +21,7 @@ if "assignment_success" not in st.session_state:
     st.session_state.assignment_success = False
 
 # Database session
-db = SessionLocal()
-try:
+with session_scope() as db:
     appointment_service = AppointmentService(db)
     doctor_repo = DoctorRepository(db)
 
@@ -156,6 +155,3 @@ try:
     with tab2:
         st.markdown("**All Scheduled Appointments**")
         st.info("Full appointment list coming soon...")
-
-finally:
-    db.close()
@@ -2,14 +2,165 @@
 
 from __future__ import annotations
 
+import io
+import json
+from datetime import date, datetime, time, timedelta, timezone
+
 import streamlit as st
 
+from app.config import get_settings
+from app.db.session import session_scope
+from app.security.audit import AuditAction
+from app.services.audit_service import AuditSearch, AuditService
 from app.ui.layouts.dashboard_layout import apply_dashboard_layout
 from app.ui.components.page_header import render_page_header
 
+PAGE_SIZE = 250
+ALL_ACTIONS = "All actions"
+EXPORT_STATE_KEY = "audit_export"
+EXPORT_MAX_ROWS = get_settings().AUDIT_EXPORT_MAX_ROWS
+
+
+def _day_start(value: date) -> datetime:
+    return datetime.combine(value, time.min).replace(tzinfo=timezone.utc)
+
 
 if not apply_dashboard_layout("Audit Log", ["admin"]):
     st.stop()
 
 render_page_header("Audit Log", "Review and filter audited actions.")
-st.write("Content coming soon.")
+
+# Cursors of the pages before the current one; the last entry opens it.
+if "audit_cursors" not in st.session_state:
+    st.session_state.audit_cursors = []
+if "audit_search" not in st.session_state:
+    st.session_state.audit_search = AuditSearch()
+
+with st.form("audit_filters"):
+    col1, col2, col3 = st.columns(3)
+    today = date.today()
+    with col1:
+        window = st.date_input(
+            "Date range",
+            value=(today - timedelta(days=6), today),
+            max_value=today,
+        )
+        user_email = st.text_input("User email")
+    with col2:
+        action = st.selectbox(
+            "Action", [ALL_ACTIONS, *(item.value for item in AuditAction)]
+        )
+        resource_type = st.text_input("Resource type")
+    with col3:
+        resource_id = st.number_input(
+            "Resource ID", min_value=0, value=None, step=1, format="%d"
+        )
+    submitted = st.form_submit_button("Search", type="primary")
+    if submitted and not window:
+        st.warning("Choose a date range to search.")
+    elif submitted:
+        start, end = window if len(window) == 2 else (window[0], window[0])
+        st.session_state.audit_search = AuditSearch(
+            since=_day_start(start),
+            until=_day_start(end + timedelta(days=1)),
+            user_email=user_email or None,
+            action=None if action == ALL_ACTIONS else action,
+            resource_type=resource_type.strip() or None,
+            resource_id=int(resource_id) if resource_id is not None else None,
+        )
+        st.session_state.audit_cursors = []
+
+with st.expander("Export"):
+    col1, col2 = st.columns(2)
+    today = date.today()
+    with col1:
+        export_window = st.date_input(
+            "Export range",
+            value=(today - timedelta(days=29), today),
+            max_value=today,
+            key="audit_export_window",
+        )
+    with col2:
+        export_format = st.radio("Format", ["csv", "parquet"], horizontal=True)
+    prepare = st.button("Prepare export")
+    if prepare and not export_window:
+        st.warning("Choose a date range to export.")
+    elif prepare:
+        start, end = (
+            export_window if len(export_window) == 2 else (export_window[0],) * 2
+        )
+        # Built in memory, so no copy of the audit data is left on disk.
+        sink = io.BytesIO()
+        with session_scope() as db:
+            service = AuditService(db)
+            export = (
+                service.export_parquet
+                if export_format == "parquet"
+                else service.export_csv
+            )
+            since = _day_start(start)
+            until = _day_start(end + timedelta(days=1))
+            count = export(since, until, sink, limit=EXPORT_MAX_ROWS)
+            truncated = count == EXPORT_MAX_ROWS and service.export_is_truncated(
+                since, until, EXPORT_MAX_ROWS
+            )
+        st.session_state[EXPORT_STATE_KEY] = {
+            "data": sink.getvalue(),
+            "file_name": f"audit_logs_{start}_{end}.{export_format}",
+            "count": count,
+            "truncated": truncated,
+        }
+    prepared = st.session_state.get(EXPORT_STATE_KEY)
+    if prepared:
+        if prepared["truncated"]:
+            st.warning(
+                f"Only the first {EXPORT_MAX_ROWS} entries were exported; "
+                "narrow the range to export the rest."
+            )
+        st.download_button(
+            f"Download {prepared['count']} entries",
+            prepared["data"],
+            file_name=prepared["file_name"],
+        )
+
+audit_cursors = st.session_state.audit_cursors
+with session_scope() as db:
+    page = AuditService(db).search(
+        st.session_state.audit_search,
+        page_size=PAGE_SIZE,
+        cursor=audit_cursors[-1] if audit_cursors else None,
+    )
+
+if not page.items:
+    st.info("No audit entries match these filters.")
+    st.stop()
+
+st.dataframe(
+    [
+        {
+            "Time": item.timestamp,
+            "User": item.user_email or str(item.user_id),
+            "Action": item.action,
+            "Resource": item.resource_type,
+            "Resource ID": item.resource_id,
+            "IP address": item.ip_address,
+            "Details": json.dumps(item.details, default=str),
+        }
+        for item in page.items
+    ],
+    use_container_width=True,
+    hide_index=True,
+)
+
+col1, col2, col3 = st.columns([1, 2, 1])
+with col1:
+    if st.button("Newer", disabled=not audit_cursors, key="audit_newer"):
+        audit_cursors.pop()
+        st.rerun()
+with col2:
+    first = len(audit_cursors) * PAGE_SIZE + 1
+    st.caption(f"Entries {first}-{first + len(page.items) - 1}")
+with col3:
+    if st.button("Older", disabled=not page.has_more, key="audit_older"):
+        audit_cursors.append(page.next_cursor)
+        st.rerun()
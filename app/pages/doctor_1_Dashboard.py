@@ -2,21 +2,18 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime, time, timezone
+from datetime import datetime
 from html import escape
 
 import streamlit as st
-from sqlalchemy import func
 
-from app.db.repositories.appointment_repository import AppointmentRepository
-from app.db.repositories.doctor_repository import DoctorRepository
-from app.db.repositories.patient_repository import PatientRepository
-from app.db.session import SessionLocal
-from app.models.bloodwork import Bloodwork
+from app.db.session import session_scope
 from app.models.patient import Patient
+from app.services.doctor_service import DoctorService
 from app.ui.components.page_header import render_page_header
 from app.ui.layouts.dashboard_layout import apply_dashboard_layout
-from app.utils.constants import AppointmentStatus
+
+SCHEDULE_LIMIT = 6
 
 
 def _format_time(value: datetime) -> str:
@@ -42,63 +39,26 @@ if not apply_dashboard_layout("Doctor Dashboard", ["doctor"]):
 
 user_id = st.session_state.get("user_id")
 doctor_name = st.session_state.get("user_name", "Doctor")
-appointments_today: list = []
 upcoming_appointments: list = []
-patients: list[Patient] = []
-pending_reviews = 0
+appointments_count = 0
+patients_count = 0
+priority_tasks = 0
 unread_messages = 0
 
-db = SessionLocal()
-try:
-    doctor_repo = DoctorRepository(db)
-    appointment_repo = AppointmentRepository(db)
-    patient_repo = PatientRepository(db)
+with session_scope() as db:
+    doctor_service = DoctorService(db)
 
-    doctor = doctor_repo.get_by_user_id(user_id) if user_id else None
+    doctor = doctor_service.get_doctor_by_user_id(user_id) if user_id else None
     if doctor:
         doctor_name = f"{doctor.first_name} {doctor.last_name}".strip() or doctor_name
-        patients = patient_repo.get_by_doctor_id(doctor.id)
-
-        today = date.today()
-        start_of_day = datetime.combine(today, time.min).replace(tzinfo=timezone.utc)
-        end_of_day = datetime.combine(today, time.max).replace(tzinfo=timezone.utc)
-
-        appointments_today = appointment_repo.get_doctor_appointments(
-            doctor.id, start_of_day, end_of_day
-        )
-        appointments_today = [
-            appointment
-            for appointment in appointments_today
-            if appointment.status
-            in {AppointmentStatus.PENDING, AppointmentStatus.SCHEDULED}
-        ]
-
-        upcoming_appointments = appointment_repo.get_doctor_appointments(
-            doctor.id, datetime.now(timezone.utc)
+        stats = doctor_service.get_dashboard_stats(doctor.id)
+        appointments_count = stats.upcoming_appointments
+        patients_count = stats.assigned_patients
+        priority_tasks = stats.today_appointments + stats.pending_reviews
+        unread_messages = stats.unread_messages
+        upcoming_appointments = doctor_service.get_upcoming_schedule(
+            doctor.id, SCHEDULE_LIMIT
         )
-        upcoming_appointments = [
-            appointment
-            for appointment in upcoming_appointments
-            if appointment.status
-            in {AppointmentStatus.PENDING, AppointmentStatus.SCHEDULED}
-        ]
-
-        pending_reviews = (
-            db.query(func.count(Bloodwork.id))
-            .join(Patient, Patient.id == Bloodwork.patient_id)
-            .filter(
-                Patient.doctor_id == doctor.id,
-                Bloodwork.is_published.is_(False),
-            )
-            .scalar()
-            or 0
-        )
-finally:
-    db.close()
-
-appointments_count = len(upcoming_appointments)
-patients_count = len(patients)
-priority_tasks = len(appointments_today) + pending_reviews
 
 render_page_header(
     f"Welcome back, Dr. {doctor_name}!",
@@ -168,7 +128,7 @@ with col_left:
     st.markdown("### Upcoming Schedule")
     if upcoming_appointments:
         schedule_rows = []
-        for appointment in upcoming_appointments[:6]:
+        for appointment in upcoming_appointments:
             patient_name = escape(_patient_name(appointment.patient))
             schedule_rows.append(
                 f"<div class='schedule-row'>"
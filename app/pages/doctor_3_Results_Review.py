@@ -9,7 +9,7 @@ import streamlit as st
 
 from app.db.repositories.doctor_repository import DoctorRepository
 from app.db.repositories.patient_repository import PatientRepository
-from app.db.session import SessionLocal
+from app.db.session import session_scope
 from app.services.bloodwork_service import BloodworkService
 from app.ui.layouts.dashboard_layout import apply_dashboard_layout
 from app.ui.components.page_header import render_page_header
@@ -300,8 +300,7 @@ def _show_publish_dialog() -> None:
         st.rerun()
 
 
-db = SessionLocal()
-try:
+with session_scope() as db:
     doctor_repo = DoctorRepository(db)
     patient_repo = PatientRepository(db)
     bloodwork_service = BloodworkService(db)
@@ -358,18 +357,17 @@ try:
             )
             submitted = st.form_submit_button("Next")
 
-        selected_panel_key = next(
-            panel["key"] for panel in panels if panel["name"] == selected_panel_name
-        )
+        selected_panel_key = bloodwork_service.get_panel_by_name(selected_panel_name)[
+            "key"
+        ]
 
         if submitted:
-            if st.session_state.bloodwork_panel_key != selected_panel_key:
-                for panel in panels:
-                    for marker in panel.get("markers", []):
-                        marker_key = marker.get("key", marker.get("name"))
-                        state_key = f"bloodwork_value_{marker_key}"
-                        if state_key in st.session_state:
-                            st.session_state.pop(state_key)
+            previous_panel_key = st.session_state.bloodwork_panel_key
+            if previous_panel_key and previous_panel_key != selected_panel_key:
+                for marker_key in bloodwork_service.get_panel_marker_keys(
+                    previous_panel_key
+                ):
+                    st.session_state.pop(f"bloodwork_value_{marker_key}", None)
             st.session_state.bloodwork_patient_id = selected_patient_id
             st.session_state.bloodwork_panel_key = selected_panel_key
             st.session_state.bloodwork_test_date = selected_date
@@ -542,7 +540,7 @@ try:
             _reset_flow()
             st.rerun()
 
-        normalized = bloodwork_service.normalize_bloodwork(bloodwork)
+        normalized = bloodwork_service.get_normalized(bloodwork)
         categories = normalized.get("categories", [])
         category = categories[0] if categories else {"markers": []}
 
@@ -636,5 +634,3 @@ try:
                 st.session_state.bloodwork_publish_success = True
                 _reset_flow()
                 st.rerun()
-finally:
-    db.close()
@@ -7,9 +7,10 @@ from html import escape
 
 import streamlit as st
 
-from app.db.session import SessionLocal
+from app.db.session import session_scope
 from app.services.patient_service import PatientService
 from app.ui.layouts.dashboard_layout import apply_dashboard_layout
+from app.ui.components.notification_bell import render_notification_bell
 from app.ui.components.page_header import render_page_header
 
 
@@ -26,17 +27,17 @@ first_name = (
 )
 
 # Initialize database session and load real data
-db = SessionLocal()
-try:
+with session_scope() as db:
     patient_service = PatientService(db)
 
     # Get patient profile
-    patient = patient_service.get_patient_by_user_id(user_id) if user_id else None
+    patient = patient_service.get_patient_summary(user_id) if user_id else None
 
     if patient:
-        # Get real dashboard stats
-        stats = patient_service.get_dashboard_stats(patient.id)
-        next_appt_info = patient_service.get_next_appointment_info(patient.id)
+        # Get real dashboard stats and next appointment in one query
+        overview = patient_service.get_dashboard_overview(patient.id)
+        stats = overview.stats
+        next_appt_info = overview.next_appointment
 
         # Use real first name from patient record
         first_name = patient.first_name
@@ -44,8 +45,6 @@ try:
         # Fallback to default stats if patient not found
         stats = None
         next_appt_info = None
-finally:
-    db.close()
 
 # Current time for greeting
 hour = datetime.now().hour
@@ -64,6 +63,9 @@ render_page_header(
     "Welcome back to your health dashboard. Here's what's happening today.",
 )
 
+if patient:
+    render_notification_bell(patient.id)
+
 # Quick Stats Row
 st.markdown(
     '<p style="color: #64748b; font-weight: 600; text-transform: uppercase; letter-spacing: 1px; font-size: 12px; margin-bottom: 16px;">Your Health Summary</p>',
@@ -8,13 +8,12 @@ import re
 
 import streamlit as st
 
-from app.db.session import SessionLocal
+from app.db.session import session_scope
 from app.services.bloodwork_service import BloodworkService
 from app.services.patient_service import PatientService
 from app.ui.layouts.dashboard_layout import apply_dashboard_layout
 from app.ui.components.page_header import render_page_header
 
-
 if not apply_dashboard_layout("Bloodwork", ["patient"]):
     st.stop()
 
@@ -60,6 +59,7 @@ STATUS_STYLES = {
 }
 
 _TAG_PATTERN = re.compile(r"<[^>]*>")
+TREND_MAX_POINTS = 60
 
 
 def _range_positions(
@@ -129,8 +129,7 @@ if st.session_state.bloodwork_view not in {"panels", "markers"}:
 
 user_id = st.session_state.get("user_id")
 
-db = SessionLocal()
-try:
+with session_scope() as db:
     patient_service = PatientService(db)
     bloodwork_service = BloodworkService(db)
 
@@ -140,11 +139,24 @@ try:
         st.stop()
 
     bloodwork_results = bloodwork_service.get_published_results(patient.id)
-    normalized = {
-        bw.id: bloodwork_service.normalize_bloodwork(bw) for bw in bloodwork_results
-    }
-finally:
-    db.close()
+    normalized = {bw.id: bw.normalized for bw in bloodwork_results}
+
+    marker_series: dict = {}
+    if st.session_state.bloodwork_view == "markers":
+        selected_payload = normalized.get(st.session_state.selected_bloodwork_id) or {}
+        selected_categories = selected_payload.get("categories", [])
+        selected_index = st.session_state.selected_category_index or 0
+        if selected_index < len(selected_categories):
+            marker_series = bloodwork_service.get_marker_series_many(
+                patient.id,
+                [
+                    bloodwork_service.get_marker_key(
+                        selected_payload.get("test_name"), marker
+                    )
+                    for marker in selected_categories[selected_index].get("markers", [])
+                ],
+                max_points=TREND_MAX_POINTS,
+            )
 
 render_page_header(
     "Bloodwork Results",
@@ -222,7 +234,7 @@ if st.session_state.bloodwork_view == "panels":
         for panel in panel_cards[start:end]:
             bw = panel["bloodwork"]
             category = panel["category"]
-            cat_summary = bloodwork_service.summarize_category(category)
+            cat_summary = bloodwork_service.get_summary(category)
             doctor = bw.approved_by_doctor
             doctor_name = (
                 f"Dr. {doctor.first_name} {doctor.last_name}"
@@ -383,3 +395,17 @@ elif st.session_state.bloodwork_view == "markers":
             ]
         )
         st.markdown(card_html, unsafe_allow_html=True)
+
+        trend = marker_series.get(
+            bloodwork_service.get_marker_key(data.get("test_name"), marker), []
+        )
+        if len(trend) > 1:
+            with st.expander(f"{marker.get('name', 'Marker')} over time"):
+                st.line_chart(
+                    {
+                        "Date": [point.test_date for point in trend],
+                        "Value": [point.value for point in trend],
+                    },
+                    x="Date",
+                    y="Value",
+                )
@@ -6,7 +6,7 @@ from html import escape
 
 import streamlit as st
 
-from app.db.session import SessionLocal
+from app.db.session import session_scope
 from app.services.patient_service import PatientService
 from app.services.prescription_service import PrescriptionService
 from app.ui.layouts.dashboard_layout import apply_dashboard_layout
@@ -18,8 +18,7 @@ if not apply_dashboard_layout("Prescriptions", ["patient"]):
 
 user_id = st.session_state.get("user_id")
 
-db = SessionLocal()
-try:
+with session_scope() as db:
     patient_service = PatientService(db)
     prescription_service = PrescriptionService(db)
 
@@ -30,8 +29,6 @@ try:
 
     active_prescriptions = prescription_service.get_active_prescriptions(patient.id)
     history_prescriptions = prescription_service.get_prescription_history(patient.id)
-finally:
-    db.close()
 
 render_page_header(
     "Prescriptions",
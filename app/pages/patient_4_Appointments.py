@@ -3,20 +3,18 @@
 from __future__ import annotations
 
 import calendar
-import math
 from datetime import datetime, date, timezone
 from html import escape
 
 import streamlit as st
 
-from app.db.session import SessionLocal
+from app.db.session import session_scope
 from app.services.appointment_service import AppointmentService
 from app.services.patient_service import PatientService
 from app.ui.layouts.dashboard_layout import apply_dashboard_layout
 from app.ui.components.page_header import render_page_header
 from app.utils.constants import AppointmentStatus
 
-
 if not apply_dashboard_layout("Appointments", ["patient"]):
     st.stop()
 
@@ -35,10 +33,11 @@ if "calendar_month" not in st.session_state:
     st.session_state.calendar_month = date.today().month
 if "calendar_year" not in st.session_state:
     st.session_state.calendar_year = date.today().year
-if "history_page" not in st.session_state:
-    st.session_state.history_page = 0
-if "upcoming_page" not in st.session_state:
-    st.session_state.upcoming_page = 0
+# Cursors of the pages before the current one; the last entry opens it.
+if "history_cursors" not in st.session_state:
+    st.session_state.history_cursors = []
+if "upcoming_cursors" not in st.session_state:
+    st.session_state.upcoming_cursors = []
 
 # Check for tab navigation from other pages
 default_tab_index = 0  # Default to "My Appointments" tab
@@ -52,12 +51,11 @@ if "appointments_tab" in st.session_state:
 user_id = st.session_state.get("user_id")
 
 # Initialize database session
-db = SessionLocal()
-try:
+with session_scope() as db:
     patient_service = PatientService(db)
     appointment_service = AppointmentService(db)
 
-    patient = patient_service.get_patient_by_user_id(user_id) if user_id else None
+    patient = patient_service.get_patient_summary(user_id) if user_id else None
 
     if not patient:
         st.error("Patient profile not found.")
@@ -88,21 +86,25 @@ try:
 
         # Pagination settings for upcoming
         UPCOMING_PER_PAGE = 3
-        total_upcoming = appointment_service.count_patient_upcoming_appointments(
-            patient.id
+        upcoming_cursors = st.session_state.upcoming_cursors
+        upcoming_page = appointment_service.get_patient_upcoming_page(
+            patient.id,
+            UPCOMING_PER_PAGE,
+            cursor=upcoming_cursors[-1] if upcoming_cursors else None,
         )
-        total_upcoming_pages = max(1, math.ceil(total_upcoming / UPCOMING_PER_PAGE))
-
-        # Ensure current page is valid
-        if st.session_state.upcoming_page >= total_upcoming_pages:
-            st.session_state.upcoming_page = max(0, total_upcoming_pages - 1)
 
-        # Get paginated upcoming appointments
-        upcoming_offset = st.session_state.upcoming_page * UPCOMING_PER_PAGE
-        upcoming_appointments = (
-            appointment_service.get_patient_upcoming_appointments_paginated(
-                patient.id, limit=UPCOMING_PER_PAGE, offset=upcoming_offset
-            )
+        # Fall back to the first page if the cursor's page has emptied
+        if not upcoming_page.items and upcoming_cursors:
+            upcoming_cursors.clear()
+            st.rerun()
+
+        upcoming_appointments = upcoming_page.items
+        upcoming_total = appointment_service.estimate_patient_upcoming_total(patient.id)
+        total_upcoming_pages = upcoming_total.page_count(UPCOMING_PER_PAGE)
+        upcoming_pages_label = (
+            f"{total_upcoming_pages}"
+            if upcoming_total.is_exact
+            else f"{total_upcoming_pages}+"
         )
 
         if upcoming_appointments:
@@ -156,7 +158,7 @@ try:
                 )
 
             # Pagination controls for upcoming
-            if total_upcoming_pages > 1:
+            if upcoming_cursors or upcoming_page.has_more:
                 st.markdown("<div style='height: 16px;'></div>", unsafe_allow_html=True)
 
                 col1, col2, col3 = st.columns([1, 2, 1])
@@ -164,26 +166,25 @@ try:
                 with col1:
                     if st.button(
                         "Previous",
-                        disabled=st.session_state.upcoming_page == 0,
+                        disabled=not upcoming_cursors,
                         key="prev_upcoming",
                     ):
-                        st.session_state.upcoming_page -= 1
+                        upcoming_cursors.pop()
                         st.rerun()
 
                 with col2:
                     st.markdown(
-                        f"<p style='text-align: center; color: #64748b; margin: 8px 0;'>Page {st.session_state.upcoming_page + 1} of {total_upcoming_pages}</p>",
+                        f"<p style='text-align: center; color: #64748b; margin: 8px 0;'>Page {len(upcoming_cursors) + 1} of {upcoming_pages_label}</p>",
                         unsafe_allow_html=True,
                     )
 
                 with col3:
                     if st.button(
                         "Next",
-                        disabled=st.session_state.upcoming_page
-                        >= total_upcoming_pages - 1,
+                        disabled=not upcoming_page.has_more,
                         key="next_upcoming",
                     ):
-                        st.session_state.upcoming_page += 1
+                        upcoming_cursors.append(upcoming_page.next_cursor)
                         st.rerun()
         else:
             st.markdown(
@@ -213,18 +214,22 @@ try:
 
         # Pagination settings
         ITEMS_PER_PAGE = 3
-        total_past = appointment_service.count_patient_past_appointments(patient.id)
-        total_pages = max(1, math.ceil(total_past / ITEMS_PER_PAGE))
+        history_cursors = st.session_state.history_cursors
+        history_page = appointment_service.get_patient_past_page(
+            patient.id,
+            ITEMS_PER_PAGE,
+            cursor=history_cursors[-1] if history_cursors else None,
+        )
 
-        # Ensure current page is valid
-        if st.session_state.history_page >= total_pages:
-            st.session_state.history_page = max(0, total_pages - 1)
+        # Fall back to the first page if the cursor's page has emptied
+        if not history_page.items and history_cursors:
+            history_cursors.clear()
+            st.rerun()
 
-        # Get paginated past appointments
-        offset = st.session_state.history_page * ITEMS_PER_PAGE
-        past_appointments = appointment_service.get_patient_past_appointments(
-            patient.id, limit=ITEMS_PER_PAGE, offset=offset
-        )
+        past_appointments = history_page.items
+        past_total = appointment_service.estimate_patient_past_total(patient.id)
+        total_pages = past_total.page_count(ITEMS_PER_PAGE)
+        pages_label = f"{total_pages}" if past_total.is_exact else f"{total_pages}+"
 
         if past_appointments:
             for appt in past_appointments:
@@ -278,7 +283,7 @@ try:
                 )
 
             # Pagination controls
-            if total_pages > 1:
+            if history_cursors or history_page.has_more:
                 st.markdown("<div style='height: 16px;'></div>", unsafe_allow_html=True)
 
                 col1, col2, col3 = st.columns([1, 2, 1])
@@ -286,25 +291,25 @@ try:
                 with col1:
                     if st.button(
                         "Previous",
-                        disabled=st.session_state.history_page == 0,
+                        disabled=not history_cursors,
                         key="prev_history",
                     ):
-                        st.session_state.history_page -= 1
+                        history_cursors.pop()
                         st.rerun()
 
                 with col2:
                     st.markdown(
-                        f"<p style='text-align: center; color: #64748b; margin: 8px 0;'>Page {st.session_state.history_page + 1} of {total_pages}</p>",
+                        f"<p style='text-align: center; color: #64748b; margin: 8px 0;'>Page {len(history_cursors) + 1} of {pages_label}</p>",
                         unsafe_allow_html=True,
                     )
 
                 with col3:
                     if st.button(
                         "Next",
-                        disabled=st.session_state.history_page >= total_pages - 1,
+                        disabled=not history_page.has_more,
                         key="next_history",
                     ):
-                        st.session_state.history_page += 1
+                        history_cursors.append(history_page.next_cursor)
                         st.rerun()
         else:
             st.markdown(
@@ -678,6 +683,11 @@ try:
                 st.session_state.calendar_year, st.session_state.calendar_month
             )
             today = date.today()
+            free_slots_by_day = appointment_service.get_month_availability(
+                st.session_state.calendar_year,
+                st.session_state.calendar_month,
+                st.session_state.selected_duration,
+            )
 
             # Day headers
             header_cols = st.columns(7)
@@ -709,6 +719,7 @@ try:
                             is_past = current_date < today
                             is_weekend = i == 0 or i == 6
                             is_selected = st.session_state.selected_date == current_date
+                            is_full = free_slots_by_day.get(current_date, 0) == 0
 
                             if is_selected:
                                 st.markdown(
@@ -720,6 +731,11 @@ try:
                                     f"<div style='text-align:center;color:#d1d5db;font-size:14px;padding:8px 0;'>{day}</div>",
                                     unsafe_allow_html=True,
                                 )
+                            elif is_full:
+                                st.markdown(
+                                    f"<div title='Fully booked' style='text-align:center;color:#9ca3af;background:#f3f4f6;border-radius:8px;font-size:14px;padding:8px 0;text-decoration:line-through;'>{day}</div>",
+                                    unsafe_allow_html=True,
+                                )
                             else:
                                 if st.button(
                                     str(day),
@@ -952,6 +968,3 @@ try:
 
             # Call the modal function to display it
             show_confirmation_modal()
-
-finally:
-    db.close()
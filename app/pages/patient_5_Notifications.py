@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from html import escape
 
 import streamlit as st
 
-from app.db.session import SessionLocal
+from app.db.session import session_scope
 from app.services.notification_service import NotificationService
 from app.services.patient_service import PatientService
 from app.ui.layouts.dashboard_layout import apply_dashboard_layout
@@ -26,25 +27,196 @@ TYPE_LABELS = {
 }
 
 
+# Notifications loaded by the last full run; fragment reruns render from here.
+FEED_STATE_KEY = "notifications_feed"
+
+
 def _type_label(raw_type: str) -> str:
     return TYPE_LABELS.get(raw_type, "General")
 
 
+def _mark_read(patient_id: int, notification_id: int) -> None:
+    """Mark one notification read and update the cached feed in place."""
+    with session_scope() as db:
+        NotificationService(db).mark_as_read(notification_id, patient_id)
+    st.session_state[FEED_STATE_KEY] = [
+        replace(item, is_read=True) if item.id == notification_id else item
+        for item in st.session_state[FEED_STATE_KEY]
+    ]
+
+
+def _mark_all_read(patient_id: int) -> None:
+    """Mark every notification read and update the cached feed in place."""
+    with session_scope() as db:
+        NotificationService(db).mark_all_as_read(patient_id)
+    st.session_state[FEED_STATE_KEY] = [
+        replace(item, is_read=True) for item in st.session_state[FEED_STATE_KEY]
+    ]
+
+
+@st.fragment
+def notification_feed(patient_id: int) -> None:
+    """Render the unread badge and notification tabs from the cached feed.
+
+    Button clicks rerun only this fragment: the click handler issues one
+    UPDATE and patches the cached items, so no query reloads the list.
+    """
+    notifications = st.session_state[FEED_STATE_KEY]
+    unread_notifications = [n for n in notifications if not n.is_read]
+
+    unread_count = len(unread_notifications)
+    st.markdown(
+        f"""
+        <div style="margin-bottom: 12px;">
+            <span style="
+                background: {'rgba(59, 130, 246, 0.12)' if unread_count else 'rgba(148, 163, 184, 0.2)'};
+                color: {'#2563eb' if unread_count else '#475569'};
+                padding: 6px 12px;
+                border-radius: 999px;
+                font-size: 14px;
+                font-weight: 700;
+            ">{unread_count} unread</span>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    tab_all, tab_unread = st.tabs(["All", "Unread"])
+
+    with tab_all:
+        if unread_notifications:
+            st.button(
+                "Mark All as Read",
+                use_container_width=True,
+                on_click=_mark_all_read,
+                args=(patient_id,),
+            )
+
+        if not notifications:
+            st.info("You have no notifications.")
+        else:
+            for notification in notifications:
+                raw_type = (
+                    notification.type.value
+                    if hasattr(notification.type, "value")
+                    else str(notification.type)
+                )
+                label = _type_label(raw_type)
+                title = escape(notification.title)
+                message = escape(notification.message)
+                created_at = notification.created_at.strftime("%B %d, %Y")
+                is_unread = not notification.is_read
+
+                st.markdown(
+                    f"""
+                    <div style="
+                        background: white;
+                        border-radius: 16px;
+                        padding: 20px;
+                        margin-bottom: 16px;
+                        border: 1px solid {'#93c5fd' if is_unread else '#e2e8f0'};
+                    ">
+                        <div style="display: flex; justify-content: space-between; align-items: flex-start;">
+                            <div>
+                                <div style="font-size: 14px; text-transform: uppercase; color: #64748b; font-weight: 600;">
+                                    {label}
+                                </div>
+                                <div style="font-size: 18px; font-weight: 700; color: #1e293b; margin-top: 6px;">
+                                    {title}
+                                </div>
+                                <div style="font-size: 16px; color: #475569; margin-top: 8px;">
+                                    {message}
+                                </div>
+                                <div style="font-size: 14px; color: #94a3b8; margin-top: 10px;">
+                                    {created_at}
+                                </div>
+                            </div>
+                            <div style="
+                                background: {'rgba(59, 130, 246, 0.12)' if is_unread else 'rgba(148, 163, 184, 0.2)'};
+                                color: {'#2563eb' if is_unread else '#475569'};
+                                padding: 6px 12px;
+                                border-radius: 999px;
+                                font-size: 14px;
+                                font-weight: 700;
+                            ">{'Unread' if is_unread else 'Read'}</div>
+                        </div>
+                    </div>
+                    """,
+                    unsafe_allow_html=True,
+                )
+
+                if is_unread:
+                    st.button(
+                        "Mark as Read",
+                        key=f"mark_read_{notification.id}",
+                        use_container_width=True,
+                        on_click=_mark_read,
+                        args=(patient_id, notification.id),
+                    )
+
+    with tab_unread:
+        if not unread_notifications:
+            st.info("No unread notifications.")
+        else:
+            for notification in unread_notifications:
+                raw_type = (
+                    notification.type.value
+                    if hasattr(notification.type, "value")
+                    else str(notification.type)
+                )
+                label = _type_label(raw_type)
+                title = escape(notification.title)
+                message = escape(notification.message)
+                created_at = notification.created_at.strftime("%B %d, %Y")
+
+                st.markdown(
+                    f"""
+                    <div style="
+                        background: white;
+                        border-radius: 16px;
+                        padding: 20px;
+                        margin-bottom: 16px;
+                        border: 1px solid #93c5fd;
+                    ">
+                        <div style="font-size: 14px; text-transform: uppercase; color: #64748b; font-weight: 600;">
+                            {label}
+                        </div>
+                        <div style="font-size: 18px; font-weight: 700; color: #1e293b; margin-top: 6px;">
+                            {title}
+                        </div>
+                        <div style="font-size: 16px; color: #475569; margin-top: 8px;">
+                            {message}
+                        </div>
+                        <div style="font-size: 14px; color: #94a3b8; margin-top: 10px;">
+                            {created_at}
+                        </div>
+                    </div>
+                    """,
+                    unsafe_allow_html=True,
+                )
+                st.button(
+                    "Mark as Read",
+                    key=f"mark_read_unread_{notification.id}",
+                    use_container_width=True,
+                    on_click=_mark_read,
+                    args=(patient_id, notification.id),
+                )
+
+
 user_id = st.session_state.get("user_id")
 
-db = SessionLocal()
-try:
+with session_scope() as db:
     patient_service = PatientService(db)
     notification_service = NotificationService(db)
 
-    patient = patient_service.get_patient_by_user_id(user_id) if user_id else None
+    patient = patient_service.get_patient_summary(user_id) if user_id else None
     if not patient:
         st.error("Patient profile not found.")
         st.stop()
 
-    notifications = notification_service.get_notifications(patient.id)
-finally:
-    db.close()
+    st.session_state[FEED_STATE_KEY] = notification_service.get_notifications(
+        patient.id
+    )
 
 render_page_header(
     "Notifications",
@@ -52,134 +224,4 @@ render_page_header(
 )
 st.markdown("---")
 
-unread_notifications = [n for n in notifications if not n.is_read]
-
-tab_all, tab_unread = st.tabs(["All", "Unread"])
-
-with tab_all:
-    if unread_notifications:
-        if st.button("Mark All as Read", use_container_width=True):
-            db = SessionLocal()
-            try:
-                NotificationService(db).mark_all_as_read(patient.id)
-            finally:
-                db.close()
-            st.rerun()
-
-    if not notifications:
-        st.info("You have no notifications.")
-    else:
-        for notification in notifications:
-            raw_type = (
-                notification.type.value
-                if hasattr(notification.type, "value")
-                else str(notification.type)
-            )
-            label = _type_label(raw_type)
-            title = escape(notification.title)
-            message = escape(notification.message)
-            created_at = notification.created_at.strftime("%B %d, %Y")
-            is_unread = not notification.is_read
-
-            st.markdown(
-                f"""
-                <div style="
-                    background: white;
-                    border-radius: 16px;
-                    padding: 20px;
-                    margin-bottom: 16px;
-                    border: 1px solid {'#93c5fd' if is_unread else '#e2e8f0'};
-                ">
-                    <div style="display: flex; justify-content: space-between; align-items: flex-start;">
-                        <div>
-                            <div style="font-size: 14px; text-transform: uppercase; color: #64748b; font-weight: 600;">
-                                {label}
-                            </div>
-                            <div style="font-size: 18px; font-weight: 700; color: #1e293b; margin-top: 6px;">
-                                {title}
-                            </div>
-                            <div style="font-size: 16px; color: #475569; margin-top: 8px;">
-                                {message}
-                            </div>
-                            <div style="font-size: 14px; color: #94a3b8; margin-top: 10px;">
-                                {created_at}
-                            </div>
-                        </div>
-                        <div style="
-                            background: {'rgba(59, 130, 246, 0.12)' if is_unread else 'rgba(148, 163, 184, 0.2)'};
-                            color: {'#2563eb' if is_unread else '#475569'};
-                            padding: 6px 12px;
-                            border-radius: 999px;
-                            font-size: 14px;
-                            font-weight: 700;
-                        ">{'Unread' if is_unread else 'Read'}</div>
-                    </div>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
-
-            if is_unread:
-                if st.button(
-                    "Mark as Read",
-                    key=f"mark_read_{notification.id}",
-                    use_container_width=True,
-                ):
-                    db = SessionLocal()
-                    try:
-                        NotificationService(db).mark_as_read(notification.id)
-                    finally:
-                        db.close()
-                    st.rerun()
-
-with tab_unread:
-    if not unread_notifications:
-        st.info("No unread notifications.")
-    else:
-        for notification in unread_notifications:
-            raw_type = (
-                notification.type.value
-                if hasattr(notification.type, "value")
-                else str(notification.type)
-            )
-            label = _type_label(raw_type)
-            title = escape(notification.title)
-            message = escape(notification.message)
-            created_at = notification.created_at.strftime("%B %d, %Y")
-
-            st.markdown(
-                f"""
-                <div style="
-                    background: white;
-                    border-radius: 16px;
-                    padding: 20px;
-                    margin-bottom: 16px;
-                    border: 1px solid #93c5fd;
-                ">
-                    <div style="font-size: 14px; text-transform: uppercase; color: #64748b; font-weight: 600;">
-                        {label}
-                    </div>
-                    <div style="font-size: 18px; font-weight: 700; color: #1e293b; margin-top: 6px;">
-                        {title}
-                    </div>
-                    <div style="font-size: 16px; color: #475569; margin-top: 8px;">
-                        {message}
-                    </div>
-                    <div style="font-size: 14px; color: #94a3b8; margin-top: 10px;">
-                        {created_at}
-                    </div>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
-            if st.button(
-                "Mark as Read",
-                key=f"mark_read_unread_{notification.id}",
-                use_container_width=True,
-            ):
-                db = SessionLocal()
-                try:
-                    NotificationService(db).mark_as_read(notification.id)
-                finally:
-                    db.close()
-                st.rerun()
+notification_feed(patient.id)
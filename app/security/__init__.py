@@ -1,6 +1,12 @@
 """Security module exports."""
 
-from app.security.audit import AuditAction, audit_log, log_action
+from app.security.audit import (
+    AuditAction,
+    audit_log,
+    flush_audit_log,
+    get_audit_writer_stats,
+    log_action,
+)
 from app.security.auth import (
     generate_session_token,
     get_password_hash_rounds,
@@ -24,7 +30,9 @@ __all__ = [
     "audit_log",
     "check_session_timeout",
     "clear_session",
+    "flush_audit_log",
     "generate_session_token",
+    "get_audit_writer_stats",
     "get_current_user",
     "get_password_hash_rounds",
     "hash_password",
@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import functools
+from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Callable
 
 import streamlit as st
-from sqlalchemy.orm import Session
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
 
+from app.config import get_settings
 from app.models.audit_log import AuditLog
+from app.security.audit_writer import AuditWriter, AuditWriterStats
 
 
 class AuditAction(str, Enum):
@@ -26,6 +31,52 @@ class AuditAction(str, Enum):
     CANCEL_APPOINTMENT = "cancel_appointment"
 
 
+@lru_cache
+def get_audit_writer() -> AuditWriter:
+    """Return the process-wide background audit writer."""
+    from app.db.session import engine
+
+    settings = get_settings()
+    return AuditWriter(
+        engine,
+        capacity=settings.AUDIT_QUEUE_SIZE,
+        batch_size=settings.AUDIT_BATCH_SIZE,
+    )
+
+
+# Rows logged in async mode wait here until the session's transaction ends.
+PENDING_AUDIT_KEY = "pending_audit_rows"
+
+
+@event.listens_for(Session, "after_commit")
+def _submit_pending_audit_rows(session: Session) -> None:
+    rows = session.info.pop(PENDING_AUDIT_KEY, None)
+    if rows:
+        writer = get_audit_writer()
+        for row in rows:
+            writer.submit(row)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_pending_audit_rows(
+    session: Session, transaction: SessionTransaction
+) -> None:
+    # Anything still pending when the outermost transaction ends without a
+    # commit (rollback or close) describes work that never happened.
+    if transaction.parent is None:
+        session.info.pop(PENDING_AUDIT_KEY, None)
+
+
+def get_audit_writer_stats() -> AuditWriterStats:
+    """Return audit queue depth and written/dropped counters."""
+    return get_audit_writer().stats()
+
+
+def flush_audit_log(timeout: float | None = None) -> bool:
+    """Wait for queued audit entries to be written; False on timeout."""
+    return get_audit_writer().flush(timeout)
+
+
 def log_action(
     db: Session,
     user_id: int,
@@ -34,18 +85,31 @@ def log_action(
     resource_id: int | None,
     details: dict[str, Any] | None = None,
 ) -> None:
-    """Persist an audit log entry."""
-    entry = AuditLog(
-        user_id=user_id,
-        action=action,
-        resource_type=resource_type,
-        resource_id=resource_id,
-        details=details or {},
-        ip_address=st.session_state.get("ip_address"),
-        user_agent=st.session_state.get("user_agent"),
-    )
-    db.add(entry)
-    db.flush()
+    """Record an audit log entry.
+
+    By default the entry is held on ``db`` and handed to the background
+    writer once the caller's transaction commits; if it rolls back instead,
+    the entry is discarded. With ``AUDIT_WRITER_MODE=sync`` it is added to
+    ``db`` and flushed in the caller's transaction.
+    """
+    row = {
+        "user_id": user_id,
+        "action": action,
+        "resource_type": resource_type,
+        "resource_id": resource_id,
+        "details": details or {},
+        "ip_address": st.session_state.get("ip_address"),
+        "user_agent": st.session_state.get("user_agent"),
+        "timestamp": datetime.now(timezone.utc),
+    }
+    if get_settings().AUDIT_WRITER_MODE == "sync":
+        db.add(AuditLog(**row))
+        db.flush()
+        return
+    if not db.in_transaction():
+        # Open one so the entry is settled when it commits or ends.
+        db.begin()
+    db.info.setdefault(PENDING_AUDIT_KEY, []).append(row)
 
 
 def audit_log(action: str, resource_type: str) -> Callable:
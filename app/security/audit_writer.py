@@ -0,0 +1,163 @@
+"""Background writer that batches audit log inserts off the request path."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+
+from app.models.audit_log import AuditLog
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AuditWriterStats:
+    """Point-in-time view of the audit writer."""
+
+    queue_depth: int
+    capacity: int
+    written: int
+    dropped: int
+    failed_batches: int
+
+
+class AuditWriter:
+    """Bounded queue of audit rows drained by a worker thread in batches.
+
+    ``submit`` never blocks: when the queue is full the entry is dropped and
+    counted. The worker takes whatever queued up while it was busy, up to
+    ``batch_size`` rows, and inserts it in one executemany on its own
+    connection, so audit writes commit independently of the caller's
+    transaction. A batch that fails to insert is logged and counted as
+    dropped.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        capacity: int,
+        batch_size: int,
+    ) -> None:
+        self.engine = engine
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self._queue: queue.Queue[dict[str, Any] | None] = queue.Queue(capacity)
+        self._idle = threading.Condition()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+        self.written = 0
+        self.dropped = 0
+        self.failed_batches = 0
+
+    def submit(self, row: dict[str, Any]) -> bool:
+        """Queue an audit row; return False if it was dropped."""
+        self._ensure_started()
+        with self._idle:
+            if self._stopping:
+                self.dropped += 1
+                return False
+            self._pending += 1
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            with self._idle:
+                self._pending -= 1
+                self.dropped += 1
+                self._idle.notify_all()
+            logger.warning("Audit queue full; dropped %s entry.", row.get("action"))
+            return False
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued row is written; False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def shutdown(self, timeout: float | None = 5.0) -> None:
+        """Write what is queued, then stop the worker."""
+        with self._idle:
+            if self._stopping:
+                return
+            self._stopping = True
+        if self._thread is None:
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            # The worker is stuck, e.g. on an unreachable database; give up
+            # rather than hang process exit. The thread is a daemon.
+            logger.warning(
+                "Audit writer did not drain in time; %d entries not written.",
+                self._queue.qsize(),
+            )
+            return
+        self._thread.join(timeout)
+
+    def stats(self) -> AuditWriterStats:
+        """Return queue depth and write counters."""
+        with self._idle:
+            return AuditWriterStats(
+                queue_depth=self._queue.qsize(),
+                capacity=self.capacity,
+                written=self.written,
+                dropped=self.dropped,
+                failed_batches=self.failed_batches,
+            )
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="audit-writer", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.shutdown)
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            first = self._queue.get()
+            batch: list[dict[str, Any]] = []
+            if first is None:
+                stop = True
+            else:
+                batch.append(first)
+            while len(batch) < self.batch_size:
+                try:
+                    row = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if row is None:
+                    stop = True
+                    continue
+                batch.append(row)
+            if batch:
+                self._write(batch)
+
+    def _write(self, batch: list[dict[str, Any]]) -> None:
+        failed = False
+        try:
+            with self.engine.begin() as connection:
+                connection.execute(insert(AuditLog.__table__), batch)
+        except Exception:
+            logger.exception("Failed to write %d audit entries.", len(batch))
+            failed = True
+        with self._idle:
+            if failed:
+                self.dropped += len(batch)
+                self.failed_batches += 1
+            else:
+                self.written += len(batch)
+            self._pending -= len(batch)
+            self._idle.notify_all()
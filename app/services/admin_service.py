@@ -1 +1,106 @@
-"""Admin service placeholder for future business logic."""
+"""Admin service for business logic."""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.db.repositories.admin_stats_repository import AdminStatsRepository
+from app.db.repositories.doctor_repository import DoctorRepository
+from app.utils.cache import admin_dashboard_cache
+from app.utils.constants import AppointmentStatus, UserRole
+
+settings = get_settings()
+
+
+@dataclass(frozen=True, slots=True)
+class AdminOverview:
+    """Headline counts for the admin dashboard."""
+
+    total_patients: int
+    total_doctors: int
+    today_appointments: int
+    pending_approvals: int
+
+
+@dataclass(frozen=True, slots=True)
+class DailyActivity:
+    """Appointments and registrations on one day."""
+
+    day: date
+    appointments: int
+    registrations: int
+
+
+@dataclass(frozen=True, slots=True)
+class AdminDashboard:
+    """Read model for the admin dashboard."""
+
+    overview: AdminOverview
+    activity: list[DailyActivity]
+
+
+class AdminService:
+    """Service for admin dashboard metrics served from daily rollups."""
+
+    ACTIVITY_WINDOWS = (7, 30)
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+        self.stats_repo = AdminStatsRepository(db)
+        self.doctor_repo = DoctorRepository(db)
+
+    def refresh_rollups(self, full: bool = False) -> tuple[int, int]:
+        """Recompute the rollup days touched since the last refresh."""
+        return self.stats_repo.refresh(
+            timedelta(seconds=settings.ADMIN_ROLLUP_OVERLAP_SECONDS), full=full
+        )
+
+    def get_dashboard(self, days: int = 7, today: date | None = None) -> AdminDashboard:
+        """Return headline counts and the last ``days`` days of activity.
+
+        Results are cached for the dashboard TTL; a miss first applies an
+        incremental rollup refresh, so the numbers lag writes by at most
+        one TTL.
+        """
+        today = today or datetime.now(timezone.utc).date()
+        return admin_dashboard_cache.get_or_load(
+            (today, days), lambda: self._load_dashboard(days, today)
+        )
+
+    def _load_dashboard(self, days: int, today: date) -> AdminDashboard:
+        self.refresh_rollups()
+        first_day = today - timedelta(days=days - 1)
+
+        # Cancelled appointments are kept in the rollup but not counted here.
+        appointments: Counter[date] = Counter()
+        for day, status, count in self.stats_repo.get_appointment_counts(
+            first_day, today
+        ):
+            if status != AppointmentStatus.CANCELLED:
+                appointments[day] += count
+        registrations = dict(self.stats_repo.get_registration_counts(first_day, today))
+        totals = self.stats_repo.get_registration_totals()
+
+        return AdminDashboard(
+            overview=AdminOverview(
+                total_patients=totals.get(UserRole.PATIENT, 0),
+                total_doctors=totals.get(UserRole.DOCTOR, 0),
+                today_appointments=appointments[today],
+                pending_approvals=self.doctor_repo.count_pending_approval(),
+            ),
+            activity=[
+                DailyActivity(
+                    day=day,
+                    appointments=appointments[day],
+                    registrations=int(registrations.get(day, 0)),
+                )
+                for day in (
+                    first_day + timedelta(days=offset) for offset in range(days)
+                )
+            ],
+        )
@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import calendar
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, date, time, timedelta, timezone
 
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
 
 from app.db.repositories.appointment_repository import AppointmentRepository
 from app.models.appointment import Appointment
 from app.security.audit import AuditAction, log_action
+from app.services.availability import Booking, DayAvailability
+from app.utils.cache import invalidate_doctor_dashboard, invalidate_patient_dashboard
 from app.utils.constants import AppointmentStatus, BookingSource
+from app.utils.pagination import Page, TotalEstimate, decode_cursor, encode_cursor
 
 
 @dataclass
@@ -22,12 +28,66 @@ class TimeSlot:
     is_available: bool
 
 
+@dataclass(frozen=True, slots=True)
+class DoctorSummary:
+    """Doctor details shown on appointment cards."""
+
+    id: int
+    title: str | None
+    first_name: str
+    last_name: str
+    specialty: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class AppointmentListItem:
+    """Read model for an appointment card, without ORM state."""
+
+    id: int
+    scheduled_datetime: datetime
+    duration_minutes: int
+    status: AppointmentStatus
+    reason: str | None
+    doctor: DoctorSummary | None
+
+
+def to_list_items(rows: Iterable[Row]) -> list[AppointmentListItem]:
+    """Build list items from projection rows, sharing one summary per doctor."""
+    doctors: dict[int, DoctorSummary] = {}
+    items = []
+    for row in rows:
+        doctor = None
+        if row.doctor_id is not None:
+            doctor = doctors.get(row.doctor_id)
+            if doctor is None:
+                doctor = doctors[row.doctor_id] = DoctorSummary(
+                    id=row.doctor_id,
+                    title=row.doctor_title,
+                    first_name=row.doctor_first_name,
+                    last_name=row.doctor_last_name,
+                    specialty=row.doctor_specialty,
+                )
+        items.append(
+            AppointmentListItem(
+                id=row.id,
+                scheduled_datetime=row.scheduled_datetime,
+                duration_minutes=row.duration_minutes,
+                status=row.status,
+                reason=row.reason,
+                doctor=doctor,
+            )
+        )
+    return items
+
+
 class AppointmentService:
     """Service for appointment business logic."""
 
     # Clinic hours: 9 AM to 5 PM
     CLINIC_START_HOUR = 9
     CLINIC_END_HOUR = 17
+    # Appointment lists stop counting here and show "N+" instead.
+    LIST_COUNT_CAP = 300
 
     def __init__(self, db: Session) -> None:
         self.db = db
@@ -39,11 +99,29 @@ class AppointmentService:
             return value.replace(tzinfo=timezone.utc)
         return value.astimezone(timezone.utc)
 
-    @staticmethod
-    def _overlaps(
-        start_a: datetime, end_a: datetime, start_b: datetime, end_b: datetime
-    ) -> bool:
-        return start_a < end_b and end_a > start_b
+    def _to_booking(self, appointment: Appointment) -> Booking:
+        start = self._normalize_datetime(appointment.scheduled_datetime)
+        return Booking(
+            start=start,
+            end=start + timedelta(minutes=appointment.duration_minutes),
+            doctor_id=appointment.doctor_id,
+            appointment_id=appointment.id,
+        )
+
+    def get_day_availability(
+        self,
+        target_date: date,
+        doctor_id: int | None = None,
+        exclude_appointment_id: int | None = None,
+    ) -> DayAvailability:
+        """Load a day's active bookings into an interval index with one query."""
+        booked = self.appointment_repo.get_booked_slots_for_date(
+            target_date, doctor_id=doctor_id
+        )
+        return DayAvailability(
+            (self._to_booking(appointment) for appointment in booked),
+            exclude_appointment_id=exclude_appointment_id,
+        )
 
     def _has_conflict(
         self,
@@ -51,20 +129,31 @@ class AppointmentService:
         duration_minutes: int,
         doctor_id: int | None = None,
         exclude_appointment_id: int | None = None,
+        availability: DayAvailability | None = None,
     ) -> bool:
         normalized_start = self._normalize_datetime(start)
         normalized_end = normalized_start + timedelta(minutes=duration_minutes)
-        booked = self.appointment_repo.get_booked_slots_for_date(
-            normalized_start.date(), doctor_id=doctor_id
-        )
-        for appt in booked:
-            if exclude_appointment_id is not None and appt.id == exclude_appointment_id:
-                continue
-            appt_start = self._normalize_datetime(appt.scheduled_datetime)
-            appt_end = appt_start + timedelta(minutes=appt.duration_minutes)
-            if self._overlaps(normalized_start, normalized_end, appt_start, appt_end):
-                return True
-        return False
+        if availability is None:
+            availability = self.get_day_availability(
+                normalized_start.date(),
+                doctor_id=doctor_id,
+                exclude_appointment_id=exclude_appointment_id,
+            )
+        return availability.has_conflict(normalized_start, normalized_end, doctor_id)
+
+    def _slot_times(self, duration_minutes: int) -> list[time]:
+        slot_times = []
+        current_hour = self.CLINIC_START_HOUR
+        current_minute = 0
+        while current_hour < self.CLINIC_END_HOUR or (
+            current_hour == self.CLINIC_END_HOUR and current_minute == 0
+        ):
+            slot_times.append(time(hour=current_hour, minute=current_minute))
+            current_minute += duration_minutes
+            if current_minute >= 60:
+                current_hour += 1
+                current_minute = 0
+        return slot_times
 
     def get_available_slots(
         self, target_date: date, duration_minutes: int = 30
@@ -75,29 +164,50 @@ class AppointmentService:
         Returns:
             Tuple of (am_slots, pm_slots)
         """
-        # Get already booked slots for the date
-        booked_appointments = self.appointment_repo.get_booked_slots_for_date(
-            target_date
+        availability = self.get_day_availability(target_date)
+        return self._build_slots(target_date, duration_minutes, availability)
+
+    def get_month_availability(
+        self, year: int, month: int, duration_minutes: int = 30
+    ) -> dict[date, int]:
+        """Return the number of free slots per day of a month, using one query."""
+        days_in_month = calendar.monthrange(year, month)[1]
+        first_day = date(year, month, 1)
+        last_day = date(year, month, days_in_month)
+        booked = self.appointment_repo.get_booked_slots_between(
+            datetime.combine(first_day, time.min, tzinfo=timezone.utc),
+            datetime.combine(last_day, time.max, tzinfo=timezone.utc),
         )
-        booked_ranges: list[tuple[datetime, datetime]] = []
-        for appt in booked_appointments:
-            appt_start = self._normalize_datetime(appt.scheduled_datetime)
-            appt_end = appt_start + timedelta(minutes=appt.duration_minutes)
-            booked_ranges.append((appt_start, appt_end))
+        bookings_by_day: dict[date, list[Booking]] = {}
+        for appointment in booked:
+            booking = self._to_booking(appointment)
+            bookings_by_day.setdefault(booking.start.date(), []).append(booking)
+
+        free_counts = {}
+        for day in range(1, days_in_month + 1):
+            target_date = date(year, month, day)
+            am_slots, pm_slots = self._build_slots(
+                target_date,
+                duration_minutes,
+                DayAvailability(bookings_by_day.get(target_date, [])),
+            )
+            free_counts[target_date] = sum(
+                slot.is_available for slot in am_slots + pm_slots
+            )
+        return free_counts
 
+    def _build_slots(
+        self,
+        target_date: date,
+        duration_minutes: int,
+        availability: DayAvailability,
+    ) -> tuple[list[TimeSlot], list[TimeSlot]]:
         am_slots = []
         pm_slots = []
 
         now = datetime.now(timezone.utc)
-        # Generate slots from clinic start to end
-        current_hour = self.CLINIC_START_HOUR
-        current_minute = 0
-
-        while current_hour < self.CLINIC_END_HOUR or (
-            current_hour == self.CLINIC_END_HOUR and current_minute == 0
-        ):
-            slot_time = time(hour=current_hour, minute=current_minute)
-
+        duration = timedelta(minutes=duration_minutes)
+        for slot_time in self._slot_times(duration_minutes):
             # Check if this slot is in the past for today
             is_past = False
             slot_datetime = datetime.combine(
@@ -106,33 +216,26 @@ class AppointmentService:
             if target_date == now.date():
                 is_past = slot_datetime <= now
 
-            slot_end = slot_datetime + timedelta(minutes=duration_minutes)
-            is_booked = any(
-                self._overlaps(slot_datetime, slot_end, appt_start, appt_end)
-                for appt_start, appt_end in booked_ranges
+            is_booked = availability.has_conflict(
+                slot_datetime, slot_datetime + duration
             )
             is_available = not is_booked and not is_past
 
             # Format display time
-            display_hour = current_hour if current_hour <= 12 else current_hour - 12
+            hour = slot_time.hour
+            display_hour = hour if hour <= 12 else hour - 12
             if display_hour == 0:
                 display_hour = 12
-            am_pm = "AM" if current_hour < 12 else "PM"
-            display = f"{display_hour}:{current_minute:02d} {am_pm}"
+            am_pm = "AM" if hour < 12 else "PM"
+            display = f"{display_hour}:{slot_time.minute:02d} {am_pm}"
 
             slot = TimeSlot(time=slot_time, display=display, is_available=is_available)
 
-            if current_hour < 12:
+            if hour < 12:
                 am_slots.append(slot)
             else:
                 pm_slots.append(slot)
 
-            # Move to next slot
-            current_minute += duration_minutes
-            if current_minute >= 60:
-                current_hour += 1
-                current_minute = 0
-
         return am_slots, pm_slots
 
     def create_appointment(
@@ -145,19 +248,20 @@ class AppointmentService:
     ) -> Appointment:
         """Create a new pending appointment."""
         normalized_datetime = self._normalize_datetime(scheduled_datetime)
-        if self._has_conflict(normalized_datetime, duration_minutes):
-            raise ValueError("Selected time is no longer available.")
-        appointment = Appointment(
-            patient_id=patient_id,
-            doctor_id=None,  # Will be assigned by admin
-            scheduled_datetime=normalized_datetime,
-            duration_minutes=duration_minutes,
-            status=AppointmentStatus.PENDING,
-            booking_source=BookingSource.ONLINE,
-            reason=reason,
-            created_by=created_by_user_id,
-        )
-        appointment = self.appointment_repo.create(appointment)
+        with self.appointment_repo.booking_lock(normalized_datetime.date()):
+            if self._has_conflict(normalized_datetime, duration_minutes):
+                raise ValueError("Selected time is no longer available.")
+            appointment = Appointment(
+                patient_id=patient_id,
+                doctor_id=None,  # Will be assigned by admin
+                scheduled_datetime=normalized_datetime,
+                duration_minutes=duration_minutes,
+                status=AppointmentStatus.PENDING,
+                booking_source=BookingSource.ONLINE,
+                reason=reason,
+                created_by=created_by_user_id,
+            )
+            appointment = self.appointment_repo.create(appointment)
         log_action(
             db=self.db,
             user_id=created_by_user_id,
@@ -170,34 +274,62 @@ class AppointmentService:
             },
         )
         self.db.commit()
+        invalidate_patient_dashboard(patient_id)
         return appointment
 
-    def get_patient_upcoming_appointments(self, patient_id: int) -> list[Appointment]:
+    def get_patient_upcoming_appointments(
+        self, patient_id: int
+    ) -> list[AppointmentListItem]:
         """Get upcoming appointments for a patient."""
-        return self.appointment_repo.get_patient_appointments(
-            patient_id=patient_id, upcoming_only=True
+        return to_list_items(
+            self.appointment_repo.get_patient_appointments(
+                patient_id=patient_id, upcoming_only=True
+            )
+        )
+
+    @staticmethod
+    def _page(rows: list[Row], page_size: int) -> Page[AppointmentListItem]:
+        """Trim a ``page_size + 1`` fetch into a page and its next cursor."""
+        items = to_list_items(rows[:page_size])
+        if len(rows) <= page_size:
+            return Page(items=items, next_cursor=None)
+        last = items[-1]
+        return Page(
+            items=items,
+            next_cursor=encode_cursor((last.scheduled_datetime, last.id)),
         )
 
-    def get_patient_upcoming_appointments_paginated(
+    def _estimate(self, count: int) -> TotalEstimate:
+        if count > self.LIST_COUNT_CAP:
+            return TotalEstimate(count=self.LIST_COUNT_CAP, is_exact=False)
+        return TotalEstimate(count=count, is_exact=True)
+
+    def get_patient_upcoming_page(
         self,
         patient_id: int,
-        limit: int | None = None,
-        offset: int = 0,
-    ) -> list[Appointment]:
-        """Get upcoming appointments for a patient with pagination."""
-        return self.appointment_repo.get_patient_upcoming_appointments(
+        page_size: int,
+        cursor: str | None = None,
+    ) -> Page[AppointmentListItem]:
+        """Get a page of upcoming appointments, soonest first."""
+        rows = self.appointment_repo.get_patient_upcoming_appointments(
             patient_id=patient_id,
-            limit=limit,
-            offset=offset,
+            limit=page_size + 1,
+            after=decode_cursor(cursor) if cursor else None,
         )
+        return self._page(rows, page_size)
 
-    def count_patient_upcoming_appointments(self, patient_id: int) -> int:
-        """Count upcoming appointments for a patient."""
-        return self.appointment_repo.count_upcoming_appointments(patient_id)
+    def estimate_patient_upcoming_total(self, patient_id: int) -> TotalEstimate:
+        """Count upcoming appointments for a patient, up to ``LIST_COUNT_CAP``."""
+        return self._estimate(
+            self.appointment_repo.count_upcoming_appointments(
+                patient_id, cap=self.LIST_COUNT_CAP
+            )
+        )
 
-    def get_next_appointment(self, patient_id: int) -> Appointment | None:
+    def get_next_appointment(self, patient_id: int) -> AppointmentListItem | None:
         """Get the next upcoming appointment for a patient."""
-        return self.appointment_repo.get_next_appointment(patient_id)
+        row = self.appointment_repo.get_next_appointment(patient_id)
+        return to_list_items([row])[0] if row is not None else None
 
     def get_pending_appointments(self) -> list[Appointment]:
         """Get all pending appointments (for admin view)."""
@@ -213,14 +345,29 @@ class AppointmentService:
         appointment = self.appointment_repo.get_by_id(appointment_id)
         if appointment is None:
             return None
-        if self._has_conflict(
-            appointment.scheduled_datetime,
-            appointment.duration_minutes,
-            doctor_id=doctor_id,
-            exclude_appointment_id=appointment_id,
-        ):
-            raise ValueError("Selected doctor is not available for this time.")
-        appointment = self.appointment_repo.assign_doctor(appointment_id, doctor_id)
+        scheduled_datetime = appointment.scheduled_datetime
+        booking_date = self._normalize_datetime(scheduled_datetime).date()
+        with self.appointment_repo.booking_lock(booking_date):
+            # Re-read under the lock: another admin may have assigned or moved
+            # the appointment since it was loaded.
+            self.db.refresh(appointment)
+            if (
+                appointment.status != AppointmentStatus.PENDING
+                or appointment.doctor_id is not None
+                or appointment.scheduled_datetime != scheduled_datetime
+            ):
+                raise ValueError(
+                    "This appointment has changed since it was loaded; "
+                    "refresh and try again."
+                )
+            if self._has_conflict(
+                appointment.scheduled_datetime,
+                appointment.duration_minutes,
+                doctor_id=doctor_id,
+                exclude_appointment_id=appointment_id,
+            ):
+                raise ValueError("Selected doctor is not available for this time.")
+            appointment = self.appointment_repo.assign_doctor(appointment_id, doctor_id)
         if appointment and assigned_by_user_id:
             log_action(
                 db=self.db,
@@ -231,21 +378,29 @@ class AppointmentService:
                 details={"action": "assign_doctor", "doctor_id": doctor_id},
             )
             self.db.commit()
+        if appointment:
+            invalidate_patient_dashboard(appointment.patient_id)
+            invalidate_doctor_dashboard(doctor_id)
         return appointment
 
-    def get_patient_past_appointments(
+    def get_patient_past_page(
         self,
         patient_id: int,
-        limit: int | None = None,
-        offset: int = 0,
-    ) -> list[Appointment]:
-        """Get past/completed appointments for a patient with pagination."""
-        return self.appointment_repo.get_patient_past_appointments(
+        page_size: int,
+        cursor: str | None = None,
+    ) -> Page[AppointmentListItem]:
+        """Get a page of past/completed appointments, newest first."""
+        rows = self.appointment_repo.get_patient_past_appointments(
             patient_id=patient_id,
-            limit=limit,
-            offset=offset,
+            limit=page_size + 1,
+            after=decode_cursor(cursor) if cursor else None,
         )
+        return self._page(rows, page_size)
 
-    def count_patient_past_appointments(self, patient_id: int) -> int:
-        """Count past/completed appointments for a patient."""
-        return self.appointment_repo.count_patient_past_appointments(patient_id)
+    def estimate_patient_past_total(self, patient_id: int) -> TotalEstimate:
+        """Count past appointments for a patient, up to ``LIST_COUNT_CAP``."""
+        return self._estimate(
+            self.appointment_repo.count_patient_past_appointments(
+                patient_id, cap=self.LIST_COUNT_CAP
+            )
+        )
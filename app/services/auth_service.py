@@ -23,7 +23,6 @@ def authenticate_user(db: Session, email: str, password: str) -> User | None:
         return None
     if not verify_password(password, user.hashed_password):
         return None
-    update_last_login(db, user.id)
     log_action(
         db=db,
         user_id=user.id,
@@ -32,6 +31,7 @@ def authenticate_user(db: Session, email: str, password: str) -> User | None:
         resource_id=user.id,
         details={"email": user.email},
     )
+    update_last_login(db, user.id)
     return user
 
 
@@ -46,6 +46,7 @@ def register_user(db: Session, user_create: UserCreate) -> User:
         resource_id=user.id,
         details={"email": user.email},
     )
+    db.commit()
     return user
 
 
@@ -59,7 +60,6 @@ def change_password(
     if not verify_password(current_password, user.hashed_password):
         return False
     user.hashed_password = hash_password(new_password)
-    db.commit()
     log_action(
         db=db,
         user_id=user.id,
@@ -68,6 +68,7 @@ def change_password(
         resource_id=user.id,
         details={"field": "password"},
     )
+    db.commit()
     return True
 
 
@@ -0,0 +1,91 @@
+"""Interval index for appointment availability queries."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import accumulate
+
+
+@dataclass(frozen=True)
+class Booking:
+    """A booked interval, optionally attached to a doctor."""
+
+    start: datetime
+    end: datetime
+    doctor_id: int | None = None
+    appointment_id: int | None = None
+
+
+class IntervalIndex:
+    """Booked intervals sorted by start, answering overlap queries in O(log n).
+
+    Intervals may overlap each other. ``[start, end)`` conflicts with a
+    booking iff some booking starts before ``end`` and ends after ``start``;
+    the bookings starting before ``end`` form a prefix of the sorted list, so
+    a prefix maximum of end times decides the query with one bisection.
+    """
+
+    def __init__(self, intervals: Iterable[tuple[datetime, datetime]]) -> None:
+        ordered = sorted(intervals)
+        self._starts = [start for start, _ in ordered]
+        self._max_ends = list(accumulate((end for _, end in ordered), max))
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        """Return True if ``[start, end)`` overlaps any booked interval."""
+        count = bisect_left(self._starts, end)
+        return count > 0 and self._max_ends[count - 1] > start
+
+
+class DayAvailability:
+    """A day's bookings indexed clinic-wide and per doctor."""
+
+    def __init__(
+        self,
+        bookings: Iterable[Booking],
+        exclude_appointment_id: int | None = None,
+    ) -> None:
+        kept = [
+            booking
+            for booking in bookings
+            if exclude_appointment_id is None
+            or booking.appointment_id != exclude_appointment_id
+        ]
+        self._clinic = IntervalIndex((b.start, b.end) for b in kept)
+        by_doctor: dict[int, list[tuple[datetime, datetime]]] = {}
+        for booking in kept:
+            if booking.doctor_id is not None:
+                by_doctor.setdefault(booking.doctor_id, []).append(
+                    (booking.start, booking.end)
+                )
+        self._doctors = {
+            doctor_id: IntervalIndex(intervals)
+            for doctor_id, intervals in by_doctor.items()
+        }
+
+    def has_conflict(
+        self, start: datetime, end: datetime, doctor_id: int | None = None
+    ) -> bool:
+        """Return True if ``[start, end)`` is taken clinic-wide or for a doctor."""
+        if doctor_id is None:
+            return self._clinic.overlaps(start, end)
+        index = self._doctors.get(doctor_id)
+        return index is not None and index.overlaps(start, end)
+
+    def free_starts(
+        self,
+        starts: Iterable[datetime],
+        duration: timedelta,
+        doctor_id: int | None = None,
+    ) -> list[datetime]:
+        """Return the candidate start times whose slot of ``duration`` is free."""
+        return [
+            start
+            for start in starts
+            if not self.has_conflict(start, start + duration, doctor_id)
+        ]
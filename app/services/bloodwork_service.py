@@ -2,20 +2,31 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
+from types import MappingProxyType
 from typing import Any
 
 from sqlalchemy.orm import Session
 
+from app.db.repositories.bloodwork_marker_repository import BloodworkMarkerRepository
 from app.db.repositories.bloodwork_repository import BloodworkRepository
 from app.models.bloodwork import Bloodwork
+from app.models.bloodwork_marker import BloodworkMarker
+from app.services.marker_status import MarkerColumns, classify_markers
+from app.utils.cache import invalidate_doctor_dashboard, invalidate_patient_dashboard
+from app.utils.downsampling import lttb_indices
 
 
 def _rr(low: float, high: float) -> dict[str, float]:
     return {"low": low, "optimal_low": low, "optimal_high": high, "high": high}
 
 
+# Bump when the shape of the stored ``Bloodwork.normalized`` payload changes.
+NORMALIZED_FORMAT_VERSION = 1
+
 PANEL_TEMPLATES: list[dict[str, Any]] = []
 
 PANEL_TEMPLATES.extend(
@@ -1322,6 +1333,155 @@ PANEL_TEMPLATES.extend(
 )
 
 
+def _marker_key(marker: Mapping[str, Any]) -> str:
+    return marker.get("key", marker.get("name"))
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@dataclass(frozen=True)
+class ReferenceRange:
+    """Numeric reference range for a marker."""
+
+    low: float
+    high: float
+    optimal_low: float | None
+    optimal_high: float | None
+
+    @classmethod
+    def parse(cls, raw: Mapping[str, Any] | None) -> ReferenceRange | None:
+        """Parse a reference range mapping, or return None if it is not numeric."""
+        if not raw:
+            return None
+        low = raw.get("low")
+        high = raw.get("high")
+        if low is None or high is None:
+            return None
+        optimal_low = raw.get("optimal_low", low)
+        optimal_high = raw.get("optimal_high", high)
+        try:
+            return cls(
+                low=float(low),
+                high=float(high),
+                optimal_low=None if optimal_low is None else float(optimal_low),
+                optimal_high=None if optimal_high is None else float(optimal_high),
+            )
+        except (TypeError, ValueError):
+            return None
+
+
+@dataclass(frozen=True)
+class PanelRegistry:
+    """Immutable panel templates indexed by panel and marker."""
+
+    panels: tuple[Mapping[str, Any], ...]
+    by_key: Mapping[str, Mapping[str, Any]]
+    by_name: Mapping[str, Mapping[str, Any]]
+    markers: Mapping[str, Mapping[str, Any]]
+    reference_ranges: Mapping[str, ReferenceRange]
+    panel_marker_keys: Mapping[str, tuple[str, ...]]
+    marker_keys_by_name: Mapping[tuple[str, str], str]
+
+    @classmethod
+    def build(cls, templates: Iterable[Mapping[str, Any]]) -> PanelRegistry:
+        """Freeze and index panel templates, rejecting duplicate keys."""
+        panels = tuple(_freeze(panel) for panel in templates)
+        by_key: dict[str, Mapping[str, Any]] = {}
+        by_name: dict[str, Mapping[str, Any]] = {}
+        markers: dict[str, Mapping[str, Any]] = {}
+        reference_ranges: dict[str, ReferenceRange] = {}
+        panel_marker_keys: dict[str, tuple[str, ...]] = {}
+        marker_keys_by_name: dict[tuple[str, str], str] = {}
+        for panel in panels:
+            if panel["key"] in by_key:
+                raise ValueError(f"Duplicate panel key: {panel['key']}")
+            if panel["name"] in by_name:
+                raise ValueError(f"Duplicate panel name: {panel['name']}")
+            by_key[panel["key"]] = panel
+            by_name[panel["name"]] = panel
+            keys = []
+            for marker in panel.get("markers", ()):
+                marker_key = _marker_key(marker)
+                if marker_key in markers:
+                    raise ValueError(f"Duplicate marker key: {marker_key}")
+                markers[marker_key] = marker
+                keys.append(marker_key)
+                marker_keys_by_name[(panel["name"], marker["name"])] = marker_key
+                reference = ReferenceRange.parse(marker.get("reference_range"))
+                if reference is not None:
+                    reference_ranges[marker_key] = reference
+            panel_marker_keys[panel["key"]] = tuple(keys)
+        return cls(
+            panels=panels,
+            by_key=MappingProxyType(by_key),
+            by_name=MappingProxyType(by_name),
+            markers=MappingProxyType(markers),
+            reference_ranges=MappingProxyType(reference_ranges),
+            panel_marker_keys=MappingProxyType(panel_marker_keys),
+            marker_keys_by_name=MappingProxyType(marker_keys_by_name),
+        )
+
+    def get(self, panel_key: str) -> Mapping[str, Any]:
+        """Return a panel by key."""
+        try:
+            return self.by_key[panel_key]
+        except KeyError:
+            raise ValueError(f"Unknown panel key: {panel_key}") from None
+
+    def resolve_marker_key(
+        self, panel_name: str | None, marker: Mapping[str, Any]
+    ) -> str:
+        """Return the registry key of a stored marker, or a slug of its name."""
+        if marker.get("key"):
+            return marker["key"]
+        name = str(marker.get("name") or "")
+        key = self.marker_keys_by_name.get((panel_name or "", name))
+        if key is not None:
+            return key
+        return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")[:100] or "unknown"
+
+    def get_by_name(self, panel_name: str) -> Mapping[str, Any]:
+        """Return a panel by display name."""
+        try:
+            return self.by_name[panel_name]
+        except KeyError:
+            raise ValueError(f"Unknown panel name: {panel_name}") from None
+
+
+PANEL_REGISTRY = PanelRegistry.build(PANEL_TEMPLATES)
+
+
+def extract_marker_observations(payload: Mapping[str, Any]) -> list[dict[str, Any]]:
+    """Flatten a stored normalized payload into ``bloodwork_markers`` values."""
+    panel_name = payload.get("test_name")
+    observations = []
+    for category in payload.get("categories", []):
+        for marker in category.get("markers", []):
+            raw_value = marker.get("value")
+            try:
+                value = float(raw_value)
+            except (TypeError, ValueError):
+                value = None
+            marker_key = PANEL_REGISTRY.resolve_marker_key(panel_name, marker)
+            observations.append(
+                {
+                    "marker_key": marker_key,
+                    "name": str(marker.get("name") or marker_key)[:255],
+                    "value": value,
+                    "value_text": None if value is not None else str(raw_value)[:255],
+                    "unit": str(marker.get("unit") or "")[:50] or None,
+                    "status": str(marker.get("status") or "unknown")[:20],
+                }
+            )
+    return observations
+
+
 @dataclass
 class MarkerSummary:
     """Summary counts for marker status."""
@@ -1330,16 +1490,77 @@ class MarkerSummary:
     out_of_range: int
 
 
+@dataclass
+class MarkerPoint:
+    """A single observation in a marker time series."""
+
+    test_date: date
+    value: float
+    status: str
+
+
 class BloodworkService:
     """Service for bloodwork-related business logic."""
 
     def __init__(self, db: Session) -> None:
         self.db = db
         self.bloodwork_repo = BloodworkRepository(db)
+        self.marker_repo = BloodworkMarkerRepository(db)
 
     def get_published_results(self, patient_id: int) -> list[Bloodwork]:
-        """Return published bloodwork results for a patient."""
-        return self.bloodwork_repo.get_published_for_patient(patient_id)
+        """Return published results whose normalized payload is up to date."""
+        bloodwork_results = self.bloodwork_repo.get_published_for_patient(patient_id)
+        if self._upgrade_normalized(bloodwork_results):
+            bloodwork_results = self.bloodwork_repo.get_published_for_patient(
+                patient_id
+            )
+        return bloodwork_results
+
+    def get_marker_series(
+        self,
+        patient_id: int,
+        marker_key: str,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        max_points: int | None = None,
+    ) -> list[MarkerPoint]:
+        """Return a published marker's history, downsampled to max_points."""
+        return self.get_marker_series_many(
+            patient_id, [marker_key], date_from, date_to, max_points
+        ).get(marker_key, [])
+
+    def get_marker_series_many(
+        self,
+        patient_id: int,
+        marker_keys: list[str],
+        date_from: date | None = None,
+        date_to: date | None = None,
+        max_points: int | None = None,
+    ) -> dict[str, list[MarkerPoint]]:
+        """Return histories for several markers in one query, keyed by marker."""
+        series: dict[str, list[MarkerPoint]] = {}
+        if not marker_keys:
+            return series
+        for row in self.marker_repo.get_series(
+            patient_id, marker_keys, date_from, date_to
+        ):
+            series.setdefault(row.marker_key, []).append(
+                MarkerPoint(test_date=row.test_date, value=row.value, status=row.status)
+            )
+        if max_points:
+            for marker_key, points in series.items():
+                if len(points) > max_points:
+                    kept = lttb_indices(
+                        [point.test_date.toordinal() for point in points],
+                        [point.value for point in points],
+                        max_points,
+                    )
+                    series[marker_key] = [points[index] for index in kept]
+        return series
+
+    def get_marker_key(self, test_name: str | None, marker: dict[str, Any]) -> str:
+        """Return the key a stored marker is recorded under in time series."""
+        return PANEL_REGISTRY.resolve_marker_key(test_name, marker)
 
     @staticmethod
     def _has_value(value: Any) -> bool:
@@ -1349,24 +1570,29 @@ class BloodworkService:
             return False
         return True
 
-    def get_panel_templates(self) -> list[dict[str, Any]]:
+    def get_panel_templates(self) -> tuple[Mapping[str, Any], ...]:
         """Return panel templates for creating results."""
-        return PANEL_TEMPLATES
+        return PANEL_REGISTRY.panels
 
-    def get_panel_template(self, panel_key: str) -> dict[str, Any]:
+    def get_panel_template(self, panel_key: str) -> Mapping[str, Any]:
         """Return a single panel template."""
-        for panel in PANEL_TEMPLATES:
-            if panel["key"] == panel_key:
-                return panel
-        raise ValueError(f"Unknown panel key: {panel_key}")
+        return PANEL_REGISTRY.get(panel_key)
+
+    def get_panel_by_name(self, panel_name: str) -> Mapping[str, Any]:
+        """Return a single panel template by display name."""
+        return PANEL_REGISTRY.get_by_name(panel_name)
+
+    def get_panel_marker_keys(self, panel_key: str) -> tuple[str, ...]:
+        """Return the marker keys of a panel, in display order."""
+        return PANEL_REGISTRY.panel_marker_keys.get(panel_key, ())
 
     def build_panel_results(
-        self, panel: dict[str, Any], values: dict[str, float | str]
+        self, panel: Mapping[str, Any], values: dict[str, float | str]
     ) -> dict[str, Any]:
         """Build a bloodwork results payload for a panel."""
         markers = []
-        for marker in panel.get("markers", []):
-            marker_key = marker.get("key", marker.get("name"))
+        for marker in panel.get("markers", ()):
+            marker_key = _marker_key(marker)
             if marker_key not in values:
                 continue
             value = values.get(marker_key)
@@ -1375,10 +1601,11 @@ class BloodworkService:
             markers.append(
                 {
                     "name": marker.get("name", ""),
+                    "key": marker_key,
                     "abbreviation": marker.get("abbreviation", ""),
                     "value": value,
                     "unit": marker.get("unit", ""),
-                    "reference_range": marker.get("reference_range", {}),
+                    "reference_range": dict(marker.get("reference_range", {})),
                     "reference_note": marker.get("reference_note", ""),
                 }
             )
@@ -1397,9 +1624,11 @@ class BloodworkService:
         """Create an unpublished bloodwork result."""
         panel = self.get_panel_template(panel_key)
         results = self.build_panel_results(panel, values)
-        return self.bloodwork_repo.create(
+        test_type = panel.get("name", "Bloodwork Panel")
+        normalized = self.build_normalized(results, {}, test_type)
+        bloodwork = self.bloodwork_repo.create(
             patient_id=patient_id,
-            test_type=panel.get("name", "Bloodwork Panel"),
+            test_type=test_type,
             test_date=test_date,
             results=results,
             reference_ranges={},
@@ -1408,7 +1637,12 @@ class BloodworkService:
             approved_by=None,
             approved_at=None,
             published_at=None,
+            normalized=normalized,
+            normalized_version=NORMALIZED_FORMAT_VERSION,
+            markers=self._build_markers(normalized, patient_id, test_date),
         )
+        self._invalidate_dashboards(bloodwork)
+        return bloodwork
 
     def publish_result(
         self, bloodwork_id: int, doctor_id: int, signature: str, notes: str | None
@@ -1434,11 +1668,27 @@ class BloodworkService:
         bloodwork.approved_by = doctor_id
         bloodwork.approved_at = now
         bloodwork.published_at = now
-        return self.bloodwork_repo.save(bloodwork)
+        self.refresh_normalized(bloodwork)
+        bloodwork = self.bloodwork_repo.save(bloodwork)
+        self._invalidate_dashboards(bloodwork)
+        return bloodwork
+
+    @staticmethod
+    def _invalidate_dashboards(bloodwork: Bloodwork) -> None:
+        invalidate_patient_dashboard(bloodwork.patient_id)
+        patient = bloodwork.patient
+        invalidate_doctor_dashboard(patient.doctor_id if patient else None)
 
     def normalize_bloodwork(self, bloodwork: Bloodwork) -> dict[str, Any]:
         """Normalize bloodwork payloads into a common structure."""
-        results = bloodwork.results or {}
+        return self._normalize_payload(
+            bloodwork.results, bloodwork.reference_ranges, bloodwork.test_type
+        )
+
+    def _normalize_payload(
+        self, results: Any, reference_ranges: Any, test_type: str
+    ) -> dict[str, Any]:
+        results = results or {}
         if isinstance(results, dict) and "categories" in results:
             categories = []
             for category in results.get("categories", []):
@@ -1453,12 +1703,12 @@ class BloodworkService:
                 payload["markers"] = markers
                 categories.append(payload)
             return {
-                "test_name": results.get("test_name") or bloodwork.test_type,
+                "test_name": results.get("test_name") or test_type,
                 "categories": categories,
             }
 
         markers = []
-        reference_ranges = bloodwork.reference_ranges or {}
+        reference_ranges = reference_ranges or {}
         for name, value in results.items():
             if not self._has_value(value):
                 continue
@@ -1473,10 +1723,92 @@ class BloodworkService:
                 }
             )
         return {
-            "test_name": bloodwork.test_type,
+            "test_name": test_type,
             "categories": [{"name": "Results", "markers": markers}],
         }
 
+    def build_normalized(
+        self, results: Any, reference_ranges: Any, test_type: str
+    ) -> dict[str, Any]:
+        """Return the stored normalized payload for raw bloodwork results.
+
+        On top of ``normalize_bloodwork`` every marker carries its computed
+        ``status`` and every category, and the payload, carries a ``summary``.
+        """
+        payload = self._normalize_payload(results, reference_ranges, test_type)
+        categories = payload["categories"]
+        markers = [marker for category in categories for marker in category["markers"]]
+        groups = [
+            index
+            for index, category in enumerate(categories)
+            for _ in category["markers"]
+        ]
+        classification = classify_markers(
+            MarkerColumns.from_markers(markers, groups), group_count=len(categories)
+        )
+        statuses = iter(classification.statuses)
+        for index, category in enumerate(categories):
+            category["markers"] = [
+                {**marker, "status": next(statuses)} for marker in category["markers"]
+            ]
+            category["summary"] = {
+                "total": int(classification.totals[index]),
+                "out_of_range": int(classification.out_of_range_counts[index]),
+            }
+        payload["summary"] = {
+            "total": len(markers),
+            "out_of_range": int(classification.out_of_range.sum()),
+        }
+        payload["version"] = NORMALIZED_FORMAT_VERSION
+        return payload
+
+    def refresh_normalized(self, bloodwork: Bloodwork) -> None:
+        """Recompute the stored normalized payload and marker rows of a result."""
+        bloodwork.normalized = self.build_normalized(
+            bloodwork.results, bloodwork.reference_ranges, bloodwork.test_type
+        )
+        bloodwork.normalized_version = NORMALIZED_FORMAT_VERSION
+        bloodwork.markers = self._build_markers(
+            bloodwork.normalized, bloodwork.patient_id, bloodwork.test_date
+        )
+
+    @staticmethod
+    def _build_markers(
+        payload: Mapping[str, Any], patient_id: int, test_date: date
+    ) -> list[BloodworkMarker]:
+        return [
+            BloodworkMarker(patient_id=patient_id, test_date=test_date, **observation)
+            for observation in extract_marker_observations(payload)
+        ]
+
+    def get_normalized(self, bloodwork: Bloodwork) -> dict[str, Any]:
+        """Return the stored normalized payload, rebuilding it if stale."""
+        self._upgrade_normalized([bloodwork])
+        return bloodwork.normalized
+
+    def _upgrade_normalized(self, bloodwork_results: list[Bloodwork]) -> bool:
+        """Rebuild payloads older than the current format in one commit."""
+        stale = [
+            bloodwork
+            for bloodwork in bloodwork_results
+            if bloodwork.normalized_version != NORMALIZED_FORMAT_VERSION
+            or not bloodwork.normalized
+        ]
+        for bloodwork in stale:
+            self.refresh_normalized(bloodwork)
+        if stale:
+            self.bloodwork_repo.save_all(stale)
+        return bool(stale)
+
+    @staticmethod
+    def get_summary(payload: dict[str, Any]) -> MarkerSummary:
+        """Return the stored summary of a normalized payload or category."""
+        summary = payload.get("summary") or {}
+        return MarkerSummary(
+            total=summary.get("total", 0),
+            out_of_range=summary.get("out_of_range", 0),
+        )
+
     def summarize_categories(self, categories: list[dict[str, Any]]) -> MarkerSummary:
         """Return total markers and out-of-range count."""
         total = 0
@@ -1504,6 +1836,46 @@ class BloodworkService:
         )
         return MarkerSummary(total=total, out_of_range=out_of_range)
 
+    def summarize_history(
+        self, normalized: Mapping[int, dict[str, Any]]
+    ) -> dict[tuple[int, int], MarkerSummary]:
+        """Summarize every category of many normalized results in one pass.
+
+        ``normalized`` maps bloodwork IDs to ``normalize_bloodwork`` payloads;
+        the result is keyed by ``(bloodwork_id, category_index)``. Meant for
+        multi-result histories; a single result is cheaper through
+        ``summarize_categories``, which skips building the NumPy columns.
+        """
+        buckets: list[tuple[int, int]] = []
+        markers: list[dict[str, Any]] = []
+        groups: list[int] = []
+        for bloodwork_id, payload in normalized.items():
+            for index, category in enumerate(payload.get("categories", [])):
+                group = len(buckets)
+                buckets.append((bloodwork_id, index))
+                category_markers = [
+                    marker
+                    for marker in category.get("markers", [])
+                    if self._has_value(marker.get("value"))
+                ]
+                markers.extend(category_markers)
+                groups.extend([group] * len(category_markers))
+
+        classification = classify_markers(
+            MarkerColumns.from_markers(markers, groups), group_count=len(buckets)
+        )
+        return {
+            bucket: MarkerSummary(
+                total=int(classification.totals[group]),
+                out_of_range=int(classification.out_of_range_counts[group]),
+            )
+            for group, bucket in enumerate(buckets)
+        }
+
+    def get_marker_statuses(self, markers: list[dict[str, Any]]) -> list[str]:
+        """Return normalized statuses for a list of markers."""
+        return classify_markers(MarkerColumns.from_markers(markers)).statuses
+
     def get_marker_status(self, marker: dict[str, Any]) -> str:
         """Return a normalized marker status."""
         status = marker.get("status")
@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 
 from app.db.repositories.doctor_message_repository import DoctorMessageRepository
 from app.models.doctor_message import DoctorMessage
+from app.utils.cache import invalidate_doctor_dashboard
 
 
 class DoctorMessageService:
@@ -31,17 +32,24 @@ class DoctorMessageService:
         sent_by: int | None = None,
     ) -> DoctorMessage:
         """Send a message to a doctor."""
-        return self.message_repo.create(
+        record = self.message_repo.create(
             doctor_id=doctor_id,
             title=title,
             message=message,
             sent_by=sent_by,
         )
+        invalidate_doctor_dashboard(doctor_id)
+        return record
 
     def mark_as_read(self, message_id: int) -> DoctorMessage | None:
         """Mark a message as read."""
-        return self.message_repo.mark_as_read(message_id)
+        message = self.message_repo.mark_as_read(message_id)
+        if message is not None:
+            invalidate_doctor_dashboard(message.doctor_id)
+        return message
 
     def mark_all_as_read(self, doctor_id: int) -> int:
         """Mark all messages as read."""
-        return self.message_repo.mark_all_as_read(doctor_id)
+        updated = self.message_repo.mark_all_as_read(doctor_id)
+        invalidate_doctor_dashboard(doctor_id)
+        return updated
@@ -1 +1,76 @@
-"""Doctor service placeholder for future business logic."""
+"""Doctor service for business logic."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timezone
+
+from sqlalchemy.orm import Session
+
+from app.db.repositories.appointment_repository import AppointmentRepository
+from app.db.repositories.bloodwork_repository import BloodworkRepository
+from app.db.repositories.doctor_repository import DoctorRepository
+from app.db.repositories.patient_repository import PatientRepository
+from app.db.repositories.unread_counter_repository import UnreadCounterRepository
+from app.models.appointment import Appointment
+from app.models.doctor import Doctor
+from app.utils.cache import doctor_dashboard_cache
+
+
+@dataclass
+class DoctorDashboardStats:
+    """Data class for doctor dashboard counts."""
+
+    upcoming_appointments: int
+    today_appointments: int
+    pending_reviews: int
+    assigned_patients: int
+    unread_messages: int = 0
+
+
+class DoctorService:
+    """Service for doctor-related business logic."""
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+        self.doctor_repo = DoctorRepository(db)
+        self.appointment_repo = AppointmentRepository(db)
+        self.bloodwork_repo = BloodworkRepository(db)
+        self.patient_repo = PatientRepository(db)
+        self.unread_repo = UnreadCounterRepository(db)
+
+    def get_doctor_by_user_id(self, user_id: int) -> Doctor | None:
+        """Get doctor profile by user ID."""
+        return self.doctor_repo.get_by_user_id(user_id)
+
+    def get_dashboard_stats(self, doctor_id: int) -> DoctorDashboardStats:
+        """Get dashboard counts for a doctor, served from a short-TTL cache."""
+        return doctor_dashboard_cache.get_or_load(
+            doctor_id, lambda: self._load_dashboard_stats(doctor_id)
+        )
+
+    def _load_dashboard_stats(self, doctor_id: int) -> DoctorDashboardStats:
+        now = datetime.now(timezone.utc)
+        today = date.today()
+        start_of_day = datetime.combine(today, time.min).replace(tzinfo=timezone.utc)
+        end_of_day = datetime.combine(today, time.max).replace(tzinfo=timezone.utc)
+        return DoctorDashboardStats(
+            upcoming_appointments=(
+                self.appointment_repo.count_doctor_active_appointments(doctor_id, now)
+            ),
+            today_appointments=self.appointment_repo.count_doctor_active_appointments(
+                doctor_id, start_of_day, end_of_day
+            ),
+            pending_reviews=self.bloodwork_repo.count_pending_for_doctor(doctor_id),
+            assigned_patients=self.patient_repo.count_by_doctor_id(doctor_id) or 0,
+            unread_messages=self.unread_repo.get_doctor_unread_messages(doctor_id),
+        )
+
+    def get_upcoming_schedule(self, doctor_id: int, limit: int) -> list[Appointment]:
+        """Get the next pending/scheduled appointments for a doctor."""
+        return self.appointment_repo.get_doctor_appointments(
+            doctor_id,
+            datetime.now(timezone.utc),
+            active_only=True,
+            limit=limit,
+        )
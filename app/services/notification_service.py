@@ -2,10 +2,73 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
 from sqlalchemy.orm import Session
 
 from app.db.repositories.notification_repository import NotificationRepository
-from app.models.notification import Notification
+from app.db.repositories.patient_repository import PatientRepository
+from app.utils.cache import invalidate_patient_dashboard
+from app.utils.constants import NotificationType
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationItem:
+    """Read model for a notification card, without ORM state."""
+
+    id: int
+    type: NotificationType
+    title: str
+    message: str
+    is_read: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationFeed:
+    """First page of a patient's feed plus the cursor to poll for changes."""
+
+    items: list[NotificationItem]
+    next_cursor: str | None
+    since_cursor: str
+    unread_count: int
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationChanges:
+    """Notifications created or updated since a feed cursor.
+
+    ``unread_count`` is only recounted when something changed. ``truncated``
+    means more changes were pending than one poll returns; callers should
+    reload the feed instead of merging.
+    """
+
+    items: list[NotificationItem]
+    since_cursor: str
+    unread_count: int | None
+    truncated: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class PatientFilter:
+    """Selects the patients a broadcast goes to."""
+
+    doctor_id: int | None = None
+    active_only: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationTemplate:
+    """Content shared by every notification in a broadcast."""
+
+    type: NotificationType
+    title: str
+    message: str
+    action_url: str | None = None
+    triggered_by: int | None = None
 
 
 class NotificationService:
@@ -14,19 +77,145 @@ class NotificationService:
     def __init__(self, db: Session) -> None:
         self.db = db
         self.notification_repo = NotificationRepository(db)
+        self.patient_repo = PatientRepository(db)
+
+    # Polls re-read this far behind the cursor. The cursor is the newest
+    # updated_at a poll has seen, but Postgres stamps rows with the
+    # transaction start time, so a change can commit after that poll with an
+    # older timestamp; the window must exceed the longest such transaction.
+    SINCE_OVERLAP = timedelta(seconds=5)
+    # Cursor for a feed that has no notifications yet.
+    SINCE_ORIGIN = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    SINCE_LIMIT = 200
+    BROADCAST_CHUNK_SIZE = 1000
+
+    @staticmethod
+    def _as_utc(value: datetime) -> datetime:
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+    def _since_cursor(self, *moments: datetime) -> str:
+        """Encode the latest of the given database timestamps as a cursor.
+
+        The cursor only advances to timestamps read back from the database,
+        never to the app clock, so a change a poll could not see yet is
+        still ahead of the cursor on the next poll.
+        """
+        latest = max([self.SINCE_ORIGIN, *(self._as_utc(m) for m in moments)])
+        return encode_cursor((latest, 0))
 
     def get_notifications(
         self, patient_id: int, unread_only: bool = False
-    ) -> list[Notification]:
+    ) -> list[NotificationItem]:
         """Return notifications for a patient."""
-        return self.notification_repo.get_for_patient(
+        rows = self.notification_repo.get_for_patient(
             patient_id=patient_id, unread_only=unread_only
         )
+        # Row columns are selected in NotificationItem field order.
+        return [NotificationItem(*row) for row in rows]
+
+    def get_feed(
+        self, patient_id: int, page_size: int = 20, cursor: str | None = None
+    ) -> NotificationFeed:
+        """Return a page of the feed, newest first, with a since cursor.
 
-    def mark_as_read(self, notification_id: int) -> Notification | None:
-        """Mark a notification as read."""
-        return self.notification_repo.mark_as_read(notification_id)
+        The high-water mark is read before the page and from the same
+        source, so every change up to the cursor is already in that source
+        when the page is read, even if it is a lagging replica.
+        """
+        high_water = self.notification_repo.get_high_water_mark(patient_id)
+        rows = self.notification_repo.get_for_patient(
+            patient_id,
+            limit=page_size + 1,
+            before_id=decode_cursor(cursor)[1] if cursor else None,
+        )
+        items = [NotificationItem(*row) for row in rows[:page_size]]
+        next_cursor = None
+        if len(rows) > page_size:
+            next_cursor = encode_cursor((items[-1].created_at, items[-1].id))
+        return NotificationFeed(
+            items=items,
+            next_cursor=next_cursor,
+            since_cursor=(
+                self._since_cursor(high_water) if high_water else self._since_cursor()
+            ),
+            unread_count=self.notification_repo.count_unread(patient_id),
+        )
+
+    def get_since(self, patient_id: int, cursor: str) -> NotificationChanges:
+        """Return notifications created or updated since a feed's since cursor.
+
+        The cursor is the newest change the previous poll read. Changes in
+        the overlap window just before it are returned again by the next
+        poll, so callers merge items by id. A quiet feed costs one indexed
+        query and keeps its cursor.
+        """
+        since, _ = decode_cursor(cursor)
+        rows = self.notification_repo.get_changed_since(
+            patient_id, since - self.SINCE_OVERLAP, limit=self.SINCE_LIMIT + 1
+        )
+        if len(rows) > self.SINCE_LIMIT:
+            return NotificationChanges(
+                items=[], since_cursor=cursor, unread_count=None, truncated=True
+            )
+        items = [NotificationItem(*row) for row in rows]
+        return NotificationChanges(
+            items=items,
+            since_cursor=self._since_cursor(
+                since, *(item.updated_at for item in items)
+            ),
+            unread_count=(
+                self.notification_repo.count_unread(patient_id) if items else None
+            ),
+        )
+
+    def mark_as_read(self, notification_id: int, patient_id: int) -> bool:
+        """Mark a patient's notification as read; False if nothing changed."""
+        updated = self.notification_repo.mark_as_read(notification_id, patient_id)
+        if updated:
+            invalidate_patient_dashboard(patient_id)
+        return updated
 
     def mark_all_as_read(self, patient_id: int) -> int:
         """Mark all notifications as read for a patient."""
-        return self.notification_repo.mark_all_as_read(patient_id)
+        updated = self.notification_repo.mark_all_as_read(patient_id)
+        invalidate_patient_dashboard(patient_id)
+        return updated
+
+    def broadcast(
+        self,
+        patient_filter: PatientFilter,
+        template: NotificationTemplate,
+        chunk_size: int | None = None,
+    ) -> int:
+        """Send one notification to every matching patient; return how many.
+
+        Patients are paged by id and each chunk is inserted with one
+        multi-row INSERT and committed on its own, so a large broadcast never
+        holds a long transaction. A failure part-way leaves earlier chunks
+        delivered.
+        """
+        chunk_size = chunk_size or self.BROADCAST_CHUNK_SIZE
+        values = {
+            "type": template.type,
+            "title": template.title,
+            "message": template.message,
+            "action_url": template.action_url,
+            "triggered_by": template.triggered_by,
+        }
+        sent = 0
+        after_id = None
+        while True:
+            patient_ids = self.patient_repo.get_ids_after(
+                after_id,
+                chunk_size,
+                doctor_id=patient_filter.doctor_id,
+                active_only=patient_filter.active_only,
+            )
+            if not patient_ids:
+                return sent
+            sent += self.notification_repo.create_for_patients(patient_ids, values)
+            for patient_id in patient_ids:
+                invalidate_patient_dashboard(patient_id)
+            after_id = patient_ids[-1]
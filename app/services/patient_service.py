@@ -9,11 +9,21 @@ from sqlalchemy.orm import Session
 
 from app.db.repositories.appointment_repository import AppointmentRepository
 from app.db.repositories.patient_repository import PatientRepository
-from app.models.appointment import Appointment
 from app.models.patient import Patient
+from app.services.appointment_service import AppointmentListItem, to_list_items
+from app.utils.cache import patient_dashboard_cache
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class PatientSummary:
+    """Patient identity fields the patient pages render."""
+
+    id: int
+    first_name: str
+    last_name: str
+
+
+@dataclass(frozen=True, slots=True)
 class DashboardStats:
     """Data class for patient dashboard statistics."""
 
@@ -23,7 +33,7 @@ class DashboardStats:
     unread_notifications: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NextAppointmentInfo:
     """Data class for next appointment display."""
 
@@ -34,6 +44,14 @@ class NextAppointmentInfo:
     is_pending: bool = False
 
 
+@dataclass(frozen=True, slots=True)
+class DashboardOverview:
+    """Data class bundling dashboard stats with the next appointment."""
+
+    stats: DashboardStats
+    next_appointment: NextAppointmentInfo | None
+
+
 class PatientService:
     """Service for patient-related business logic."""
 
@@ -46,27 +64,73 @@ class PatientService:
         """Get patient profile by user ID."""
         return self.patient_repo.get_by_user_id(user_id)
 
+    def get_patient_summary(self, user_id: int) -> PatientSummary | None:
+        """Get the patient's id and name by user ID, without loading the ORM row."""
+        row = self.patient_repo.get_summary_by_user_id(user_id)
+        if row is None:
+            return None
+        return PatientSummary(
+            id=row.id, first_name=row.first_name, last_name=row.last_name
+        )
+
+    def get_dashboard_overview(self, patient_id: int) -> DashboardOverview:
+        """Get dashboard statistics and next appointment, cached for a short TTL."""
+        return patient_dashboard_cache.get_or_load(
+            patient_id, lambda: self._load_dashboard_overview(patient_id)
+        )
+
+    def _load_dashboard_overview(self, patient_id: int) -> DashboardOverview:
+        row = self.patient_repo.get_dashboard_summary(patient_id)
+        if row is None:
+            return DashboardOverview(
+                stats=DashboardStats(
+                    upcoming_appointments=0,
+                    active_prescriptions=0,
+                    pending_results=0,
+                    unread_notifications=0,
+                ),
+                next_appointment=None,
+            )
+
+        stats = DashboardStats(
+            upcoming_appointments=row.upcoming_appointments or 0,
+            active_prescriptions=row.active_prescriptions or 0,
+            pending_results=row.pending_results or 0,
+            unread_notifications=row.unread_notifications or 0,
+        )
+        next_appointment = None
+        if row.next_scheduled_datetime is not None:
+            if row.next_doctor_id is not None:
+                next_appointment = NextAppointmentInfo(
+                    doctor_name=(
+                        f"Dr. {row.next_doctor_first_name} "
+                        f"{row.next_doctor_last_name}"
+                    ),
+                    specialty=row.next_doctor_specialty,
+                    scheduled_datetime=row.next_scheduled_datetime,
+                    reason=row.next_reason,
+                )
+            else:
+                next_appointment = NextAppointmentInfo(
+                    doctor_name="TBD",
+                    specialty="Awaiting doctor assignment",
+                    scheduled_datetime=row.next_scheduled_datetime,
+                    reason=row.next_reason,
+                    is_pending=True,
+                )
+        return DashboardOverview(stats=stats, next_appointment=next_appointment)
+
     def get_dashboard_stats(self, patient_id: int) -> DashboardStats:
         """Get all dashboard statistics for a patient."""
-        return DashboardStats(
-            upcoming_appointments=self.appointment_repo.count_upcoming_appointments(
-                patient_id
-            ),
-            active_prescriptions=self.patient_repo.get_active_prescriptions_count(
-                patient_id
-            ),
-            pending_results=self.patient_repo.get_pending_results_count(patient_id),
-            unread_notifications=self.patient_repo.get_unread_notifications_count(
-                patient_id
-            ),
-        )
+        return self.get_dashboard_overview(patient_id).stats
 
     def get_next_appointment_info(self, patient_id: int) -> NextAppointmentInfo | None:
         """Get formatted info for next upcoming appointment."""
-        appointment = self.appointment_repo.get_next_appointment(patient_id)
+        row = self.appointment_repo.get_next_appointment(patient_id)
 
-        if not appointment:
+        if row is None:
             return None
+        [appointment] = to_list_items([row])
 
         # Handle pending appointments (no doctor assigned yet)
         if appointment.doctor:
@@ -87,8 +151,10 @@ class PatientService:
             is_pending=is_pending,
         )
 
-    def get_upcoming_appointments(self, patient_id: int) -> list[Appointment]:
+    def get_upcoming_appointments(self, patient_id: int) -> list[AppointmentListItem]:
         """Get all upcoming appointments for a patient."""
-        return self.appointment_repo.get_patient_appointments(
-            patient_id, upcoming_only=True
+        return to_list_items(
+            self.appointment_repo.get_patient_appointments(
+                patient_id, upcoming_only=True
+            )
         )
@@ -1 +1,80 @@
-"""UI component placeholder."""
+"""Notification bell that polls the feed for changes."""
+
+from __future__ import annotations
+
+from html import escape
+from typing import Any
+
+import streamlit as st
+
+from app.config import get_settings
+from app.db.session import session_scope
+from app.services.notification_service import NotificationService
+
+BELL_STATE_KEY = "notification_bell"
+PREVIEW_SIZE = 5
+
+
+def _load(patient_id: int) -> dict[str, Any]:
+    """Load the newest notifications and a since cursor for later polls."""
+    with session_scope() as db:
+        feed = NotificationService(db).get_feed(patient_id, page_size=PREVIEW_SIZE)
+    return {
+        "patient_id": patient_id,
+        "items": feed.items,
+        "cursor": feed.since_cursor,
+        "unread": feed.unread_count,
+    }
+
+
+def _poll(state: dict[str, Any]) -> dict[str, Any]:
+    """Merge notifications changed since the last poll into the preview."""
+    patient_id = state["patient_id"]
+    with session_scope() as db:
+        changes = NotificationService(db).get_since(patient_id, state["cursor"])
+    if changes.truncated:
+        return _load(patient_id)
+    if not changes.items:
+        return {**state, "cursor": changes.since_cursor}
+
+    merged = {item.id: item for item in state["items"]}
+    merged.update((item.id, item) for item in changes.items)
+    newest = sorted(merged.values(), key=lambda item: item.id, reverse=True)
+    return {
+        "patient_id": patient_id,
+        "items": newest[:PREVIEW_SIZE],
+        "cursor": changes.since_cursor,
+        "unread": changes.unread_count,
+    }
+
+
+@st.fragment(run_every=get_settings().NOTIFICATION_POLL_SECONDS)
+def render_notification_bell(patient_id: int) -> None:
+    """Render the unread count and latest notifications, polling for changes.
+
+    The first render loads one page of the feed; each timed rerun of this
+    fragment asks only for notifications changed since the previous poll.
+    """
+    state = st.session_state.get(BELL_STATE_KEY)
+    if state is None or state["patient_id"] != patient_id:
+        state = _load(patient_id)
+    else:
+        state = _poll(state)
+    st.session_state[BELL_STATE_KEY] = state
+
+    unread = state["unread"]
+    with st.popover(f"Notifications ({unread})" if unread else "Notifications"):
+        if not state["items"]:
+            st.caption("You have no notifications.")
+        for item in state["items"]:
+            weight = 700 if not item.is_read else 400
+            st.markdown(
+                f"""
+                <div style="padding: 6px 0; border-bottom: 1px solid #e2e8f0;">
+                    <div style="font-weight: {weight}; color: #1e293b;">{escape(item.title)}</div>
+                    <div style="font-size: 12px; color: #94a3b8;">{item.created_at.strftime("%B %d, %Y")}</div>
+                </div>
+                """,
+                unsafe_allow_html=True,
+            )
+        st.page_link("pages/patient_5_Notifications.py", label="View all")
@@ -0,0 +1,176 @@
+"""In-process TTL caches for frequently recomputed read models."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Callable, Generic, TypeVar
+
+from app.config import get_settings
+
+V = TypeVar("V")
+
+settings = get_settings()
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Return the fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TTLCache(Generic[V]):
+    """Bounded, thread-safe LRU cache whose entries expire after a TTL."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        # [generation, loaders] for keys with a load in flight; invalidate()
+        # bumps the generation so those loads know their value may be stale.
+        self._loading: dict[Hashable, list[int]] = {}
+
+    def get(self, key: Hashable) -> V | None:
+        """Return a live cached value or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._store(key, value)
+
+    def _store(self, key: Hashable, value: V) -> None:
+        self._entries[key] = (self._clock() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], V]) -> V:
+        """Return the cached value for key, loading and storing it on a miss.
+
+        A value whose load overlapped an invalidation is returned but not
+        stored, since it may have been read before the change that caused it.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        with self._lock:
+            loading = self._loading.setdefault(key, [0, 0])
+            loading[1] += 1
+            generation = loading[0]
+        try:
+            value = loader()
+        finally:
+            with self._lock:
+                if value is not None and loading[0] == generation:
+                    self._store(key, value)
+                loading[1] -= 1
+                if not loading[1]:
+                    del self._loading[key]
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry."""
+        with self._lock:
+            if key in self._loading:
+                self._loading[key][0] += 1
+            if self._entries.pop(key, None) is not None:
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            for loading in self._loading.values():
+                loading[0] += 1
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._invalidations = 0
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+            )
+
+
+# Dashboard read models keyed by patient id and doctor id respectively, and
+# the admin dashboard keyed by (day, activity window).
+patient_dashboard_cache: TTLCache = TTLCache(
+    max_entries=settings.DASHBOARD_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.DASHBOARD_CACHE_TTL_SECONDS,
+)
+doctor_dashboard_cache: TTLCache = TTLCache(
+    max_entries=settings.DASHBOARD_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.DASHBOARD_CACHE_TTL_SECONDS,
+)
+
+admin_dashboard_cache: TTLCache = TTLCache(
+    max_entries=8,
+    ttl_seconds=settings.DASHBOARD_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_patient_dashboard(patient_id: int | None) -> None:
+    """Drop cached dashboard data for a patient."""
+    if patient_id is not None:
+        patient_dashboard_cache.invalidate(patient_id)
+
+
+def invalidate_doctor_dashboard(doctor_id: int | None) -> None:
+    """Drop cached dashboard data for a doctor."""
+    if doctor_id is not None:
+        doctor_dashboard_cache.invalidate(doctor_id)
+
+
+def get_dashboard_cache_stats() -> dict[str, CacheStats]:
+    """Return hit/miss counters for the dashboard caches."""
+    return {
+        "patient_dashboard": patient_dashboard_cache.stats(),
+        "doctor_dashboard": doctor_dashboard_cache.stats(),
+        "admin_dashboard": admin_dashboard_cache.stats(),
+    }
@@ -0,0 +1,43 @@
+"""Time-series downsampling helpers."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+
+def lttb_indices(x: Sequence[float], y: Sequence[float], threshold: int) -> np.ndarray:
+    """Return the indices kept by Largest-Triangle-Three-Buckets downsampling.
+
+    The first and last points are always kept. Each bucket in between
+    contributes the point forming the largest triangle with the previously
+    kept point and the average of the next bucket, which preserves peaks
+    and troughs far better than striding. ``x`` must be sorted ascending.
+    """
+    size = len(x)
+    if threshold >= size or size <= 2:
+        return np.arange(size)
+    if threshold < 3:
+        return np.array([0, size - 1][: max(threshold, 0)], dtype=np.intp)
+
+    xs = np.asarray(x, dtype=np.float64)
+    ys = np.asarray(y, dtype=np.float64)
+    bucket_size = (size - 2) / (threshold - 2)
+    kept = np.empty(threshold, dtype=np.intp)
+    kept[0] = 0
+    previous = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, size)
+        average_x = xs[end:next_end].mean()
+        average_y = ys[end:next_end].mean()
+        areas = np.abs(
+            (xs[previous] - average_x) * (ys[start:end] - ys[previous])
+            - (xs[previous] - xs[start:end]) * (average_y - ys[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        kept[bucket + 1] = previous
+    kept[-1] = size - 1
+    return kept
@@ -0,0 +1,56 @@
+"""Keyset pagination helpers."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+# The sort key a cursor resumes after: (scheduled_datetime, id).
+CursorKey = tuple[datetime, int]
+
+
+def encode_cursor(key: CursorKey) -> str:
+    """Encode a sort key as an opaque URL-safe cursor."""
+    moment, row_id = key
+    raw = f"{moment.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> CursorKey:
+    """Decode a cursor produced by :func:`encode_cursor`."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        moment, row_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(moment), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError("Invalid page cursor.") from exc
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """One page of results and the cursor for the page after it."""
+
+    items: list[T]
+    next_cursor: str | None
+
+    @property
+    def has_more(self) -> bool:
+        """Return True if another page follows."""
+        return self.next_cursor is not None
+
+
+@dataclass(frozen=True)
+class TotalEstimate:
+    """A row count bounded by a cap; ``is_exact`` is False once it is reached."""
+
+    count: int
+    is_exact: bool
+
+    def page_count(self, page_size: int) -> int:
+        """Return the number of pages needed for ``count`` rows."""
+        return max(1, -(-self.count // page_size))
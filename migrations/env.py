@@ -24,8 +24,8 @@ target_metadata = Base.metadata
 
 
 def get_url() -> str:
-    """Return database URL from settings."""
-    return get_settings().DATABASE_URL
+    """Return the database URL passed by the caller, else the configured one."""
+    return config.attributes.get("database_url") or get_settings().DATABASE_URL
 
 
 def run_migrations_offline() -> None:
@@ -0,0 +1,32 @@
+"""Add stored normalized bloodwork payloads.
+
+Revision ID: 003_add_bloodwork_normalized
+Revises: 002_add_doctor_messages
+Create Date: 2026-10-18 00:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "003_add_bloodwork_normalized"
+down_revision = "002_add_doctor_messages"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration."""
+    # Existing rows keep NULL and are normalized lazily on first read.
+    op.add_column("bloodwork", sa.Column("normalized", sa.JSON(), nullable=True))
+    op.add_column(
+        "bloodwork", sa.Column("normalized_version", sa.Integer(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Revert migration."""
+    op.drop_column("bloodwork", "normalized_version")
+    op.drop_column("bloodwork", "normalized")
@@ -0,0 +1,329 @@
+"""Add bloodwork marker observations.
+
+Revision ID: 004_add_bloodwork_markers
+Revises: 003_add_bloodwork_normalized
+Create Date: 2026-10-18 00:00:00
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "004_add_bloodwork_markers"
+down_revision = "003_add_bloodwork_normalized"
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 500
+
+# Frozen copy of the marker normalization as of this revision, so that later
+# changes to the bloodwork service cannot alter what this migration writes.
+# Panel markers whose registry key differs from the slug of their name.
+MARKER_KEYS = {
+    ("Vitals / Anthropometrics", "Blood pressure - Systolic"): "bp_systolic",
+    ("Vitals / Anthropometrics", "Blood pressure - Diastolic"): "bp_diastolic",
+    ("Infectious Disease Screen", "Hepatitis B surface Ag"): "hep_b_surface_ag",
+    ("Infectious Disease Screen", "Hepatitis B surface Ab"): "hep_b_surface_ab",
+    ("Infectious Disease Screen", "Hepatitis B core Ab"): "hep_b_core_ab",
+    ("Infectious Disease Screen", "Hepatitis C Ab"): "hep_c_ab",
+    ("Infectious Disease Screen", "Hepatitis C PCR (optional)"): "hep_c_pcr",
+    ("Fertility (Semen Analysis)", "DNA fragmentation (optional)"): "dna_fragmentation",
+    ("Coagulation", "INR"): "inr_coag",
+    ("Coagulation", "D-dimer (optional)"): "d_dimer",
+    ("Cardiac Risk / Injury", "hs-Troponin (T or I)"): "troponin",
+    ("Cardiac Risk / Injury", "BNP or NT-proBNP"): "bnp",
+    ("Cardiac Risk / Injury", "Homocysteine (optional)"): "homocysteine",
+    ("Prostate / Men's Screening", "% Free PSA"): "psa_free_percent",
+    ("Urinalysis (Dip + Microscopy)", "Protein"): "urine_protein",
+    ("Urinalysis (Dip + Microscopy)", "Glucose"): "urine_glucose",
+    ("Urinalysis (Dip + Microscopy)", "Ketones"): "urine_ketones",
+    ("Urinalysis (Dip + Microscopy)", "Blood"): "urine_blood",
+    ("Urinalysis (Dip + Microscopy)", "Leukocyte esterase"): "urine_leukocyte_esterase",
+    ("Urinalysis (Dip + Microscopy)", "Nitrite"): "urine_nitrite",
+    ("Urinalysis (Dip + Microscopy)", "Bilirubin"): "urine_bilirubin",
+    ("Urinalysis (Dip + Microscopy)", "Urobilinogen"): "urine_urobilinogen",
+    ("Urinalysis (Dip + Microscopy)", "RBCs (microscopy)"): "urine_rbcs",
+    ("Urinalysis (Dip + Microscopy)", "WBCs (microscopy)"): "urine_wbcs",
+    ("Urinalysis (Dip + Microscopy)", "Casts"): "urine_casts",
+    ("Urinalysis (Dip + Microscopy)", "Crystals"): "urine_crystals",
+    ("Urinalysis (Dip + Microscopy)", "Bacteria/yeast"): "urine_bacteria",
+    ("Urinalysis (Dip + Microscopy)", "Epithelial cells"): "urine_epithelial_cells",
+    ("Urinalysis (Dip + Microscopy)", "Urine culture (optional)"): "urine_culture",
+    ("Iron Studies", "Ferritin"): "ferritin_iron",
+    ("Vitamins / Minerals / Nutrition", "25-OH Vitamin D"): "vitamin_d",
+    ("Vitamins / Minerals / Nutrition", "RBC folate (optional)"): "rbc_folate",
+    ("Vitamins / Minerals / Nutrition", "Selenium (optional)"): "selenium",
+    ("Adrenal / Stress", "Cortisol (PM) (optional)"): "cortisol_pm",
+    ("Adrenal / Stress", "Aldosterone (optional)"): "aldosterone",
+    ("Adrenal / Stress", "Renin (optional)"): "renin",
+    ("Adrenal / Stress", "Plasma metanephrines (optional)"): "plasma_metanephrines",
+    ("Adrenal / Stress", "Urine metanephrines (optional)"): "urine_metanephrines",
+    ("Inflammation / Immune", "ESR"): "esr_inflammation",
+    ("Inflammation / Immune", "Ferritin"): "ferritin_inflammation",
+    ("Inflammation / Immune", "GlycA (optional)"): "glyca",
+    ("Inflammation / Immune", "IL-6 (optional)"): "il6",
+    ("Thyroid", "TRAb / TSI (optional)"): "trab_tsi",
+    ("Thyroid", "Reverse T3 (optional)"): "reverse_t3",
+    (
+        "Male Hormones / Androgens",
+        "Total testosterone (LC/MS if available)",
+    ): "total_testosterone",
+    (
+        "Male Hormones / Androgens",
+        "Free testosterone (calc or measured)",
+    ): "free_testosterone",
+    ("Male Hormones / Androgens", "Sensitive estradiol (E2)"): "estradiol",
+    ("Male Hormones / Androgens", "hCG (optional)"): "hcg",
+    ("Male Hormones / Androgens", "Inhibin B (optional)"): "inhibin_b",
+    ("Lipids (Standard + Advanced)", "ApoB"): "apo_b",
+    ("Lipids (Standard + Advanced)", "ApoA1"): "apo_a1",
+    ("Lipids (Standard + Advanced)", "Lp(a)"): "lpa",
+    ("Lipids (Standard + Advanced)", "LDL-P (NMR) (optional)"): "ldl_p",
+    ("Lipids (Standard + Advanced)", "Small dense LDL (optional)"): "small_dense_ldl",
+    ("Glucose / Insulin / Diabetes", "OGTT glucose (0 min)"): "ogtt_glucose_0",
+    (
+        "Glucose / Insulin / Diabetes",
+        "OGTT glucose (60 min) (optional)",
+    ): "ogtt_glucose_60",
+    (
+        "Glucose / Insulin / Diabetes",
+        "OGTT glucose (120 min) (optional)",
+    ): "ogtt_glucose_120",
+    (
+        "Glucose / Insulin / Diabetes",
+        "OGTT insulin (0 min) (optional)",
+    ): "ogtt_insulin_0",
+    (
+        "Glucose / Insulin / Diabetes",
+        "OGTT insulin (60 min) (optional)",
+    ): "ogtt_insulin_60",
+    (
+        "Glucose / Insulin / Diabetes",
+        "OGTT insulin (120 min) (optional)",
+    ): "ogtt_insulin_120",
+    ("Kidney / Renal Extended", "eGFR (cystatin-based)"): "egfr_cystatin",
+    ("Kidney / Renal Extended", "Urine albumin (microalbumin)"): "urine_albumin",
+    ("Kidney / Renal Extended", "Albumin:Creatinine Ratio (ACR)"): "acr",
+    ("Kidney / Renal Extended", "Protein:Creatinine Ratio (PCR)"): "pcr",
+    ("Basic Metabolic Panel (BMP)", "CO2 / Bicarbonate"): "bicarbonate",
+    ("Basic Metabolic Panel (BMP)", "Urea (or BUN)"): "urea",
+    ("Comprehensive Metabolic Panel Add-ons (CMP)", "A/G ratio"): "ag_ratio",
+    ("Hematology (CBC)", "White blood cell count (WBC)"): "wbc",
+    ("Hematology (CBC)", "Red blood cell count (RBC)"): "rbc",
+    ("Hematology (CBC)", "Platelet count"): "platelets",
+    ("Hematology (CBC)", "Neutrophils (absolute)"): "neutrophils_abs",
+    ("Hematology (CBC)", "Neutrophils (%)"): "neutrophils_pct",
+    ("Hematology (CBC)", "Lymphocytes (absolute)"): "lymphocytes_abs",
+    ("Hematology (CBC)", "Lymphocytes (%)"): "lymphocytes_pct",
+    ("Hematology (CBC)", "Monocytes (absolute)"): "monocytes_abs",
+    ("Hematology (CBC)", "Monocytes (%)"): "monocytes_pct",
+    ("Hematology (CBC)", "Eosinophils (absolute)"): "eosinophils_abs",
+    ("Hematology (CBC)", "Eosinophils (%)"): "eosinophils_pct",
+    ("Hematology (CBC)", "Basophils (absolute)"): "basophils_abs",
+    ("Hematology (CBC)", "Basophils (%)"): "basophils_pct",
+    (
+        "Hematology (CBC)",
+        "Immature granulocytes (absolute)",
+    ): "immature_granulocytes_abs",
+    ("Hematology (CBC)", "Immature granulocytes (%)"): "immature_granulocytes_pct",
+    ("Hematology (CBC)", "Reticulocytes (absolute)"): "reticulocytes_abs",
+    ("Hematology (CBC)", "Reticulocytes (%)"): "reticulocytes_pct",
+}
+
+
+def upgrade() -> None:
+    """Apply migration."""
+    markers = op.create_table(
+        "bloodwork_markers",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "bloodwork_id",
+            sa.Integer(),
+            sa.ForeignKey("bloodwork.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "patient_id", sa.Integer(), sa.ForeignKey("patients.id"), nullable=False
+        ),
+        sa.Column("marker_key", sa.String(length=100), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("value", sa.Float(), nullable=True),
+        sa.Column("value_text", sa.String(length=255), nullable=True),
+        sa.Column("unit", sa.String(length=50), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("test_date", sa.Date(), nullable=False),
+    )
+    op.create_index(
+        "ix_bloodwork_markers_bloodwork_id", "bloodwork_markers", ["bloodwork_id"]
+    )
+    _backfill(markers)
+    op.create_index(
+        "idx_bloodwork_markers_patient_marker_date",
+        "bloodwork_markers",
+        ["patient_id", "marker_key", "test_date"],
+    )
+
+
+def _has_value(value: Any) -> bool:
+    if value is None:
+        return False
+    if isinstance(value, str) and not value.strip():
+        return False
+    return True
+
+
+def _parse_reference_range(raw_range: Any) -> dict[str, float]:
+    if isinstance(raw_range, dict):
+        return raw_range
+    if isinstance(raw_range, str):
+        parts = raw_range.replace(" ", "").split("-")
+        if len(parts) == 2:
+            try:
+                low = float(parts[0])
+                high = float(parts[1])
+            except ValueError:
+                return {}
+            return {"low": low, "optimal_low": low, "optimal_high": high, "high": high}
+    return {}
+
+
+def _normalize(results: Any, reference_ranges: Any, test_type: str) -> dict[str, Any]:
+    results = results or {}
+    if isinstance(results, dict) and "categories" in results:
+        return {
+            "test_name": results.get("test_name") or test_type,
+            "markers": [
+                marker
+                for category in results.get("categories", [])
+                for marker in category.get("markers", [])
+                if _has_value(marker.get("value"))
+            ],
+        }
+    reference_ranges = reference_ranges or {}
+    return {
+        "test_name": test_type,
+        "markers": [
+            {
+                "name": name,
+                "value": value,
+                "unit": "",
+                "reference_range": _parse_reference_range(reference_ranges.get(name)),
+            }
+            for name, value in results.items()
+            if _has_value(value)
+        ],
+    }
+
+
+def _status(marker: dict[str, Any]) -> str:
+    status = marker.get("status")
+    if isinstance(status, str) and status:
+        return status.lower()
+    reference = marker.get("reference_range") or {}
+    low = reference.get("low")
+    high = reference.get("high")
+    optimal_low = reference.get("optimal_low", low)
+    optimal_high = reference.get("optimal_high", high)
+    if low is None or high is None:
+        return "unknown"
+    try:
+        value = float(marker.get("value"))
+        low = float(low)
+        high = float(high)
+        optimal_low = None if optimal_low is None else float(optimal_low)
+        optimal_high = None if optimal_high is None else float(optimal_high)
+    except (TypeError, ValueError):
+        return "unknown"
+    if value < low or value > high:
+        return "critical"
+    if optimal_low is not None and value < optimal_low:
+        return "low"
+    if optimal_high is not None and value > optimal_high:
+        return "high"
+    return "normal"
+
+
+def _marker_key(panel_name: str | None, marker: dict[str, Any]) -> str:
+    if marker.get("key"):
+        return marker["key"]
+    name = str(marker.get("name") or "")
+    key = MARKER_KEYS.get((panel_name or "", name))
+    if key is not None:
+        return key
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")[:100] or "unknown"
+
+
+def _observations(
+    results: Any, reference_ranges: Any, test_type: str
+) -> list[dict[str, Any]]:
+    payload = _normalize(results, reference_ranges, test_type)
+    observations = []
+    for marker in payload["markers"]:
+        raw_value = marker.get("value")
+        try:
+            value = float(raw_value)
+        except (TypeError, ValueError):
+            value = None
+        marker_key = _marker_key(payload["test_name"], marker)
+        observations.append(
+            {
+                "marker_key": marker_key,
+                "name": str(marker.get("name") or marker_key)[:255],
+                "value": value,
+                "value_text": None if value is not None else str(raw_value)[:255],
+                "unit": str(marker.get("unit") or "")[:50] or None,
+                "status": _status(marker)[:20],
+            }
+        )
+    return observations
+
+
+def _backfill(markers: sa.Table) -> None:
+    bloodwork = sa.table(
+        "bloodwork",
+        sa.column("id", sa.Integer()),
+        sa.column("patient_id", sa.Integer()),
+        sa.column("test_type", sa.String()),
+        sa.column("test_date", sa.Date()),
+        sa.column("results", sa.JSON()),
+        sa.column("reference_ranges", sa.JSON()),
+    )
+    conn = op.get_bind()
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(bloodwork)
+            .where(bloodwork.c.id > last_id)
+            .order_by(bloodwork.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        values = [
+            {
+                "bloodwork_id": row.id,
+                "patient_id": row.patient_id,
+                "test_date": row.test_date,
+                **observation,
+            }
+            for row in rows
+            for observation in _observations(
+                row.results, row.reference_ranges, row.test_type
+            )
+        ]
+        if values:
+            conn.execute(markers.insert(), values)
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    """Revert migration."""
+    op.drop_index(
+        "idx_bloodwork_markers_patient_marker_date", table_name="bloodwork_markers"
+    )
+    op.drop_index("ix_bloodwork_markers_bloodwork_id", table_name="bloodwork_markers")
+    op.drop_table("bloodwork_markers")
@@ -0,0 +1,59 @@
+"""Add composite appointment indexes matching repository access paths.
+
+Revision ID: 005_add_appointment_indexes
+Revises: 004_add_bloodwork_markers
+Create Date: 2026-10-18 00:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "005_add_appointment_indexes"
+down_revision = "004_add_bloodwork_markers"
+branch_labels = None
+depends_on = None
+
+ACTIVE_STATUS_PREDICATE = sa.text("status IN ('pending', 'scheduled')")
+
+
+def upgrade() -> None:
+    """Apply migration."""
+    # The pending queue filters on status and orders by time; the composite
+    # index serves that and every status-only lookup the old index did.
+    op.create_index(
+        "idx_appointments_status_scheduled",
+        "appointments",
+        ["status", "scheduled_datetime"],
+    )
+    op.drop_index("idx_appointments_status", table_name="appointments")
+    op.create_index(
+        "idx_appointments_patient_scheduled",
+        "appointments",
+        ["patient_id", "scheduled_datetime"],
+    )
+    # Upcoming-appointment lookups only touch pending/scheduled rows, which
+    # stay a small slice of the table as history accumulates.
+    op.create_index(
+        "idx_appointments_patient_active",
+        "appointments",
+        ["patient_id", "scheduled_datetime"],
+        postgresql_where=ACTIVE_STATUS_PREDICATE,
+        sqlite_where=ACTIVE_STATUS_PREDICATE,
+    )
+    op.create_index(
+        "idx_appointments_doctor_scheduled",
+        "appointments",
+        ["doctor_id", "scheduled_datetime"],
+    )
+
+
+def downgrade() -> None:
+    """Revert migration."""
+    op.drop_index("idx_appointments_doctor_scheduled", table_name="appointments")
+    op.drop_index("idx_appointments_patient_active", table_name="appointments")
+    op.drop_index("idx_appointments_patient_scheduled", table_name="appointments")
+    op.create_index("idx_appointments_status", "appointments", ["status"])
+    op.drop_index("idx_appointments_status_scheduled", table_name="appointments")
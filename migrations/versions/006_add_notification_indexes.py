@@ -0,0 +1,36 @@
+"""Add notification indexes for the paged feed and since-cursor polling.
+
+Revision ID: 006_add_notification_indexes
+Revises: 005_add_appointment_indexes
+Create Date: 2026-10-18 00:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "006_add_notification_indexes"
+down_revision = "005_add_appointment_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration."""
+    op.create_index(
+        "idx_notifications_patient_id",
+        "notifications",
+        ["patient_id", "id"],
+    )
+    op.create_index(
+        "idx_notifications_patient_updated",
+        "notifications",
+        ["patient_id", "updated_at"],
+    )
+
+
+def downgrade() -> None:
+    """Revert migration."""
+    op.drop_index("idx_notifications_patient_updated", table_name="notifications")
+    op.drop_index("idx_notifications_patient_id", table_name="notifications")
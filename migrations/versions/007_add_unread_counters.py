@@ -0,0 +1,71 @@
+"""Add materialized unread counters.
+
+Revision ID: 007_add_unread_counters
+Revises: 006_add_notification_indexes
+Create Date: 2026-10-18 00:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "007_add_unread_counters"
+down_revision = "006_add_notification_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration."""
+    op.create_table(
+        "patient_unread_counters",
+        sa.Column(
+            "patient_id",
+            sa.Integer(),
+            sa.ForeignKey("patients.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "unread_notifications",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+        ),
+    )
+    op.create_table(
+        "doctor_unread_counters",
+        sa.Column(
+            "doctor_id",
+            sa.Integer(),
+            sa.ForeignKey("doctors.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "unread_messages",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+        ),
+    )
+    op.execute(
+        """
+        INSERT INTO patient_unread_counters (patient_id, unread_notifications)
+        SELECT patient_id, COUNT(*) FROM notifications
+        WHERE is_read = false GROUP BY patient_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO doctor_unread_counters (doctor_id, unread_messages)
+        SELECT doctor_id, COUNT(*) FROM doctor_messages
+        WHERE is_read = false GROUP BY doctor_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Revert migration."""
+    op.drop_table("doctor_unread_counters")
+    op.drop_table("patient_unread_counters")
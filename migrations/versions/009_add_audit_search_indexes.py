@@ -0,0 +1,43 @@
+"""Add composite indexes for audit log search.
+
+Revision ID: 009_add_audit_search_indexes
+Revises: 008_partition_audit_logs
+Create Date: 2026-10-18 00:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "009_add_audit_search_indexes"
+down_revision = "008_partition_audit_logs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration."""
+    op.create_index(
+        "idx_audit_user_timestamp",
+        "audit_logs",
+        ["user_id", "timestamp", "id"],
+    )
+    op.create_index(
+        "idx_audit_action_timestamp",
+        "audit_logs",
+        ["action", "timestamp", "id"],
+    )
+    op.create_index(
+        "idx_audit_resource_timestamp",
+        "audit_logs",
+        ["resource_type", "resource_id", "timestamp", "id"],
+    )
+    op.drop_index("idx_audit_action", table_name="audit_logs")
+
+
+def downgrade() -> None:
+    """Revert migration."""
+    op.create_index("idx_audit_action", "audit_logs", ["action"])
+    op.drop_index("idx_audit_resource_timestamp", table_name="audit_logs")
+    op.drop_index("idx_audit_action_timestamp", table_name="audit_logs")
+    op.drop_index("idx_audit_user_timestamp", table_name="audit_logs")
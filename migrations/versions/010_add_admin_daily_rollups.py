@@ -0,0 +1,79 @@
+"""Add daily rollups for the admin dashboard.
+
+Revision ID: 010_add_admin_daily_rollups
+Revises: 009_add_audit_search_indexes
+Create Date: 2026-10-18 00:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "010_add_admin_daily_rollups"
+down_revision = "009_add_audit_search_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration."""
+    op.create_index("idx_appointments_updated_at", "appointments", ["updated_at"])
+    op.create_index("idx_users_created_at", "users", ["created_at"])
+    op.create_table(
+        "daily_appointment_stats",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column(
+            "status",
+            postgresql.ENUM(name="appointmentstatus", create_type=False),
+            primary_key=True,
+        ),
+        sa.Column("appointment_count", sa.Integer(), nullable=False),
+    )
+    op.create_table(
+        "daily_registration_stats",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column(
+            "role",
+            postgresql.ENUM(name="userrole", create_type=False),
+            primary_key=True,
+        ),
+        sa.Column("user_count", sa.Integer(), nullable=False),
+    )
+    op.create_table(
+        "rollup_watermarks",
+        sa.Column("name", sa.String(50), primary_key=True),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    # Backfill both rollups and start their watermarks at the backfill.
+    op.execute(
+        """
+        INSERT INTO daily_appointment_stats (day, status, appointment_count)
+        SELECT CAST((scheduled_datetime AT TIME ZONE 'UTC') AS DATE), status, COUNT(*)
+        FROM appointments GROUP BY 1, 2
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO daily_registration_stats (day, role, user_count)
+        SELECT CAST((created_at AT TIME ZONE 'UTC') AS DATE), role, COUNT(*)
+        FROM users GROUP BY 1, 2
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO rollup_watermarks (name, refreshed_at) VALUES
+            ('daily_appointment_stats', now()),
+            ('daily_registration_stats', now())
+        """
+    )
+
+
+def downgrade() -> None:
+    """Revert migration."""
+    op.drop_table("rollup_watermarks")
+    op.drop_table("daily_registration_stats")
+    op.drop_table("daily_appointment_stats")
+    op.drop_index("idx_users_created_at", table_name="users")
+    op.drop_index("idx_appointments_updated_at", table_name="appointments")
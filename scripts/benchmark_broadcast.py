@@ -0,0 +1,145 @@
+"""Benchmark notification fan-out: per-row ORM adds vs batched broadcast.
+
+Usage:
+    python scripts/benchmark_broadcast.py [--database-url URL] [--patients N]
+        [--chunk-size N]
+
+Defaults to an in-memory SQLite database. Pass a Postgres URL (with the
+schema migrated) to measure real round trips; use a scratch database, since
+every active patient in it receives the benchmark notifications.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+import uuid
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine, event, insert, select
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.models import Notification, Patient, User
+from app.services.notification_service import (
+    NotificationService,
+    NotificationTemplate,
+    PatientFilter,
+)
+from app.utils.constants import NotificationType, UserRole
+
+
+def seed(db: Session, patients: int) -> None:
+    """Create ``patients`` active patients with bulk inserts."""
+    run = uuid.uuid4().hex[:8]
+    db.execute(
+        insert(User),
+        [
+            {
+                "email": f"bench.{run}.{index}@example.com",
+                "hashed_password": "x",
+                "role": UserRole.PATIENT,
+                "is_active": True,
+            }
+            for index in range(patients)
+        ],
+    )
+    user_ids = db.scalars(
+        select(User.id).where(User.email.like(f"bench.{run}.%")).order_by(User.id)
+    ).all()
+    db.execute(
+        insert(Patient),
+        [
+            {
+                "user_id": user_id,
+                "nhs_number": f"{index:010d}",
+                "title": "Mr",
+                "first_name": "Bench",
+                "last_name": "Patient",
+                "date_of_birth": date(1980, 1, 1),
+                "phone_number": "07111111111",
+                "address_line_1": "1 Bench Street",
+                "city": "Belfast",
+                "postcode": "BT12AB",
+                "emergency_contact_name": "Jane",
+                "emergency_contact_relationship": "Spouse",
+                "emergency_contact_phone": "07222222222",
+            }
+            for index, user_id in enumerate(user_ids)
+        ],
+    )
+    db.commit()
+
+
+def orm_fan_out(db: Session, template: NotificationTemplate) -> int:
+    """One ORM add per patient, as seed scripts create notifications."""
+    patient_ids = db.scalars(select(Patient.id)).all()
+    db.add_all(
+        Notification(
+            patient_id=patient_id,
+            type=template.type,
+            title=template.title,
+            message=template.message,
+            is_read=False,
+        )
+        for patient_id in patient_ids
+    )
+    db.commit()
+    return len(patient_ids)
+
+
+def main() -> None:
+    """Run the benchmark and print throughput and round trips per strategy."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url", default="sqlite:///:memory:")
+    parser.add_argument("--patients", type=int, default=100_000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url, future=True)
+    if args.database_url.startswith("sqlite"):
+        Base.metadata.create_all(engine)
+
+    statements = 0
+
+    def _count(*_args) -> None:
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine, "before_cursor_execute", _count)
+    template = NotificationTemplate(
+        type=NotificationType.GENERAL,
+        title="Clinic announcement",
+        message="The clinic is closed on the bank holiday.",
+    )
+
+    with Session(engine) as db:
+        seed(db, args.patients)
+        for label, fan_out in (
+            ("orm adds", lambda: orm_fan_out(db, template)),
+            (
+                "broadcast",
+                lambda: NotificationService(db).broadcast(
+                    PatientFilter(), template, args.chunk_size
+                ),
+            ),
+        ):
+            statements = 0
+            started = time.perf_counter()
+            sent = fan_out()
+            elapsed = time.perf_counter() - started
+            print(
+                f"{label:>10}: {sent} notifications in {elapsed:.2f} s "
+                f"({sent / elapsed:,.0f}/s, {statements} statements)"
+            )
+
+
+if __name__ == "__main__":
+    main()
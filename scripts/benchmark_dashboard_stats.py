@@ -0,0 +1,192 @@
+"""Benchmark patient dashboard queries: per-stat COUNTs vs one aggregate.
+
+Usage:
+    python scripts/benchmark_dashboard_stats.py [--database-url URL] [--renders N]
+
+Defaults to an in-memory SQLite database seeded with one patient. Pass a
+Postgres URL (with the schema migrated) to measure real network round trips.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.models import (
+    Appointment,
+    Bloodwork,
+    Doctor,
+    Notification,
+    Patient,
+    Prescription,
+    User,
+)
+from app.services.patient_service import PatientService
+from app.utils.constants import (
+    AppointmentStatus,
+    BookingSource,
+    NotificationType,
+    UserRole,
+)
+
+
+def seed(db: Session) -> int:
+    """Create a patient with a realistic spread of dashboard data."""
+    doctor_user = User(
+        email="bench.doctor@example.com", hashed_password="x", role=UserRole.DOCTOR
+    )
+    patient_user = User(
+        email="bench.patient@example.com", hashed_password="x", role=UserRole.PATIENT
+    )
+    db.add_all([doctor_user, patient_user])
+    db.flush()
+    doctor = Doctor(
+        user_id=doctor_user.id,
+        gmc_number="1234567",
+        title="Dr",
+        first_name="Bench",
+        last_name="Doctor",
+        specialty="General Practice",
+        phone_number="07123456789",
+        email=doctor_user.email,
+    )
+    db.add(doctor)
+    db.flush()
+    patient = Patient(
+        user_id=patient_user.id,
+        nhs_number="9434765919",
+        title="Mr",
+        first_name="Bench",
+        last_name="Patient",
+        date_of_birth=date(1980, 1, 1),
+        phone_number="07111111111",
+        address_line_1="1 Bench Street",
+        city="Belfast",
+        postcode="BT12AB",
+        emergency_contact_name="Jane",
+        emergency_contact_relationship="Spouse",
+        emergency_contact_phone="07222222222",
+        doctor_id=doctor.id,
+    )
+    db.add(patient)
+    db.flush()
+
+    now = datetime.now(timezone.utc)
+    for offset in range(-200, 50):
+        db.add(
+            Appointment(
+                patient_id=patient.id,
+                doctor_id=doctor.id if offset % 3 else None,
+                scheduled_datetime=now + timedelta(days=offset),
+                duration_minutes=30,
+                status=(
+                    AppointmentStatus.COMPLETED
+                    if offset < 0
+                    else AppointmentStatus.SCHEDULED
+                ),
+                booking_source=BookingSource.ONLINE,
+                reason="Review",
+                created_by=patient_user.id,
+            )
+        )
+    for idx in range(40):
+        db.add(
+            Prescription(
+                patient_id=patient.id,
+                medication_name=f"Medication {idx}",
+                dosage="10mg",
+                frequency="Daily",
+                start_date=date.today(),
+                is_active=idx % 2 == 0,
+                prescribed_by=doctor.id,
+            )
+        )
+        db.add(
+            Bloodwork(
+                patient_id=patient.id,
+                test_type="Panel",
+                test_date=date.today(),
+                results={},
+                reference_ranges={},
+                is_published=idx % 4 != 0,
+            )
+        )
+        db.add(
+            Notification(
+                patient_id=patient.id,
+                type=NotificationType.GENERAL,
+                title="Notice",
+                message="Benchmark notification",
+                is_read=idx % 3 == 0,
+            )
+        )
+    db.commit()
+    return patient.id
+
+
+def legacy_render(service: PatientService, patient_id: int) -> None:
+    """Dashboard data as loaded before the aggregate query existed."""
+    service.appointment_repo.count_upcoming_appointments(patient_id)
+    service.patient_repo.get_active_prescriptions_count(patient_id)
+    service.patient_repo.get_pending_results_count(patient_id)
+    service.patient_repo.get_unread_notifications_count(patient_id)
+    service.get_next_appointment_info(patient_id)
+
+
+def aggregate_render(service: PatientService, patient_id: int) -> None:
+    """Dashboard data loaded through the single aggregate query."""
+    service.get_dashboard_overview(patient_id)
+
+
+def main() -> None:
+    """Run the benchmark and print round trips and latency per render."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url", default="sqlite:///:memory:")
+    parser.add_argument("--renders", type=int, default=500)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url, future=True)
+    if args.database_url.startswith("sqlite"):
+        Base.metadata.create_all(engine)
+
+    statements = 0
+
+    def _count(*_args) -> None:
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine, "before_cursor_execute", _count)
+
+    with Session(engine) as db:
+        patient_id = seed(db)
+        service = PatientService(db)
+        for label, render in (
+            ("per-stat queries", legacy_render),
+            ("aggregate query", aggregate_render),
+        ):
+            statements = 0
+            started = time.perf_counter()
+            for _ in range(args.renders):
+                render(service, patient_id)
+                db.expire_all()
+            elapsed = time.perf_counter() - started
+            print(
+                f"{label:>18}: {statements / args.renders:.1f} round trips/render, "
+                f"{elapsed / args.renders * 1000:.3f} ms/render"
+            )
+
+
+if __name__ == "__main__":
+    main()
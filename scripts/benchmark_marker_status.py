@@ -0,0 +1,139 @@
+"""Benchmark marker status classification: per-marker calls vs one NumPy pass.
+
+Usage:
+    python scripts/benchmark_marker_status.py [--markers N] [--repeat N]
+
+Builds a synthetic patient history from the panel registry, with roughly
+``--markers`` marker values spread over many bloodwork results, and times
+summarizing every panel card the way the bloodwork page does. The batch
+time is also split into column extraction from the marker dicts and the
+NumPy classification pass itself.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from app.services.bloodwork_service import (
+    PANEL_REGISTRY,
+    BloodworkService,
+    MarkerSummary,
+)
+from app.services.marker_status import MarkerColumns, classify_markers
+
+
+def build_history(marker_count: int, seed: int = 7) -> dict[int, dict[str, Any]]:
+    """Return normalized bloodwork payloads holding about marker_count markers."""
+    rng = random.Random(seed)
+    panels = [
+        panel
+        for panel in PANEL_REGISTRY.panels
+        if any(key in PANEL_REGISTRY.reference_ranges for key in _keys(panel))
+    ]
+    history: dict[int, dict[str, Any]] = {}
+    total = 0
+    bloodwork_id = 0
+    while total < marker_count:
+        bloodwork_id += 1
+        panel = panels[bloodwork_id % len(panels)]
+        markers = []
+        for marker in panel["markers"]:
+            reference = PANEL_REGISTRY.reference_ranges.get(
+                marker.get("key", marker.get("name"))
+            )
+            if reference is None:
+                continue
+            spread = (reference.high - reference.low) or 1.0
+            markers.append(
+                {
+                    "name": marker["name"],
+                    "value": round(
+                        rng.uniform(reference.low - spread, reference.high + spread),
+                        2,
+                    ),
+                    "reference_range": dict(marker["reference_range"]),
+                }
+            )
+        total += len(markers)
+        history[bloodwork_id] = {
+            "test_name": panel["name"],
+            "categories": [{"name": panel["name"], "markers": markers}],
+        }
+    return history
+
+
+def _keys(panel: Any) -> list[str]:
+    return [marker.get("key", marker.get("name")) for marker in panel["markers"]]
+
+
+def scalar_summaries(
+    service: BloodworkService, history: dict[int, dict[str, Any]]
+) -> dict[tuple[int, int], MarkerSummary]:
+    """Summaries computed one marker dict at a time."""
+    summaries = {}
+    for bloodwork_id, payload in history.items():
+        for index, category in enumerate(payload["categories"]):
+            markers = category["markers"]
+            summaries[(bloodwork_id, index)] = MarkerSummary(
+                total=len(markers),
+                out_of_range=sum(
+                    service.get_marker_status(marker) in {"low", "high", "critical"}
+                    for marker in markers
+                ),
+            )
+    return summaries
+
+
+def main() -> None:
+    """Run the benchmark and print per-history latency."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--markers", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    service = BloodworkService(db=None)  # type: ignore[arg-type]
+    history = build_history(args.markers)
+    marker_total = sum(
+        len(category["markers"])
+        for payload in history.values()
+        for category in payload["categories"]
+    )
+    print(f"{len(history)} results, {marker_total} markers")
+
+    expected = scalar_summaries(service, history)
+    if service.summarize_history(history) != expected:
+        raise SystemExit("batch summaries differ from scalar summaries")
+
+    markers = [
+        marker
+        for payload in history.values()
+        for category in payload["categories"]
+        for marker in category["markers"]
+    ]
+    columns = MarkerColumns.from_markers(markers)
+
+    for label, run in (
+        ("scalar", lambda: scalar_summaries(service, history)),
+        ("batch", lambda: service.summarize_history(history)),
+        ("extract", lambda: MarkerColumns.from_markers(markers)),
+        ("classify", lambda: classify_markers(columns)),
+    ):
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            run()
+        elapsed = (time.perf_counter() - started) / args.repeat
+        print(f"{label:>8}: {elapsed * 1000:.2f} ms/history")
+
+
+if __name__ == "__main__":
+    main()
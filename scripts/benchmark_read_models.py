@@ -0,0 +1,135 @@
+"""Benchmark page data hydration: ORM instances vs slotted read models.
+
+Usage:
+    python scripts/benchmark_read_models.py [--rows N] [--repeat N]
+
+Seeds one patient with ``--rows`` notifications in an in-memory SQLite
+database, then loads them the way the notifications page used to (full
+``Notification`` instances in the session identity map) and the way it
+does now (a column projection turned into ``NotificationItem``). Reports
+latency per load and the memory the loaded results hold on to.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.models import Notification, Patient, User
+from app.services.notification_service import NotificationService
+from app.utils.constants import NotificationType, UserRole
+
+
+def seed(db: Session, rows: int) -> int:
+    """Create a patient with ``rows`` notifications."""
+    user = User(
+        email="bench.patient@example.com", hashed_password="x", role=UserRole.PATIENT
+    )
+    db.add(user)
+    db.flush()
+    patient = Patient(
+        user_id=user.id,
+        nhs_number="9434765919",
+        title="Mr",
+        first_name="Bench",
+        last_name="Patient",
+        date_of_birth=date(1980, 1, 1),
+        phone_number="07111111111",
+        address_line_1="1 Bench Street",
+        city="Belfast",
+        postcode="BT12AB",
+        emergency_contact_name="Jane",
+        emergency_contact_relationship="Spouse",
+        emergency_contact_phone="07222222222",
+    )
+    db.add(patient)
+    db.flush()
+    db.execute(
+        insert(Notification),
+        [
+            {
+                "patient_id": patient.id,
+                "type": NotificationType.GENERAL,
+                "title": f"Notice {index}",
+                "message": "Your results are ready to view in the portal.",
+                "is_read": index % 3 == 0,
+            }
+            for index in range(rows)
+        ],
+    )
+    db.commit()
+    return patient.id
+
+
+def orm_load(db: Session, patient_id: int) -> list[Any]:
+    """Notifications as full ORM instances, as the page used to load them."""
+    return (
+        db.query(Notification)
+        .filter(Notification.patient_id == patient_id)
+        .order_by(Notification.created_at.desc())
+        .all()
+    )
+
+
+def dto_load(db: Session, patient_id: int) -> list[Any]:
+    """Notifications as slotted read models."""
+    return NotificationService(db).get_notifications(patient_id)
+
+
+def retained_bytes(db: Session, load: Callable[[], list[Any]]) -> int:
+    """Return the memory still allocated while the loaded results are alive."""
+    db.expunge_all()
+    gc.collect()
+    tracemalloc.start()
+    results = load()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    db.expunge_all()
+    return current
+
+
+def main() -> None:
+    """Run the benchmark and print latency and retained memory per load."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        patient_id = seed(db, args.rows)
+        for label, loader in (("orm", orm_load), ("read model", dto_load)):
+            load = lambda: loader(db, patient_id)  # noqa: E731
+            started = time.perf_counter()
+            for _ in range(args.repeat):
+                load()
+                db.expunge_all()
+            elapsed = (time.perf_counter() - started) / args.repeat
+            memory = retained_bytes(db, load)
+            print(
+                f"{label:>10}: {elapsed * 1000:.1f} ms/load, "
+                f"{memory / 1024 / 1024:.2f} MiB retained "
+                f"({memory / args.rows:.0f} B/row)"
+            )
+
+
+if __name__ == "__main__":
+    main()
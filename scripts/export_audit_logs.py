@@ -0,0 +1,61 @@
+"""Export audit log entries for a date range as CSV or Parquet.
+
+Usage:
+    python scripts/export_audit_logs.py --since 2026-01-01 --until 2026-02-01
+        [--format csv|parquet] [--output PATH] [--batch-size N]
+
+``--until`` is exclusive. Rows are streamed through a server-side cursor and
+written batch by batch, so memory stays flat however large the export is.
+CSV goes to stdout unless ``--output`` is given; Parquet needs ``--output``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import date, datetime, time, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.db.session import SessionLocal
+from app.services.audit_service import AuditService
+
+
+def _day_start(value: str) -> datetime:
+    return datetime.combine(date.fromisoformat(value), time.min, timezone.utc)
+
+
+def main() -> None:
+    """Stream the requested audit log range to a file or stdout."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--since", required=True, help="first day, YYYY-MM-DD")
+    parser.add_argument("--until", required=True, help="day after the last")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--output", type=Path)
+    parser.add_argument(
+        "--batch-size", type=int, default=AuditService.EXPORT_BATCH_SIZE
+    )
+    args = parser.parse_args()
+    if args.format == "parquet" and args.output is None:
+        parser.error("--output is required for Parquet exports.")
+
+    since, until = _day_start(args.since), _day_start(args.until)
+    db = SessionLocal()
+    try:
+        service = AuditService(db)
+        export = (
+            service.export_parquet if args.format == "parquet" else service.export_csv
+        )
+        if args.output is None:
+            written = export(since, until, sys.stdout.buffer, args.batch_size)
+        else:
+            with open(args.output, "wb") as sink:
+                written = export(since, until, sink, args.batch_size)
+    finally:
+        db.close()
+    print(f"Exported {written} audit entries.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
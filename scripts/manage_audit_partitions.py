@@ -0,0 +1,75 @@
+"""Pre-create future audit_logs partitions and archive expired ones.
+
+Usage:
+    python scripts/manage_audit_partitions.py [--months-ahead N]
+        [--retain-months N] [--archive-dir DIR] [--dry-run]
+
+Run daily (e.g. from cron) against PostgreSQL. Partitions are created from
+the current month through ``--months-ahead`` months. Each partition older
+than ``--retain-months`` is exported to ``<archive-dir>/<partition>.csv.gz``
+and, once the file is synced to disk, detached and dropped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import get_settings
+from app.db.audit_partitions import (
+    create_partition,
+    drop_partition,
+    export_partition,
+    list_partitions,
+    partition_name,
+    plan_maintenance,
+)
+from app.db.session import engine
+
+
+def main() -> None:
+    """Create upcoming partitions and archive the expired ones."""
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--months-ahead", type=int, default=settings.AUDIT_PARTITION_MONTHS_AHEAD
+    )
+    parser.add_argument(
+        "--retain-months", type=int, default=settings.AUDIT_RETENTION_MONTHS
+    )
+    parser.add_argument("--archive-dir", default=settings.AUDIT_ARCHIVE_DIR)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    if engine.dialect.name != "postgresql":
+        sys.exit("audit_logs is only partitioned on PostgreSQL.")
+
+    with engine.connect() as connection:
+        plan = plan_maintenance(
+            list_partitions(connection),
+            date.today(),
+            args.months_ahead,
+            args.retain_months,
+        )
+    for month in plan.create:
+        print(f"create {partition_name(month)}")
+        if not args.dry_run:
+            with engine.begin() as connection:
+                create_partition(connection, month)
+    for name in plan.archive:
+        print(f"archive {name}")
+        if args.dry_run:
+            continue
+        with engine.connect() as connection:
+            path = export_partition(connection, name, Path(args.archive_dir))
+        print(f"  wrote {path}")
+        with engine.begin() as connection:
+            drop_partition(connection, name)
+
+
+if __name__ == "__main__":
+    main()
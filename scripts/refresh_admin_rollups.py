@@ -0,0 +1,51 @@
+"""Refresh the daily rollups behind the admin dashboard.
+
+Usage:
+    python scripts/refresh_admin_rollups.py [--full]
+
+The dashboard refreshes the rollups incrementally when its cache expires,
+recomputing only the days of appointments and users changed since the last
+run. Run this from cron to keep them warm between visits, and with
+``--full`` nightly to pick up deletes and role changes, which an incremental
+refresh does not see.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.db.session import SessionLocal
+from app.services.admin_service import AdminService
+
+
+def main() -> None:
+    """Refresh the rollups and report how many days were rewritten."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--full", action="store_true", help="rebuild every day")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        appointment_days, registration_days = AdminService(db).refresh_rollups(
+            full=args.full
+        )
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+    if args.full:
+        print("Rebuilt the appointment and registration rollups.")
+    else:
+        print(
+            f"Refreshed {appointment_days} appointment and "
+            f"{registration_days} registration days."
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Recompute the materialized unread counters from their source tables.
+
+Usage:
+    python scripts/repair_unread_counters.py
+
+Counters are kept in step transactionally, but rows written by bulk inserts
+or by hand outside the application can leave them stale. This rebuilds
+every patient and doctor counter from the notifications and doctor
+messages tables in a single transaction.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.db.repositories.unread_counter_repository import UnreadCounterRepository
+from app.db.session import SessionLocal
+
+
+def main() -> None:
+    """Rebuild the unread counters and report how many were written."""
+    db = SessionLocal()
+    try:
+        patients, doctors = UnreadCounterRepository(db).rebuild()
+        print(f"Rebuilt {patients} patient and {doctors} doctor unread counters.")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,8 @@ def pytest_configure() -> None:
     """Configure environment variables for tests."""
     os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
     os.environ.setdefault("SECRET_KEY", "test-secret")
+    # Audit rows go through the test session; AuditWriter is tested directly.
+    os.environ.setdefault("AUDIT_WRITER_MODE", "sync")
 
 
 @pytest.fixture(scope="session")
@@ -34,6 +36,23 @@ def test_engine():
     engine.dispose()
 
 
+@pytest.fixture(autouse=True)
+def clear_dashboard_caches():
+    """Start every test with empty dashboard caches."""
+    from app.utils.cache import (
+        admin_dashboard_cache,
+        doctor_dashboard_cache,
+        patient_dashboard_cache,
+    )
+
+    caches = (patient_dashboard_cache, doctor_dashboard_cache, admin_dashboard_cache)
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+
+
 @pytest.fixture
 def test_db(test_engine) -> Session:
     """Provide a database session for a test."""
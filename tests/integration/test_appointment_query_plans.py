@@ -0,0 +1,125 @@
+"""Query plan checks for appointment repository access paths."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, event, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from app.db.repositories.appointment_repository import AppointmentRepository
+from app.models.appointment import Appointment
+from app.utils.constants import AppointmentStatus, BookingSource
+
+SEED_ROWS = 50_000
+PATIENTS = 2_000
+DOCTORS = 40
+
+
+@pytest.fixture(scope="module")
+def seeded_session():
+    """A session over an ANALYZEd appointments table with realistic spread."""
+    from app import models  # noqa: F401  # ensure models are registered
+    from app.db.base import Base
+
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    rng = random.Random(13)
+    statuses = list(AppointmentStatus)
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    rows = [
+        {
+            "patient_id": rng.randint(1, PATIENTS),
+            "doctor_id": rng.randint(1, DOCTORS),
+            "scheduled_datetime": start + timedelta(minutes=30 * rng.randint(0, 2**17)),
+            "duration_minutes": 30,
+            "status": rng.choice(statuses),
+            "booking_source": BookingSource.ONLINE,
+            "created_by": 1,
+        }
+        for _ in range(SEED_ROWS)
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(Appointment), rows)
+        conn.execute(text("ANALYZE"))
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _appointment_plans(session, call) -> list[str]:
+    """Run ``call`` and return the plan lines touching the appointments table."""
+    statements: list[tuple[str, object]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        call(AppointmentRepository(session))
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    plans = []
+    raw = session.connection().connection.driver_connection
+    for statement, parameters in statements:
+        for row in raw.execute(f"EXPLAIN QUERY PLAN {statement}", parameters):
+            detail = row[-1]
+            if " appointments" in detail:
+                plans.append(detail)
+    return plans
+
+
+NOW = datetime.now(timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda repo: repo.get_booked_slots_between(NOW, NOW + timedelta(days=1)),
+        lambda repo: repo.get_booked_slots_between(
+            NOW, NOW + timedelta(days=1), doctor_id=3
+        ),
+        lambda repo: repo.get_patient_appointments(7),
+        lambda repo: repo.get_patient_appointments(7, upcoming_only=True),
+        lambda repo: repo.get_next_appointment(7),
+        lambda repo: repo.count_upcoming_appointments(7),
+        lambda repo: repo.get_patient_upcoming_appointments(7, limit=5),
+        lambda repo: repo.get_pending_appointments(),
+        lambda repo: repo.get_doctor_appointments(3, NOW, NOW + timedelta(days=7)),
+        lambda repo: repo.get_doctor_appointments(3, NOW, active_only=True, limit=6),
+        lambda repo: repo.count_doctor_active_appointments(3, NOW),
+        lambda repo: repo.get_patient_past_appointments(7, limit=5),
+        lambda repo: repo.get_patient_past_appointments(
+            7, limit=5, after=(NOW - timedelta(days=400), 10_000)
+        ),
+        lambda repo: repo.get_patient_upcoming_appointments(
+            7, limit=5, after=(NOW + timedelta(days=30), 10_000)
+        ),
+        lambda repo: repo.count_patient_past_appointments(7),
+        lambda repo: repo.count_patient_past_appointments(7, cap=300),
+    ],
+)
+def test_repository_queries_search_an_index(seeded_session, call):
+    plans = _appointment_plans(seeded_session, call)
+
+    assert plans
+    for detail in plans:
+        assert detail.startswith("SEARCH appointments USING"), detail
+
+
+def test_patient_and_doctor_lookups_use_composite_indexes(seeded_session):
+    patient_plans = _appointment_plans(
+        seeded_session, lambda repo: repo.get_patient_past_appointments(7, limit=5)
+    )
+    doctor_plans = _appointment_plans(
+        seeded_session,
+        lambda repo: repo.get_doctor_appointments(3, NOW, NOW + timedelta(days=7)),
+    )
+
+    assert any("idx_appointments_patient_" in detail for detail in patient_plans)
+    assert any("idx_appointments_doctor_scheduled" in detail for detail in doctor_plans)
@@ -0,0 +1,121 @@
+"""Round trip of the audit_logs partitioning migration on PostgreSQL.
+
+Migration 008 only targets PostgreSQL, so this runs against the empty
+database named by ``TEST_POSTGRES_URL`` and is skipped without one, e.g.::
+
+    TEST_POSTGRES_URL=postgresql+psycopg://user@localhost/carelink_migrations \\
+        pytest tests/integration/test_audit_partition_migration.py
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+ROOT = Path(__file__).resolve().parents[2]
+BEFORE = "007_add_unread_counters"
+PARTITIONED = "008_partition_audit_logs"
+SEED_ROWS = 20_000
+
+pytestmark = pytest.mark.skipif(
+    POSTGRES_URL is None, reason="TEST_POSTGRES_URL is not set"
+)
+
+
+@pytest.fixture
+def alembic_config():
+    """Alembic config for the test database, downgraded to empty afterwards."""
+    config = Config(str(ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT / "migrations"))
+    config.attributes["database_url"] = POSTGRES_URL
+    yield config
+    command.downgrade(config, "base")
+
+
+@pytest.fixture
+def engine():
+    """Engine on the test database."""
+    engine = create_engine(POSTGRES_URL, future=True)
+    yield engine
+    engine.dispose()
+
+
+def _audit_state(connection) -> tuple:
+    return connection.execute(
+        text(
+            "SELECT count(*), min(id), max(id), min(timestamp), max(timestamp), "
+            "sum(resource_id) FROM audit_logs"
+        )
+    ).one()
+
+
+def test_partitioning_round_trip_keeps_every_row(alembic_config, engine):
+    command.upgrade(alembic_config, BEFORE)
+    with engine.begin() as connection:
+        user_id = connection.scalar(
+            text(
+                "INSERT INTO users (email, hashed_password, role, is_active) "
+                "VALUES ('audit@example.com', 'x', 'admin', true) RETURNING id"
+            )
+        )
+        # Two years of hourly entries, so the migration creates one
+        # partition per month from the earliest row.
+        connection.execute(
+            text(
+                "INSERT INTO audit_logs (user_id, action, resource_type, "
+                'resource_id, details, "timestamp") '
+                "SELECT :user_id, 'view_record', 'patient', g, '{}', "
+                "now() - (g % (730 * 24)) * interval '1 hour' "
+                "FROM generate_series(1, :rows) g"
+            ),
+            {"user_id": user_id, "rows": SEED_ROWS},
+        )
+        before = _audit_state(connection)
+
+    command.upgrade(alembic_config, PARTITIONED)
+    with engine.begin() as connection:
+        assert _audit_state(connection) == before
+        assert (
+            connection.scalar(
+                text("SELECT relkind FROM pg_class WHERE relname = 'audit_logs'")
+            )
+            == "p"
+        )
+        assert connection.scalar(text("SELECT count(*) FROM audit_logs_default")) == 0
+        partitions = connection.scalar(
+            text(
+                "SELECT count(*) FROM pg_inherits "
+                "WHERE inhparent = 'audit_logs'::regclass"
+            )
+        )
+        assert partitions >= 24
+        # The id sequence carried over, so new rows continue after the old.
+        new_id = connection.scalar(
+            text(
+                "INSERT INTO audit_logs (user_id, action, resource_type, details) "
+                "VALUES (:user_id, 'login', 'user', '{}') RETURNING id"
+            ),
+            {"user_id": user_id},
+        )
+        assert new_id > before[2]
+        connection.execute(
+            text("DELETE FROM audit_logs WHERE id = :id"), {"id": new_id}
+        )
+
+    command.downgrade(alembic_config, BEFORE)
+    with engine.begin() as connection:
+        assert _audit_state(connection) == before
+        assert (
+            connection.scalar(
+                text("SELECT relkind FROM pg_class WHERE relname = 'audit_logs'")
+            )
+            == "r"
+        )
+
+    command.upgrade(alembic_config, "head")
@@ -0,0 +1,102 @@
+"""Query plan checks for audit log search."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, event, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from app.db.repositories.audit_repository import AuditRepository
+from app.models.audit_log import AuditLog
+
+SEED_ROWS = 30_000
+NOW = datetime.now(timezone.utc)
+WEEK_AGO = NOW - timedelta(days=7)
+
+
+@pytest.fixture(scope="module")
+def seeded_session():
+    """A session over an ANALYZEd audit_logs table spread over a year."""
+    from app import models  # noqa: F401  # ensure models are registered
+    from app.db.base import Base
+
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    rng = random.Random(22)
+    actions = ["login", "logout", "view_record", "update_record", "book_appointment"]
+    rows = [
+        {
+            "user_id": rng.randint(1, 500),
+            "action": rng.choice(actions),
+            "resource_type": rng.choice(["user", "patient", "appointment"]),
+            "resource_id": rng.randint(1, 5_000),
+            "details": {},
+            "timestamp": NOW - timedelta(minutes=rng.randint(0, 525_600)),
+        }
+        for _ in range(SEED_ROWS)
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(AuditLog), rows)
+        conn.execute(text("ANALYZE"))
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _audit_plans(session, call) -> list[str]:
+    statements: list[tuple[str, object]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        call(AuditRepository(session))
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    raw = session.connection().connection.driver_connection
+    [(statement, parameters)] = statements
+    return [
+        row[-1]
+        for row in raw.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        if " audit_logs" in row[-1] or "TEMP B-TREE" in row[-1]
+    ]
+
+
+@pytest.mark.parametrize(
+    ("filters", "index"),
+    [
+        ({}, "idx_audit_timestamp"),
+        ({"user_id": 7}, "idx_audit_user_timestamp"),
+        ({"action": "login"}, "idx_audit_action_timestamp"),
+        (
+            {"resource_type": "patient", "resource_id": 42},
+            "idx_audit_resource_timestamp",
+        ),
+        ({"user_id": 7, "before": (NOW, 10_000)}, "idx_audit_user_timestamp"),
+    ],
+)
+def test_search_walks_an_index_in_order(seeded_session, filters, index):
+    plans = _audit_plans(
+        seeded_session, lambda repo: repo.search(since=WEEK_AGO, **filters)
+    )
+
+    assert any(index in detail for detail in plans), plans
+    assert not any("TEMP B-TREE" in detail for detail in plans), plans
+
+
+def test_export_stream_walks_the_timestamp_index(seeded_session):
+    def stream(repo):
+        for _ in repo.stream_window(WEEK_AGO, NOW, batch_size=100):
+            pass
+
+    plans = _audit_plans(seeded_session, stream)
+
+    assert any("idx_audit_timestamp" in detail for detail in plans), plans
+    assert not any("TEMP B-TREE" in detail for detail in plans), plans
@@ -0,0 +1,151 @@
+"""Booking advisory locks on PostgreSQL.
+
+The per-day booking lock is a ``pg_advisory_xact_lock`` only on PostgreSQL,
+so this runs against the empty database named by ``TEST_POSTGRES_URL`` and
+is skipped without one, e.g.::
+
+    TEST_POSTGRES_URL=postgresql+psycopg://user@localhost/carelink_bookings \\
+        pytest tests/integration/test_booking_lock_postgres.py
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Doctor, Patient, User
+from app.models.appointment import Appointment
+from app.services.appointment_service import AppointmentService
+from app.utils.constants import AppointmentStatus, BookingSource, UserRole
+
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+ROOT = Path(__file__).resolve().parents[2]
+DAY = date.today() + timedelta(days=4)
+
+pytestmark = pytest.mark.skipif(
+    POSTGRES_URL is None, reason="TEST_POSTGRES_URL is not set"
+)
+
+
+@pytest.fixture
+def session_factory():
+    """Sessions on a migrated test database, downgraded to empty afterwards."""
+    config = Config(str(ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT / "migrations"))
+    config.attributes["database_url"] = POSTGRES_URL
+    command.upgrade(config, "head")
+    engine = create_engine(POSTGRES_URL, future=True)
+    yield sessionmaker(bind=engine, autoflush=False)
+    engine.dispose()
+    command.downgrade(config, "base")
+
+
+@pytest.fixture
+def people(session_factory):
+    """IDs of a patient user, a doctor and a patient."""
+    with session_factory() as db:
+        user = User(
+            email=f"{uuid.uuid4()}@example.com",
+            hashed_password="not-a-real-hash",
+            role=UserRole.PATIENT,
+        )
+        doctor_user = User(
+            email=f"{uuid.uuid4()}@example.com",
+            hashed_password="not-a-real-hash",
+            role=UserRole.DOCTOR,
+        )
+        db.add_all([user, doctor_user])
+        db.flush()
+        doctor = Doctor(
+            user_id=doctor_user.id,
+            gmc_number=str(uuid.uuid4().int)[:7],
+            title="Dr",
+            first_name="Test",
+            last_name="Doctor",
+            specialty="Cardiology",
+            phone_number="07123456789",
+            email=doctor_user.email,
+        )
+        db.add(doctor)
+        db.flush()
+        patient = Patient(
+            user_id=user.id,
+            nhs_number=str(uuid.uuid4().int)[:10],
+            title="Mr",
+            first_name="Test",
+            last_name="Patient",
+            date_of_birth=date(1990, 1, 1),
+            phone_number="07111111111",
+            address_line_1="1 Health Street",
+            city="Belfast",
+            postcode="BT12AB",
+            emergency_contact_name="Jane Doe",
+            emergency_contact_relationship="Spouse",
+            emergency_contact_phone="07222222222",
+            doctor_id=doctor.id,
+        )
+        db.add(patient)
+        db.commit()
+        return user.id, doctor.id, patient.id
+
+
+def _at(hour: int) -> datetime:
+    return datetime.combine(DAY, time(hour, 0), tzinfo=timezone.utc)
+
+
+def _book(db, user_id: int, patient_id: int, hour: int) -> Appointment:
+    return AppointmentService(db).create_appointment(
+        patient_id=patient_id,
+        scheduled_datetime=_at(hour),
+        duration_minutes=30,
+        reason="Lock test",
+        created_by_user_id=user_id,
+    )
+
+
+def test_rejected_bookings_release_the_day_lock(session_factory, people):
+    user_id, doctor_id, patient_id = people
+    with session_factory() as db:
+        _book(db, user_id, patient_id, 9)
+        # The doctor is already booked at 11:00, so assigning them to the
+        # other 11:00 request fails.
+        taken, pending = (
+            Appointment(
+                patient_id=patient_id,
+                doctor_id=assigned,
+                scheduled_datetime=_at(11),
+                duration_minutes=30,
+                status=status,
+                booking_source=BookingSource.ONLINE,
+                reason="Lock test",
+                created_by=user_id,
+            )
+            for assigned, status in (
+                (doctor_id, AppointmentStatus.SCHEDULED),
+                (None, AppointmentStatus.PENDING),
+            )
+        )
+        db.add_all([taken, pending])
+        db.commit()
+        pending_id = pending.id
+
+    # Like a page run, the failing session stays open after catching the error.
+    with session_factory() as failing, session_factory() as other:
+        other.execute(text("SET lock_timeout = '2s'"))
+        with pytest.raises(ValueError, match="no longer available"):
+            _book(failing, user_id, patient_id, 9)
+        assert _book(other, user_id, patient_id, 10).id is not None
+
+        with pytest.raises(ValueError, match="not available"):
+            AppointmentService(failing).assign_doctor_to_appointment(
+                pending_id, doctor_id
+            )
+        assert _book(other, user_id, patient_id, 13).id is not None
@@ -0,0 +1,114 @@
+"""Tests for the admin dashboard rollups."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import select
+
+from app.models.appointment import Appointment
+from app.models.daily_stats import DailyAppointmentStat, DailyRegistrationStat
+from app.models.doctor import Doctor
+from app.models.user import User
+from app.services.admin_service import AdminService
+from app.utils.cache import admin_dashboard_cache
+from app.utils.constants import AppointmentStatus, UserRole
+
+# Far enough ahead that no other test books appointments on these days.
+DAY = date(2031, 3, 10)
+
+
+def _appointment(patient, day: date, hour: int, status: AppointmentStatus):
+    return Appointment(
+        patient_id=patient.id,
+        scheduled_datetime=datetime(
+            day.year, day.month, day.day, hour, tzinfo=timezone.utc
+        ),
+        status=status,
+        created_by=patient.user_id,
+    )
+
+
+def test_incremental_refresh_follows_appointment_changes(test_db, test_patient):
+    service = AdminService(test_db)
+    service.refresh_rollups()
+    appointments = [
+        _appointment(test_patient, DAY, 9, AppointmentStatus.SCHEDULED),
+        _appointment(test_patient, DAY, 10, AppointmentStatus.SCHEDULED),
+        _appointment(test_patient, DAY, 23, AppointmentStatus.PENDING),
+        _appointment(
+            test_patient, DAY + timedelta(days=1), 0, AppointmentStatus.PENDING
+        ),
+    ]
+    test_db.add_all(appointments)
+    test_db.commit()
+
+    dashboard = service.get_dashboard(days=7, today=DAY + timedelta(days=1))
+    assert [item.appointments for item in dashboard.activity[-2:]] == [3, 1]
+    assert dashboard.activity[0].day == DAY - timedelta(days=5)
+    assert dashboard.overview.today_appointments == 1
+
+    appointments[0].status = AppointmentStatus.CANCELLED
+    test_db.commit()
+    admin_dashboard_cache.clear()
+    dashboard = service.get_dashboard(days=7, today=DAY + timedelta(days=1))
+    assert [item.appointments for item in dashboard.activity[-2:]] == [2, 1]
+    cancelled = test_db.scalar(
+        select(DailyAppointmentStat.appointment_count).where(
+            DailyAppointmentStat.day == DAY,
+            DailyAppointmentStat.status == AppointmentStatus.CANCELLED,
+        )
+    )
+    assert cancelled == 1
+
+
+def test_overview_counts_registrations_and_approvals(test_db):
+    service = AdminService(test_db)
+    before = service.get_dashboard()
+    user = User(
+        email=f"{uuid.uuid4()}@example.com",
+        hashed_password="not-a-real-hash",
+        role=UserRole.DOCTOR,
+    )
+    test_db.add(user)
+    test_db.flush()
+    test_db.add(
+        Doctor(
+            user_id=user.id,
+            gmc_number=str(uuid.uuid4().int)[:7],
+            title="Dr",
+            first_name="Pending",
+            last_name="Doctor",
+            specialty="Dermatology",
+            phone_number="07123456780",
+            email=user.email,
+        )
+    )
+    test_db.commit()
+
+    # Served from the cache until the TTL expires, then refreshed.
+    assert service.get_dashboard() is before
+    admin_dashboard_cache.clear()
+    after = service.get_dashboard()
+    assert after.overview.total_doctors == before.overview.total_doctors + 1
+    assert after.overview.pending_approvals == before.overview.pending_approvals + 1
+    assert after.activity[-1].registrations == before.activity[-1].registrations + 1
+    assert len(after.activity) == 7
+
+
+def test_incremental_refresh_matches_full_rebuild(test_db, test_patient):
+    service = AdminService(test_db)
+    test_db.add(_appointment(test_patient, DAY, 12, AppointmentStatus.COMPLETED))
+    test_db.commit()
+    service.refresh_rollups()
+
+    def snapshot():
+        return (
+            set(test_db.execute(select(DailyAppointmentStat.__table__)).all()),
+            set(test_db.execute(select(DailyRegistrationStat.__table__)).all()),
+        )
+
+    incremental = snapshot()
+    assert service.refresh_rollups(full=True) == (-1, -1)
+    assert snapshot() == incremental
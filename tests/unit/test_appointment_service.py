@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import date, datetime, time, timedelta, timezone
 
 import pytest
+from sqlalchemy import create_engine, event, update
+from sqlalchemy.orm import sessionmaker
 
 from app.models.appointment import Appointment
 from app.services.appointment_service import AppointmentService
 from app.utils.constants import AppointmentStatus, BookingSource
+from app.utils.pagination import TotalEstimate, decode_cursor, encode_cursor
 
 
 def test_get_available_slots_blocks_overlaps(
@@ -63,3 +69,216 @@ def test_create_appointment_conflict_raises(test_db, test_patient, test_user):
             reason="Conflicting",
             created_by_user_id=test_user.id,
         )
+
+
+def test_assign_doctor_rechecks_the_appointment_under_the_lock(
+    test_db, test_patient, test_doctor, test_user
+):
+    scheduled = datetime.combine(
+        date.today() + timedelta(days=3), time(14, 0), tzinfo=timezone.utc
+    )
+    appointment = Appointment(
+        patient_id=test_patient.id,
+        doctor_id=None,
+        scheduled_datetime=scheduled,
+        duration_minutes=30,
+        status=AppointmentStatus.PENDING,
+        booking_source=BookingSource.ONLINE,
+        reason="Pending",
+        created_by=test_user.id,
+    )
+    test_db.add(appointment)
+    test_db.commit()
+    service = AppointmentService(test_db)
+    booking_lock = service.appointment_repo.booking_lock
+
+    @contextmanager
+    def assigned_meanwhile(target_date):
+        # Another admin assigns the appointment while this one waits.
+        test_db.execute(
+            update(Appointment)
+            .where(Appointment.id == appointment.id)
+            .values(doctor_id=test_doctor.id, status=AppointmentStatus.SCHEDULED)
+        )
+        with booking_lock(target_date):
+            yield
+
+    service.appointment_repo.booking_lock = assigned_meanwhile
+    with pytest.raises(ValueError, match="has changed since it was loaded"):
+        service.assign_doctor_to_appointment(appointment.id, test_doctor.id)
+
+
+def test_month_availability_matches_daily_slots_in_one_query(
+    test_db, test_engine, test_patient, test_user
+):
+    target_date = date.today().replace(day=1) + timedelta(days=62)
+    target_date = target_date.replace(day=10)
+    for hour in range(9, 17):
+        test_db.add(
+            Appointment(
+                patient_id=test_patient.id,
+                doctor_id=None,
+                scheduled_datetime=datetime.combine(
+                    target_date, time(hour, 0), tzinfo=timezone.utc
+                ),
+                duration_minutes=60,
+                status=AppointmentStatus.PENDING,
+                booking_source=BookingSource.ONLINE,
+                reason="Block",
+                created_by=test_user.id,
+            )
+        )
+    test_db.commit()
+    service = AppointmentService(test_db)
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", _record)
+    try:
+        month = service.get_month_availability(target_date.year, target_date.month)
+    finally:
+        event.remove(test_engine, "before_cursor_execute", _record)
+
+    assert len(statements) == 1
+    assert month[target_date] == 1  # only the 5:00 PM slot is left
+    for day in (target_date, target_date + timedelta(days=1)):
+        am_slots, pm_slots = service.get_available_slots(day)
+        assert month[day] == sum(slot.is_available for slot in am_slots + pm_slots)
+
+
+def test_concurrent_bookings_for_one_slot_admit_exactly_one(
+    tmp_path, test_patient, test_user
+):
+    from app.db.base import Base
+
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'booking.db'}",
+        connect_args={"timeout": 30, "check_same_thread": False},
+        future=True,
+    )
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine, autoflush=False)
+    scheduled = datetime.combine(
+        date.today() + timedelta(days=5), time(11, 0), tzinfo=timezone.utc
+    )
+    attempts = 100
+    barrier = threading.Barrier(attempts)
+
+    def book(_: int) -> bool:
+        with SessionLocal() as db:
+            barrier.wait()
+            try:
+                AppointmentService(db).create_appointment(
+                    patient_id=test_patient.id,
+                    scheduled_datetime=scheduled,
+                    duration_minutes=30,
+                    reason="Race",
+                    created_by_user_id=test_user.id,
+                )
+            except ValueError:
+                return False
+            return True
+
+    try:
+        with ThreadPoolExecutor(max_workers=attempts) as pool:
+            outcomes = list(pool.map(book, range(attempts)))
+        with SessionLocal() as db:
+            booked = db.query(Appointment).count()
+    finally:
+        engine.dispose()
+
+    assert outcomes.count(True) == 1
+    assert booked == 1
+
+
+def test_keyset_pages_walk_history_without_gaps(test_db, test_patient, test_user):
+    base = datetime(2019, 3, 1, 9, 0, tzinfo=timezone.utc)
+    for index in range(7):
+        test_db.add(
+            Appointment(
+                patient_id=test_patient.id,
+                doctor_id=None,
+                # Two appointments share each start time to exercise the id tiebreak.
+                scheduled_datetime=base + timedelta(days=index // 2),
+                duration_minutes=30,
+                status=AppointmentStatus.COMPLETED,
+                booking_source=BookingSource.ONLINE,
+                reason=f"Visit {index}",
+                created_by=test_user.id,
+            )
+        )
+    test_db.commit()
+    service = AppointmentService(test_db)
+    expected = [
+        appointment.id
+        for appointment in test_db.query(Appointment)
+        .filter(Appointment.patient_id == test_patient.id)
+        .order_by(Appointment.scheduled_datetime.desc(), Appointment.id.desc())
+    ]
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        page = service.get_patient_past_page(test_patient.id, 3, cursor=cursor)
+        seen.extend(appointment.id for appointment in page.items)
+        pages += 1
+        if not page.has_more:
+            break
+        cursor = page.next_cursor
+
+    assert seen == expected
+    assert pages == 3
+    assert service.estimate_patient_past_total(test_patient.id) == TotalEstimate(
+        count=7, is_exact=True
+    )
+    service.LIST_COUNT_CAP = 5
+    assert service.estimate_patient_past_total(test_patient.id) == TotalEstimate(
+        count=5, is_exact=False
+    )
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    key = (datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc), 42)
+
+    assert decode_cursor(encode_cursor(key)) == key
+    with pytest.raises(ValueError, match="Invalid page cursor."):
+        decode_cursor("not-a-cursor")
+
+
+def test_list_pages_project_card_columns_and_share_doctors(
+    test_db, test_engine, test_patient, test_doctor, test_user
+):
+    base = datetime(2018, 6, 1, 9, 0, tzinfo=timezone.utc)
+    for index in range(4):
+        test_db.add(
+            Appointment(
+                patient_id=test_patient.id,
+                doctor_id=test_doctor.id if index < 3 else None,
+                scheduled_datetime=base + timedelta(days=index),
+                duration_minutes=30,
+                status=AppointmentStatus.COMPLETED,
+                booking_source=BookingSource.ONLINE,
+                reason="Checkup",
+                created_by=test_user.id,
+            )
+        )
+    test_db.commit()
+    patient_id, doctor_last_name = test_patient.id, test_doctor.last_name
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", capture)
+    try:
+        page = AppointmentService(test_db).get_patient_past_page(patient_id, 4)
+    finally:
+        event.remove(test_engine, "before_cursor_execute", capture)
+
+    assert len(statements) == 1
+    assert "users" not in statements[0]
+    assert "hashed_password" not in statements[0]
+    assert [item.doctor is None for item in page.items] == [True, False, False, False]
+    assert page.items[1].doctor is page.items[2].doctor is page.items[3].doctor
+    assert page.items[1].doctor.last_name == doctor_last_name
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
 import streamlit as st
-from sqlalchemy import select
+from sqlalchemy import create_engine, event, func, select
 from sqlalchemy.orm import Session
 
+from app.config import get_settings
 from app.models.audit_log import AuditLog
+from app.security import audit
 from app.security.audit import AuditAction, audit_log, log_action
+from app.security.audit_writer import AuditWriter
 
 
 def test_log_action_creates_entry(test_db: Session, test_user):
@@ -46,3 +54,109 @@ def test_audit_log_decorator(test_db: Session, test_user):
     logged = test_db.execute(select(AuditLog)).scalars().all()
     assert len(logged) == 1
     assert logged[0].resource_id == test_user.id
+
+
+@pytest.fixture
+def audit_engine(tmp_path):
+    """A file-backed engine the writer thread can share with the test."""
+    from app.db.base import Base
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}", future=True)
+    Base.metadata.create_all(engine, tables=[AuditLog.__table__])
+    yield engine
+    engine.dispose()
+
+
+def _row(index: int) -> dict:
+    return {
+        "user_id": 1,
+        "action": AuditAction.VIEW_RECORD,
+        "resource_type": "patient",
+        "resource_id": index,
+        "details": {},
+        "timestamp": datetime.now(timezone.utc),
+    }
+
+
+def test_writer_batches_rows_and_flushes_on_shutdown(audit_engine):
+    inserts: list[int] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO audit_logs"):
+            inserts.append(len(parameters) if executemany else 1)
+
+    event.listen(audit_engine, "before_cursor_execute", capture)
+    writer = AuditWriter(audit_engine, capacity=1000, batch_size=50)
+    release = threading.Event()
+    # Hold the worker inside its first write so later rows pile up.
+    event.listen(audit_engine, "begin", lambda conn: release.wait(5))
+
+    assert all(writer.submit(_row(index)) for index in range(120))
+    assert writer.stats().queue_depth > 0
+    release.set()
+    writer.shutdown()
+
+    stats = writer.stats()
+    assert stats.written == 120 and stats.dropped == 0 and stats.queue_depth == 0
+    assert max(inserts) == 50 and sum(inserts) == 120
+    with audit_engine.connect() as conn:
+        assert conn.scalar(select(func.count(AuditLog.id))) == 120
+    assert writer.submit(_row(0)) is False
+
+
+def test_writer_drops_when_full_and_counts_failed_batches(audit_engine):
+    writer = AuditWriter(audit_engine, capacity=2, batch_size=10)
+    release = threading.Event()
+    event.listen(audit_engine, "begin", lambda conn: release.wait(5))
+
+    results = [writer.submit(_row(index)) for index in range(10)]
+    release.set()
+    assert writer.flush(timeout=5)
+
+    stats = writer.stats()
+    assert results.count(False) == stats.dropped > 0
+    assert stats.written == results.count(True)
+
+    broken = _row(0) | {"user_id": None}
+    writer.submit(broken)
+    assert writer.flush(timeout=5)
+    assert writer.stats().failed_batches == 1
+    writer.shutdown()
+
+
+def test_async_entries_are_written_only_when_the_caller_commits(
+    audit_engine, test_db: Session, test_user, monkeypatch
+):
+    st.session_state.clear()
+    writer = AuditWriter(audit_engine, capacity=100, batch_size=10)
+    monkeypatch.setattr(get_settings(), "AUDIT_WRITER_MODE", "async")
+    monkeypatch.setattr(audit, "get_audit_writer", lambda: writer)
+
+    def log(resource_id: int) -> None:
+        log_action(test_db, test_user.id, AuditAction.VIEW_RECORD, "user", resource_id)
+
+    test_db.commit()
+    log(1)
+    test_db.rollback()
+    log(2)
+    assert writer.stats().written == 0
+    test_db.commit()
+    assert writer.flush(timeout=5)
+    writer.shutdown()
+
+    with audit_engine.connect() as conn:
+        assert conn.scalars(select(AuditLog.resource_id)).all() == [2]
+
+
+def test_shutdown_gives_up_when_the_queue_stays_full(audit_engine):
+    writer = AuditWriter(audit_engine, capacity=1, batch_size=1)
+    release = threading.Event()
+    event.listen(audit_engine, "begin", lambda conn: release.wait(5))
+    writer.submit(_row(0))  # taken by the worker, which then blocks
+    time.sleep(0.1)
+    writer.submit(_row(1))  # fills the queue
+
+    started = time.monotonic()
+    writer.shutdown(timeout=0.2)
+    assert time.monotonic() - started < 1
+    release.set()
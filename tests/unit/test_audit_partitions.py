@@ -0,0 +1,38 @@
+"""Tests for audit log partition planning."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from app.db.audit_partitions import (
+    add_months,
+    partition_month,
+    partition_name,
+    plan_maintenance,
+)
+
+
+def test_partition_names_round_trip():
+    assert partition_name(date(2026, 1, 1)) == "audit_logs_y2026m01"
+    assert partition_month("audit_logs_y2026m01") == date(2026, 1, 1)
+    assert partition_month("audit_logs_default") is None
+    assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+
+def test_plan_creates_missing_months_and_archives_expired():
+    existing = [
+        "audit_logs_default",
+        "audit_logs_y2024m08",
+        "audit_logs_y2024m09",
+        "audit_logs_y2024m10",
+        "audit_logs_y2026m10",
+        "audit_logs_y2026m12",
+    ]
+
+    plan = plan_maintenance(
+        existing, date(2026, 10, 18), months_ahead=3, retain_months=24
+    )
+
+    assert plan.create == [date(2026, 11, 1), date(2027, 1, 1)]
+    assert plan.archive == ["audit_logs_y2024m08", "audit_logs_y2024m09"]
@@ -0,0 +1,105 @@
+"""Tests for audit log search."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+
+import pyarrow.parquet as pq
+
+from app.models.audit_log import AuditLog
+from app.services.audit_service import AuditSearch, AuditService
+
+
+def _entries(user_id: int, count: int, start: datetime) -> list[AuditLog]:
+    return [
+        AuditLog(
+            user_id=user_id,
+            action="view_record" if index % 2 else "login",
+            resource_type="patient",
+            resource_id=index % 3,
+            details={"index": index},
+            # Pairs share a timestamp so paging must break ties by id.
+            timestamp=start + timedelta(seconds=index // 2),
+        )
+        for index in range(count)
+    ]
+
+
+def test_search_pages_by_keyset_with_filters(test_db, test_user):
+    start = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    test_db.add_all(_entries(test_user.id, 25, start))
+    test_db.commit()
+    service = AuditService(test_db)
+    window = AuditSearch(
+        since=start, until=start + timedelta(days=1), user_email=test_user.email
+    )
+
+    seen: list[int] = []
+    cursor = None
+    while True:
+        page = service.search(window, page_size=10, cursor=cursor)
+        seen.extend(item.id for item in page.items)
+        if not page.has_more:
+            break
+        cursor = page.next_cursor
+
+    assert len(seen) == 25 == len(set(seen))
+    newest = service.search(window, page_size=1).items[0]
+    assert newest.user_email == test_user.email
+    assert newest.details == {"index": 24}
+
+    filtered = service.search(
+        AuditSearch(
+            since=start,
+            action="view_record",
+            resource_type="patient",
+            resource_id=1,
+            user_email=test_user.email,
+        )
+    )
+    assert {item.details["index"] % 6 for item in filtered.items} == {1}
+    assert len(filtered.items) == 4
+    unknown = service.search(AuditSearch(since=start, user_email="nobody@x.test"))
+    assert unknown.items == []
+
+
+def test_exports_stream_the_window_in_batches(test_db, test_user):
+    start = datetime(2031, 1, 1, tzinfo=timezone.utc)
+    test_db.add_all(_entries(test_user.id, 25, start))
+    test_db.commit()
+    service = AuditService(test_db)
+    end = start + timedelta(days=1)
+
+    csv_sink = io.BytesIO()
+    assert service.export_csv(start, end, csv_sink, batch_size=10) == 25
+    rows = list(csv.DictReader(io.StringIO(csv_sink.getvalue().decode())))
+    assert len(rows) == 25
+    assert rows[0]["details"] == '{"index": 0}'
+
+    parquet_sink = io.BytesIO()
+    assert service.export_parquet(start, end, parquet_sink, batch_size=10) == 25
+    parquet_sink.seek(0)
+    exported = pq.ParquetFile(parquet_sink)
+    assert exported.metadata.num_rows == 25
+    assert exported.metadata.num_row_groups == 3
+
+
+def test_exports_stop_at_the_row_limit(test_db, test_user):
+    start = datetime(2031, 2, 1, tzinfo=timezone.utc)
+    test_db.add_all(_entries(test_user.id, 25, start))
+    test_db.commit()
+    service = AuditService(test_db)
+    end = start + timedelta(days=1)
+
+    csv_sink = io.BytesIO()
+    assert service.export_csv(start, end, csv_sink, batch_size=10, limit=12) == 12
+    rows = list(csv.DictReader(io.StringIO(csv_sink.getvalue().decode())))
+    # The oldest entries are kept.
+    assert sorted(json.loads(row["details"])["index"] for row in rows) == list(
+        range(12)
+    )
+    assert service.export_is_truncated(start, end, 12)
+    assert not service.export_is_truncated(start, end, 25)
@@ -0,0 +1,53 @@
+"""Tests for the availability interval index."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+
+from app.services.availability import Booking, DayAvailability, IntervalIndex
+
+DAY = datetime(2030, 1, 7, 9, 0, tzinfo=timezone.utc)
+
+
+def _minutes(value: int) -> datetime:
+    return DAY + timedelta(minutes=value)
+
+
+def test_interval_index_matches_pairwise_overlap():
+    rng = random.Random(3)
+    intervals = []
+    for _ in range(40):
+        start = rng.randrange(0, 480, 5)
+        intervals.append((_minutes(start), _minutes(start + rng.choice([15, 30, 60]))))
+    index = IntervalIndex(intervals)
+
+    for start in range(-30, 500, 5):
+        for length in (10, 30, 45):
+            query = (_minutes(start), _minutes(start + length))
+            expected = any(
+                query[0] < booked_end and query[1] > booked_start
+                for booked_start, booked_end in intervals
+            )
+            assert index.overlaps(*query) is expected
+
+
+def test_day_availability_tracks_doctors_and_exclusions():
+    bookings = [
+        Booking(_minutes(0), _minutes(30), doctor_id=1, appointment_id=10),
+        Booking(_minutes(60), _minutes(90), doctor_id=2, appointment_id=11),
+        Booking(_minutes(120), _minutes(150), doctor_id=None, appointment_id=12),
+    ]
+    availability = DayAvailability(bookings)
+
+    assert availability.has_conflict(_minutes(15), _minutes(45))
+    assert availability.has_conflict(_minutes(120), _minutes(130))
+    assert not availability.has_conflict(_minutes(60), _minutes(90), doctor_id=1)
+    assert availability.has_conflict(_minutes(60), _minutes(90), doctor_id=2)
+    assert not availability.has_conflict(_minutes(0), _minutes(30), doctor_id=3)
+
+    excluded = DayAvailability(bookings, exclude_appointment_id=10)
+    assert not excluded.has_conflict(_minutes(0), _minutes(30), doctor_id=1)
+    assert excluded.free_starts(
+        [_minutes(0), _minutes(60), _minutes(120)], timedelta(minutes=30)
+    ) == [_minutes(0)]
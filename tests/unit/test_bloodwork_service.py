@@ -0,0 +1,243 @@
+"""Tests for bloodwork service."""
+
+from __future__ import annotations
+
+import json
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from app.db.repositories.bloodwork_marker_repository import BloodworkMarkerRepository
+from app.models.bloodwork import Bloodwork
+from app.models.bloodwork_marker import BloodworkMarker
+from app.services.bloodwork_service import (
+    NORMALIZED_FORMAT_VERSION,
+    PANEL_REGISTRY,
+    PANEL_TEMPLATES,
+    BloodworkService,
+    PanelRegistry,
+    ReferenceRange,
+)
+from app.services.marker_status import MarkerColumns, classify_markers
+
+EDGE_CASE_MARKERS = [
+    {"value": 5, "reference_range": {"low": 1, "high": 10}},
+    {"value": 0.5, "reference_range": {"low": 1, "high": 10}},
+    {"value": "11", "reference_range": {"low": "1", "high": "10"}},
+    {"value": 2, "reference_range": {"low": 1, "optimal_low": 3, "high": 10}},
+    {"value": 9, "reference_range": {"low": 1, "optimal_high": 8, "high": 10}},
+    {"value": 0, "reference_range": {"low": 1, "optimal_low": None, "high": 10}},
+    {"value": 2, "reference_range": {"low": 1, "optimal_low": None, "high": 10}},
+    {"value": 2, "reference_range": {"low": 1, "optimal_low": "x", "high": 10}},
+    {"value": "abc", "reference_range": {"low": 1, "high": 10}},
+    {"value": None, "reference_range": {"low": 1, "high": 10}},
+    {"value": 5, "reference_range": {"low": 1}},
+    {"value": 5, "reference_range": {}},
+    {"value": 5},
+    {"value": "nan", "reference_range": {"low": 1, "high": 10}},
+    {"value": 5, "status": "HIGH", "reference_range": {"low": 1, "high": 10}},
+    {"value": 5, "status": "", "reference_range": {"low": 1, "high": 10}},
+    {"value": 50, "status": "Reviewed", "reference_range": {"low": 1, "high": 10}},
+]
+
+
+def test_registry_indexes_every_panel_and_marker():
+    assert len(PANEL_REGISTRY.panels) == len(PANEL_TEMPLATES)
+    vitals = PANEL_REGISTRY.get("vitals")
+    assert PANEL_REGISTRY.get_by_name(vitals["name"]) is vitals
+    assert PANEL_REGISTRY.markers["bmi"]["unit"] == "kg/m^2"
+    assert PANEL_REGISTRY.reference_ranges["bmi"] == ReferenceRange(
+        low=18.5, high=24.9, optimal_low=18.5, optimal_high=24.9
+    )
+    assert "height" not in PANEL_REGISTRY.reference_ranges
+    assert PANEL_REGISTRY.panel_marker_keys["vitals"][0] == "height"
+
+
+def test_registry_is_immutable():
+    panel = PANEL_REGISTRY.get("vitals")
+    with pytest.raises(TypeError):
+        panel["name"] = "Changed"  # type: ignore[index]
+    with pytest.raises(TypeError):
+        panel["markers"][0]["unit"] = "m"  # type: ignore[index]
+
+
+def test_registry_rejects_unknown_and_duplicate_keys():
+    with pytest.raises(ValueError):
+        PANEL_REGISTRY.get("missing")
+    panel = {"key": "a", "name": "A", "markers": [{"key": "x", "name": "X"}]}
+    with pytest.raises(ValueError):
+        PanelRegistry.build([panel, {**panel, "name": "B"}])
+
+
+def test_build_panel_results_is_json_serializable():
+    service = BloodworkService(db=None)  # type: ignore[arg-type]
+    panel = service.get_panel_template("vitals")
+
+    results = service.build_panel_results(panel, {"bmi": 22.0, "height": ""})
+
+    markers = results["categories"][0]["markers"]
+    assert [marker["name"] for marker in markers] == ["BMI"]
+    json.dumps(results)
+
+
+def test_batch_classifier_matches_scalar_on_edge_cases():
+    service = BloodworkService(db=None)  # type: ignore[arg-type]
+
+    expected = [service.get_marker_status(marker) for marker in EDGE_CASE_MARKERS]
+
+    assert service.get_marker_statuses(EDGE_CASE_MARKERS) == expected
+
+
+def test_batch_classifier_matches_scalar_on_random_markers():
+    service = BloodworkService(db=None)  # type: ignore[arg-type]
+    rng = random.Random(7)
+    markers = []
+    for _ in range(2000):
+        low = rng.uniform(0, 50)
+        high = low + rng.uniform(0, 50)
+        markers.append(
+            {
+                "value": rng.uniform(-10, 110),
+                "reference_range": {
+                    "low": low,
+                    "optimal_low": low + rng.uniform(0, 5),
+                    "optimal_high": high - rng.uniform(0, 5),
+                    "high": high,
+                },
+            }
+        )
+    groups = [index % 7 for index in range(len(markers))]
+
+    result = classify_markers(MarkerColumns.from_markers(markers, groups))
+
+    expected = [service.get_marker_status(marker) for marker in markers]
+    assert result.statuses == expected
+    for group in range(7):
+        statuses = expected[group::7]
+        assert result.totals[group] == len(statuses)
+        assert result.out_of_range_counts[group] == sum(
+            status in {"low", "high", "critical"} for status in statuses
+        )
+
+
+def test_summarize_history_keys_by_bloodwork_and_category():
+    service = BloodworkService(db=None)  # type: ignore[arg-type]
+    normalized = {
+        11: {"categories": [{"markers": EDGE_CASE_MARKERS[:4]}, {"markers": []}]},
+        12: {"categories": [{"markers": EDGE_CASE_MARKERS}]},
+    }
+
+    summaries = service.summarize_history(normalized)
+
+    assert summaries[(11, 0)] == service.summarize_category(
+        {"markers": EDGE_CASE_MARKERS[:4]}
+    )
+    assert summaries[(11, 0)].out_of_range == 3
+    assert summaries[(11, 1)].total == 0
+    assert summaries[(12, 0)].total == len(EDGE_CASE_MARKERS) - 1
+
+
+def test_draft_and_publish_store_normalized_payload(test_db, test_patient, test_doctor):
+    service = BloodworkService(test_db)
+
+    draft = service.create_draft_result(
+        patient_id=test_patient.id,
+        panel_key="vitals",
+        test_date=date.today(),
+        values={"bmi": 30.0, "height": 180},
+    )
+
+    assert draft.normalized_version == NORMALIZED_FORMAT_VERSION
+    assert draft.normalized["summary"] == {"total": 2, "out_of_range": 1}
+    category = draft.normalized["categories"][0]
+    assert [marker["status"] for marker in category["markers"]] == [
+        "unknown",
+        "critical",
+    ]
+    assert service.get_summary(category).out_of_range == 1
+
+    published = service.publish_result(draft.id, test_doctor.id, "Dr Sig", None)
+    assert published.normalized["summary"]["total"] == 2
+
+
+def test_marker_rows_follow_draft_and_publish(test_db, test_patient, test_doctor):
+    service = BloodworkService(test_db)
+    markers = BloodworkMarkerRepository(test_db)
+    draft = service.create_draft_result(
+        patient_id=test_patient.id,
+        panel_key="vitals",
+        test_date=date(2024, 5, 1),
+        values={"bmi": 30.0, "height": 180},
+    )
+
+    rows = (
+        test_db.query(BloodworkMarker)
+        .filter(BloodworkMarker.bloodwork_id == draft.id)
+        .order_by(BloodworkMarker.marker_key)
+        .all()
+    )
+    assert [(row.marker_key, row.value, row.status) for row in rows] == [
+        ("bmi", 30.0, "critical"),
+        ("height", 180.0, "unknown"),
+    ]
+    assert {row.test_date for row in rows} == {date(2024, 5, 1)}
+    assert markers.count_out_of_range_by_marker(test_patient.id) == {}
+
+    service.publish_result(draft.id, test_doctor.id, "Dr Sig", None)
+
+    assert (
+        test_db.query(BloodworkMarker)
+        .filter(BloodworkMarker.bloodwork_id == draft.id)
+        .count()
+        == 2
+    )
+    assert markers.count_out_of_range_by_marker(test_patient.id) == {"bmi": 1}
+
+
+def test_published_results_rebuild_stale_payloads(test_db, test_patient):
+    bloodwork = Bloodwork(
+        patient_id=test_patient.id,
+        test_type="Legacy",
+        test_date=date.today(),
+        results={"Glucose": 12.0, "Sodium": ""},
+        reference_ranges={"Glucose": "4-7"},
+        is_published=True,
+    )
+    test_db.add(bloodwork)
+    test_db.commit()
+    assert bloodwork.normalized_version is None
+
+    service = BloodworkService(test_db)
+    [result] = service.get_published_results(test_patient.id)
+
+    assert result.normalized_version == NORMALIZED_FORMAT_VERSION
+    assert result.normalized["test_name"] == "Legacy"
+    assert result.normalized["summary"] == {"total": 1, "out_of_range": 1}
+
+
+def test_marker_series_is_filtered_and_downsampled(test_db, test_patient, test_doctor):
+    service = BloodworkService(test_db)
+    start = date(2015, 1, 1)
+    for offset in range(30):
+        draft = service.create_draft_result(
+            patient_id=test_patient.id,
+            panel_key="vitals",
+            test_date=start + timedelta(days=90 * offset),
+            values={"bmi": 20.0 + offset},
+        )
+        if offset != 29:
+            service.publish_result(draft.id, test_doctor.id, "Dr Sig", None)
+
+    full = service.get_marker_series(test_patient.id, "bmi")
+    assert len(full) == 29
+    assert [point.value for point in full] == [20.0 + offset for offset in range(29)]
+
+    window = service.get_marker_series(
+        test_patient.id, "bmi", date_from=start + timedelta(days=900)
+    )
+    assert window[0].value == 30.0
+
+    sampled = service.get_marker_series(test_patient.id, "bmi", max_points=8)
+    assert len(sampled) == 8
+    assert sampled[0] == full[0] and sampled[-1] == full[-1]
@@ -0,0 +1,110 @@
+"""Tests for the TTL cache and dashboard cache invalidation."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, timezone
+
+from app.services.appointment_service import AppointmentService
+from app.services.patient_service import PatientService
+from app.utils.cache import TTLCache, patient_dashboard_cache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache: TTLCache[str] = TTLCache(max_entries=4, ttl_seconds=30, clock=clock)
+    cache.set("a", "value")
+
+    clock.now = 29.9
+    assert cache.get("a") == "value"
+    clock.now = 30.0
+    assert cache.get("a") is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 0)
+    assert stats.hit_ratio == 0.5
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache: TTLCache[int] = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats().evictions == 1
+
+
+def test_get_or_load_only_calls_loader_on_miss():
+    cache: TTLCache[int] = TTLCache(max_entries=2, ttl_seconds=60)
+    calls: list[int] = []
+
+    def loader() -> int:
+        calls.append(1)
+        return 42
+
+    assert cache.get_or_load("k", loader) == 42
+    assert cache.get_or_load("k", loader) == 42
+    assert len(calls) == 1
+
+    cache.invalidate("k")
+    assert cache.get_or_load("k", loader) == 42
+    assert len(calls) == 2
+    assert cache.stats().invalidations == 1
+
+
+def test_booking_invalidates_patient_dashboard(test_db, test_patient, test_user):
+    service = PatientService(test_db)
+    before = service.get_dashboard_overview(test_patient.id)
+    assert before.stats.upcoming_appointments == 0
+    assert patient_dashboard_cache.stats().size == 1
+
+    scheduled = datetime.combine(
+        date.today() + timedelta(days=2), time(10, 0), tzinfo=timezone.utc
+    )
+    AppointmentService(test_db).create_appointment(
+        patient_id=test_patient.id,
+        scheduled_datetime=scheduled,
+        duration_minutes=30,
+        reason="Checkup",
+        created_by_user_id=test_user.id,
+    )
+
+    after = service.get_dashboard_overview(test_patient.id)
+    assert after.stats.upcoming_appointments == 1
+    assert after.next_appointment is not None
+
+
+def test_load_overlapping_an_invalidation_is_not_stored():
+    cache: TTLCache[str] = TTLCache(max_entries=2, ttl_seconds=60)
+
+    def stale_loader() -> str:
+        # The write that invalidates the key lands while the load is running.
+        cache.invalidate("k")
+        return "stale"
+
+    assert cache.get_or_load("k", stale_loader) == "stale"
+    assert cache.get("k") is None
+    assert cache.get_or_load("k", lambda: "fresh") == "fresh"
+    assert cache.get("k") == "fresh"
+
+
+def test_invalidating_another_key_keeps_the_load():
+    cache: TTLCache[str] = TTLCache(max_entries=2, ttl_seconds=60)
+
+    def loader() -> str:
+        cache.invalidate("other")
+        return "value"
+
+    assert cache.get_or_load("k", loader) == "value"
+    assert cache.get("k") == "value"
@@ -0,0 +1,85 @@
+"""Tests for primary/replica session routing."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from sqlalchemy import create_engine, text, update
+
+from app.db.routing import (
+    PRIMARY_UNTIL_KEY,
+    RoutingSession,
+    read_only,
+    replica_reads,
+)
+from app.models.notification import Notification
+
+
+@pytest.fixture
+def replica_engine():
+    engine = create_engine("sqlite:///:memory:", future=True)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def routing_db(test_engine, replica_engine):
+    db = RoutingSession(
+        bind=test_engine, replica_bind=replica_engine, sticky_seconds=30
+    )
+    yield db
+    db.close()
+
+
+def test_reads_use_primary_outside_read_only_block(routing_db, test_engine):
+    assert routing_db.get_bind() is test_engine
+
+
+def test_read_only_block_uses_replica(routing_db, replica_engine):
+    with replica_reads(routing_db):
+        assert routing_db.get_bind() is replica_engine
+    assert routing_db.get_bind() is not replica_engine
+
+
+def test_read_only_decorator_routes_repository_method(routing_db, replica_engine):
+    class _Repo:
+        def __init__(self, db):
+            self.db = db
+
+        @read_only
+        def current_bind(self):
+            return self.db.get_bind()
+
+    assert _Repo(routing_db).current_bind() is replica_engine
+
+
+def test_pending_writes_keep_reads_on_primary(routing_db, test_engine):
+    routing_db.execute(update(Notification).where(Notification.id == -1))
+    with replica_reads(routing_db):
+        assert routing_db.get_bind() is test_engine
+
+
+def test_commit_pins_reads_to_primary(routing_db, test_engine, replica_engine):
+    routing_db.execute(update(Notification).where(Notification.id == -1))
+    routing_db.commit()
+    assert routing_db.info[PRIMARY_UNTIL_KEY] > time.time()
+    with replica_reads(routing_db):
+        assert routing_db.get_bind() is test_engine
+
+    routing_db.info[PRIMARY_UNTIL_KEY] = time.time() - 1
+    with replica_reads(routing_db):
+        assert routing_db.get_bind() is replica_engine
+
+
+def test_read_only_commit_does_not_pin(routing_db):
+    routing_db.execute(text("SELECT 1"))
+    routing_db.commit()
+    assert PRIMARY_UNTIL_KEY not in routing_db.info
+
+
+def test_without_replica_everything_uses_primary(test_engine):
+    db = RoutingSession(bind=test_engine)
+    with replica_reads(db):
+        assert db.get_bind() is test_engine
+    db.close()
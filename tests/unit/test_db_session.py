@@ -1,9 +1,18 @@
 """Tests for database session utilities."""
 
 import pytest
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
+from app.config import Settings
+from app.db.session import (
+    InstrumentedQueuePool,
+    PoolMetrics,
+    _engine_options,
+    get_db,
+    get_pool_metrics,
+    session_scope,
+)
 
 
 def test_get_db_yields_session():
@@ -18,3 +27,52 @@ def test_get_db_handles_exception():
     next(db_gen)
     with pytest.raises(RuntimeError):
         db_gen.throw(RuntimeError("rollback"))
+
+
+def test_session_scope_reuses_session_when_nested():
+    with session_scope() as outer:
+        with session_scope() as inner:
+            assert inner is outer
+    with session_scope() as fresh:
+        assert fresh is not outer
+
+
+def test_session_scope_closes_on_error():
+    with pytest.raises(RuntimeError):
+        with session_scope() as db:
+            db.execute(text("SELECT 1"))
+            raise RuntimeError("boom")
+    with session_scope() as db:
+        assert db.execute(text("SELECT 1")).scalar() == 1
+
+
+def test_pool_metrics_count_checkouts():
+    before = get_pool_metrics().checkouts
+    with session_scope() as db:
+        db.execute(text("SELECT 1"))
+    metrics = get_pool_metrics()
+    assert metrics.checkouts == before + 1
+    assert metrics.checked_out == 0
+
+
+def test_pool_metrics_record_wait():
+    metrics = PoolMetrics()
+    metrics.record_wait(0.25)
+    metrics.record_wait(0.5, timed_out=True)
+    assert metrics.wait_count == 2
+    assert metrics.wait_seconds_max == 0.5
+    assert metrics.timeouts == 1
+
+
+def test_engine_options_for_postgres():
+    config = Settings(
+        DATABASE_URL="postgresql://u:p@localhost/db",
+        SECRET_KEY="x",
+        DB_POOL_SIZE=8,
+        DB_STATEMENT_TIMEOUT_MS=5000,
+    )
+    options = _engine_options(config.DATABASE_URL, config)
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert options["pool_size"] == 8
+    assert options["connect_args"] == {"options": "-c statement_timeout=5000"}
+    assert _engine_options("sqlite:///:memory:", config) == {}
@@ -0,0 +1,25 @@
+"""Tests for downsampling helpers."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from app.utils.downsampling import lttb_indices
+
+
+def test_lttb_keeps_everything_below_threshold():
+    assert lttb_indices([1, 2, 3], [1, 2, 3], 10).tolist() == [0, 1, 2]
+
+
+def test_lttb_keeps_endpoints_and_peaks():
+    x = np.arange(1000)
+    y = np.zeros(1000)
+    y[437] = 50.0
+    y[811] = -30.0
+
+    kept = lttb_indices(x, y, 20)
+
+    assert len(kept) == 20
+    assert kept[0] == 0 and kept[-1] == 999
+    assert 437 in kept and 811 in kept
+    assert np.all(np.diff(kept) > 0)
@@ -0,0 +1,169 @@
+"""Tests for notification service."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import event
+
+from app.models import Patient, User
+from app.models.notification import Notification
+from app.services.notification_service import (
+    NotificationService,
+    NotificationTemplate,
+    PatientFilter,
+)
+from app.utils.constants import NotificationType, UserRole
+from app.utils.pagination import encode_cursor
+
+
+def _notification(patient_id: int, **values) -> Notification:
+    return Notification(
+        patient_id=patient_id,
+        type=NotificationType.GENERAL,
+        title="Notice",
+        message="Hello",
+        is_read=False,
+        **values,
+    )
+
+
+def _patient_like(patient: Patient, **changes) -> Patient:
+    columns = {
+        column.key: getattr(patient, column.key)
+        for column in Patient.__table__.columns
+        if column.key not in {"id", "created_at", "updated_at"}
+    }
+    return Patient(**{**columns, **changes})
+
+
+def test_mark_as_read_is_one_scoped_update(test_db, test_engine, test_patient):
+    notification = _notification(test_patient.id)
+    test_db.add(notification)
+    test_db.commit()
+    notification_id, patient_id = notification.id, test_patient.id
+    service = NotificationService(test_db)
+    statements: list[str] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", capture)
+    try:
+        assert service.mark_as_read(notification_id, patient_id + 1) is False
+        assert service.mark_as_read(notification_id, patient_id) is True
+        assert service.mark_as_read(notification_id, patient_id) is False
+    finally:
+        event.remove(test_engine, "before_cursor_execute", capture)
+
+    # Only the update that changed a row also decrements the unread counter.
+    assert len(statements) == 4
+    assert sum(s.startswith("UPDATE notifications") for s in statements) == 3
+    assert sum(s.startswith("UPDATE patient_unread_counters") for s in statements) == 1
+    [item] = service.get_notifications(patient_id)
+    assert item.is_read is True
+
+
+def test_feed_pages_and_polls_only_changes(test_db, test_patient):
+    patient_id = test_patient.id
+    test_db.add_all([_notification(patient_id) for _ in range(5)])
+    test_db.commit()
+    service = NotificationService(test_db)
+
+    feed = service.get_feed(patient_id, page_size=3)
+    older = service.get_feed(patient_id, page_size=3, cursor=feed.next_cursor)
+
+    assert len(feed.items) == 3 and feed.next_cursor is not None
+    assert {item.id for item in feed.items}.isdisjoint(item.id for item in older.items)
+    assert feed.unread_count == 5
+
+    # Pretend the previous poll ran a minute ago, past the overlap window.
+    stale = encode_cursor((datetime.now(timezone.utc) - timedelta(minutes=1), 0))
+    # Rows inside the overlap window are resent; past it a quiet poll is empty
+    # and keeps its cursor.
+    assert len(service.get_since(patient_id, feed.since_cursor).items) == 5
+    ahead = encode_cursor((datetime.now(timezone.utc) + timedelta(minutes=1), 0))
+    quiet = service.get_since(patient_id, ahead)
+    assert quiet.items == [] and quiet.unread_count is None
+    assert quiet.since_cursor == ahead
+
+    target = feed.items[0].id
+    service.mark_as_read(target, patient_id)
+    test_db.add(_notification(patient_id))
+    test_db.commit()
+
+    changes = service.get_since(patient_id, stale)
+    assert target in {item.id for item in changes.items}
+    assert len(changes.items) == 6
+    assert changes.unread_count == 5
+
+    service.SINCE_LIMIT = 2
+    assert service.get_since(patient_id, stale).truncated is True
+
+
+def test_poll_returns_change_that_was_not_visible_yet(test_db, test_patient):
+    patient_id = test_patient.id
+    seen_at = datetime.now(timezone.utc) - timedelta(hours=1)
+    test_db.add(_notification(patient_id, updated_at=seen_at))
+    test_db.commit()
+    service = NotificationService(test_db)
+
+    cursor = service.get_feed(patient_id).since_cursor
+    first = service.get_since(patient_id, cursor)
+    assert len(first.items) == 1
+
+    # A change stamped just after the cursor, e.g. a long transaction or one
+    # still replicating, only becomes visible after that poll ran.
+    late = _notification(patient_id, updated_at=seen_at + timedelta(seconds=1))
+    test_db.add(late)
+    test_db.commit()
+
+    second = service.get_since(patient_id, first.since_cursor)
+    assert late.id in {item.id for item in second.items}
+
+
+def test_broadcast_notifies_matching_patients_in_chunks(
+    test_db, test_engine, test_patient, test_doctor
+):
+    for is_active in (True, True, False):
+        user = User(
+            email=f"{uuid.uuid4()}@example.com",
+            hashed_password="x",
+            role=UserRole.PATIENT,
+            is_active=is_active,
+        )
+        test_db.add(user)
+        test_db.flush()
+        nhs_number = str(uuid.uuid4().int)[:10]
+        test_db.add(_patient_like(test_patient, user_id=user.id, nhs_number=nhs_number))
+    test_db.commit()
+    doctor_id = test_doctor.id
+    service = NotificationService(test_db)
+    template = NotificationTemplate(
+        type=NotificationType.GENERAL, title="Clinic closed", message="Bank holiday"
+    )
+    inserts: list[str] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO notifications"):
+            inserts.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", capture)
+    try:
+        sent = service.broadcast(PatientFilter(doctor_id=doctor_id), template, 2)
+    finally:
+        event.remove(test_engine, "before_cursor_execute", capture)
+
+    assert sent == 3
+    assert len(inserts) == 2
+    recipients = (
+        test_db.query(Notification.patient_id)
+        .join(Patient)
+        .filter(Patient.doctor_id == doctor_id, Notification.title == "Clinic closed")
+        .all()
+    )
+    assert len(recipients) == 3
+    assert service.get_feed(test_patient.id).unread_count == 1
+    everyone = PatientFilter(doctor_id=doctor_id, active_only=False)
+    assert service.broadcast(everyone, template) == 4
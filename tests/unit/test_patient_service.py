@@ -0,0 +1,139 @@
+"""Tests for patient service."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+from sqlalchemy import event
+
+from app.models.appointment import Appointment
+from app.models.bloodwork import Bloodwork
+from app.models.notification import Notification
+from app.models.prescription import Prescription
+from app.services.notification_service import NotificationService
+from app.services.patient_service import PatientService, PatientSummary
+from app.utils.constants import AppointmentStatus, BookingSource, NotificationType
+
+
+def _count_statements(engine):
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    return statements, lambda: event.remove(engine, "before_cursor_execute", _record)
+
+
+def test_dashboard_overview_matches_individual_queries(
+    test_db, test_engine, test_patient, test_doctor, test_user
+):
+    soon = datetime.combine(
+        date.today() + timedelta(days=3), time(9, 0), tzinfo=timezone.utc
+    )
+    later = soon + timedelta(days=7)
+    test_db.add_all(
+        [
+            Appointment(
+                patient_id=test_patient.id,
+                doctor_id=test_doctor.id,
+                scheduled_datetime=later,
+                duration_minutes=30,
+                status=AppointmentStatus.SCHEDULED,
+                booking_source=BookingSource.ONLINE,
+                reason="Later",
+                created_by=test_user.id,
+            ),
+            Appointment(
+                patient_id=test_patient.id,
+                doctor_id=None,
+                scheduled_datetime=soon,
+                duration_minutes=30,
+                status=AppointmentStatus.PENDING,
+                booking_source=BookingSource.ONLINE,
+                reason="Soon",
+                created_by=test_user.id,
+            ),
+            Prescription(
+                patient_id=test_patient.id,
+                medication_name="Metformin",
+                dosage="500mg",
+                frequency="Twice daily",
+                start_date=date.today(),
+                is_active=True,
+                prescribed_by=test_doctor.id,
+            ),
+            Bloodwork(
+                patient_id=test_patient.id,
+                test_type="Panel",
+                test_date=date.today(),
+                results={},
+                reference_ranges={},
+                is_published=False,
+            ),
+            Notification(
+                patient_id=test_patient.id,
+                type=NotificationType.GENERAL,
+                title="Hello",
+                message="Welcome",
+                is_read=False,
+            ),
+        ]
+    )
+    test_db.commit()
+    patient_id = test_patient.id
+
+    service = PatientService(test_db)
+    statements, stop = _count_statements(test_engine)
+    overview = service.get_dashboard_overview(patient_id)
+    stop()
+
+    assert len(statements) == 1
+    repo = service.patient_repo
+    assert overview.stats.upcoming_appointments == (
+        service.appointment_repo.count_upcoming_appointments(patient_id)
+    )
+    assert overview.stats.active_prescriptions == (
+        repo.get_active_prescriptions_count(patient_id)
+    )
+    assert overview.stats.pending_results == repo.get_pending_results_count(patient_id)
+    assert overview.stats.unread_notifications == (
+        repo.get_unread_notifications_count(patient_id)
+    )
+    assert overview.next_appointment is not None
+    assert overview.next_appointment.reason == "Soon"
+    assert overview.next_appointment.is_pending is True
+
+
+def test_dashboard_overview_unknown_patient(test_db):
+    overview = PatientService(test_db).get_dashboard_overview(-1)
+    assert overview.stats.upcoming_appointments == 0
+    assert overview.next_appointment is None
+
+
+def test_page_read_models_are_detached_slotted_values(test_db, test_patient, test_user):
+    test_db.add(
+        Notification(
+            patient_id=test_patient.id,
+            type=NotificationType.RESULTS_READY,
+            title="Results",
+            message="Your results are ready.",
+            is_read=False,
+        )
+    )
+    test_db.commit()
+    patient_id = test_patient.id
+
+    summary = PatientService(test_db).get_patient_summary(test_user.id)
+    [item] = NotificationService(test_db).get_notifications(patient_id)
+    test_db.close()
+
+    assert summary == PatientSummary(
+        id=patient_id, first_name="Test", last_name="Patient"
+    )
+    assert item.type == NotificationType.RESULTS_READY
+    assert item.title == "Results" and item.is_read is False
+    assert not hasattr(item, "__dict__")
+    with pytest.raises(AttributeError):
+        item.is_read = True  # type: ignore[misc]
@@ -0,0 +1,99 @@
+"""Tests for materialized unread counters."""
+
+from __future__ import annotations
+
+from sqlalchemy import update
+
+from app.db.repositories.doctor_message_repository import DoctorMessageRepository
+from app.db.repositories.notification_repository import NotificationRepository
+from app.db.repositories.unread_counter_repository import UnreadCounterRepository
+from app.models.notification import Notification
+from app.services.doctor_service import DoctorService
+from app.services.patient_service import PatientService
+from app.utils.constants import NotificationType
+
+
+def _notification(patient_id: int, is_read: bool = False) -> Notification:
+    return Notification(
+        patient_id=patient_id,
+        type=NotificationType.GENERAL,
+        title="Notice",
+        message="Hello",
+        is_read=is_read,
+    )
+
+
+def test_notification_counter_follows_writes(test_db, test_patient):
+    patient_id = test_patient.id
+    counters = UnreadCounterRepository(test_db)
+    repo = NotificationRepository(test_db)
+    notifications = [_notification(patient_id) for _ in range(3)]
+    test_db.add_all([*notifications, _notification(patient_id, is_read=True)])
+    test_db.commit()
+    assert counters.get_patient_unread_notifications(patient_id) == 3
+
+    assert repo.mark_as_read(notifications[0].id, patient_id) is True
+    assert repo.mark_as_read(notifications[0].id, patient_id) is False
+    assert counters.get_patient_unread_notifications(patient_id) == 2
+
+    test_db.delete(notifications[1])
+    test_db.commit()
+    assert counters.get_patient_unread_notifications(patient_id) == 1
+
+    notifications[0].is_read = False
+    test_db.commit()
+    assert repo.count_unread(patient_id) == 2
+
+    assert repo.mark_all_as_read(patient_id) == 2
+    assert repo.count_unread(patient_id) == 0
+    stats = PatientService(test_db).get_dashboard_stats(patient_id)
+    assert stats.unread_notifications == 0
+
+
+def test_doctor_message_counter_and_dashboard(test_db, test_doctor):
+    repo = DoctorMessageRepository(test_db)
+    first = repo.create(test_doctor.id, "Rota", "Please confirm")
+    repo.create(test_doctor.id, "Audit", "Reminder")
+    stats = DoctorService(test_db)._load_dashboard_stats(test_doctor.id)
+    assert stats.unread_messages == 2
+
+    repo.mark_as_read(first.id)
+    assert (
+        UnreadCounterRepository(test_db).get_doctor_unread_messages(test_doctor.id) == 1
+    )
+    assert repo.mark_all_as_read(test_doctor.id) == 1
+    assert (
+        UnreadCounterRepository(test_db).get_doctor_unread_messages(test_doctor.id) == 0
+    )
+
+
+def test_rebuild_repairs_drifted_counters(test_db, test_patient):
+    patient_id = test_patient.id
+    test_db.add_all([_notification(patient_id) for _ in range(4)])
+    test_db.commit()
+    # A bulk statement bypasses the counter bookkeeping.
+    test_db.execute(
+        update(Notification)
+        .where(Notification.patient_id == patient_id)
+        .values(is_read=True)
+    )
+    test_db.commit()
+    counters = UnreadCounterRepository(test_db)
+    assert counters.get_patient_unread_notifications(patient_id) == 4
+
+    counters.rebuild()
+
+    assert counters.get_patient_unread_notifications(patient_id) == 0
+
+
+def test_bulk_notifications_count_repeated_patients(test_db, test_patient):
+    patient_id = test_patient.id
+    test_db.add(_notification(patient_id))
+    test_db.commit()
+    counters = UnreadCounterRepository(test_db)
+    repo = NotificationRepository(test_db)
+
+    values = {"type": NotificationType.GENERAL, "title": "Notice", "message": "Hi"}
+    assert repo.create_for_patients([patient_id, patient_id, patient_id], values) == 3
+
+    assert counters.get_patient_unread_notifications(patient_id) == 4